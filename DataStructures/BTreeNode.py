@@ -1,7 +1,3 @@
-from matplotlib import pyplot as plt
-import networkx as nx
-import seaborn as sns
-
 class BTreeNode(object):
     '''
     This class creates the node object for the BTree data structure
@@ -510,6 +506,10 @@ class BTreeNode(object):
         This method generates a visualization for the graph starting at this root node
         '''
 
+        import networkx as nx
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         options = {"node_size": 800, "alpha": 1, "font_color":"whitesmoke", "font_size":12}
         bright_palette = sns.hls_palette(h=.5)
         directional_graph = nx.DiGraph()
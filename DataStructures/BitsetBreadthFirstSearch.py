@@ -0,0 +1,165 @@
+import numpy as np
+
+def getIncomingEdgeArrays(compressed_graph):
+    '''
+    This function returns the incoming edges of every node, along with each edge's position in the compressed sparse row targets
+
+    The arrays are built once with a stable sort of the targets and kept on the graph, as the graph does not change once it is built
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph whose edges are being reversed
+
+    Returns :
+        incoming_offsets : ndarray
+            Where each node's incoming edges start, with one extra entry at the end
+        incoming_sources : ndarray
+            The node each incoming edge comes from
+        incoming_positions : ndarray
+            The position of each incoming edge in the graph's targets
+    '''
+
+    if compressed_graph.incoming_edge_arrays == None:
+        number_of_nodes = compressed_graph.number_of_nodes
+        offsets = np.frombuffer(compressed_graph.offsets, dtype=np.int64)
+        targets = np.frombuffer(compressed_graph.targets, dtype=np.int64)
+
+        incoming_positions = np.argsort(targets, kind="stable")
+        incoming_sources = np.repeat(np.arange(number_of_nodes, dtype=np.int64), np.diff(offsets))[incoming_positions]
+        incoming_offsets = np.zeros(number_of_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(targets, minlength=number_of_nodes), out=incoming_offsets[1:])
+
+        compressed_graph.incoming_edge_arrays = (incoming_offsets, incoming_sources, incoming_positions)
+
+    return compressed_graph.incoming_edge_arrays
+
+def getRowPositions(offsets, nodes):
+    '''
+    This function gathers the positions of every entry in the rows of several nodes, in row order, without a python loop
+
+    Parameters :
+        offsets : ndarray
+            The offsets of the rows
+        nodes : ndarray
+            The nodes whose rows are gathered
+
+    Returns :
+        positions : ndarray
+            The position of every entry in the rows
+        row_lengths : ndarray
+            The number of entries in each node's row
+    '''
+
+    row_starts = offsets[nodes]
+    row_lengths = offsets[nodes + 1] - row_starts
+    entry_count = int(row_lengths.sum())
+    positions = np.arange(entry_count, dtype=np.int64) + np.repeat(row_starts - (np.cumsum(row_lengths) - row_lengths), row_lengths)
+    return positions, row_lengths
+
+def findBreadthFirstLevels(compressed_graph, start_node_index, alpha=2, beta=24):
+    '''
+    This function performs a direction optimizing breadth first search, keeping the visited nodes and the frontier as numpy boolean arrays
+
+    Each level is expanded either top down, by gathering every edge leaving the frontier, or bottom up, by gathering every edge entering
+    the unvisited nodes and keeping those which come from the frontier, following Beamer's heuristic:
+    the search turns bottom up once the frontier's edges outnumber the unexplored edges divided by alpha,
+    and back to top down once the frontier holds fewer than the number of nodes divided by beta
+    Unlike Beamer's bottom up step, which stops checking a node once any parent is found, the vectorized step gathers every incoming edge
+    of the unvisited nodes to find the first parent, so it only pays off later than Beamer's alpha of 14 suggests
+
+    Either way each new node is given the key (rank of its parent in the frontier, position of the edge in the parent's row) of its
+    first discovery, so sorting by the key gives the same parents and discovery order as a queue based breadth first search
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being searched
+        start_node_index : int
+            The node the search starts at
+        alpha : float, optional
+            How many times the frontier's edges must be outnumbered by the unexplored edges to stay top down (default is 2)
+        beta : float, optional
+            How many times the frontier must be outnumbered by the nodes to return to top down (default is 24)
+
+    Returns :
+        parents : ndarray
+            The int64 parent of each node (-1 for the start node and the nodes which can not be reached)
+        levels : ndarray
+            The int64 number of edges from the start node to each node (-1 for the nodes which can not be reached)
+        discovery_order : ndarray
+            The reached nodes in the order a queue based breadth first search discovers them
+        step_directions : [str]
+            Whether each frontier was expanded "Top Down" or "Bottom Up", including the last frontier which finds no new nodes
+    '''
+
+    number_of_nodes = compressed_graph.number_of_nodes
+    offsets = np.frombuffer(compressed_graph.offsets, dtype=np.int64)
+    targets = np.frombuffer(compressed_graph.targets, dtype=np.int64)
+    row_lengths = np.diff(offsets)
+    key_base = len(targets) + 1
+    # a bottom up step checks the edges entering the unvisited nodes, which are the same as the edges leaving them unless the graph is directed
+    incoming_counts = np.bincount(targets, minlength=number_of_nodes) if compressed_graph.is_directed else row_lengths
+
+    is_visited = np.zeros(number_of_nodes, dtype=bool)
+    is_in_frontier = np.zeros(number_of_nodes, dtype=bool)
+    frontier_ranks = np.zeros(number_of_nodes, dtype=np.int64)
+    parents = np.full(number_of_nodes, -1, dtype=np.int64)
+    levels = np.full(number_of_nodes, -1, dtype=np.int64)
+
+    frontier = np.array([start_node_index], dtype=np.int64)
+    is_visited[start_node_index] = True
+    levels[start_node_index] = 0
+    discovered_nodes = [frontier]
+    step_directions = []
+    unexplored_edge_count = len(targets) - int(incoming_counts[start_node_index])
+    is_bottom_up = False
+    level = 0
+
+    while len(frontier) > 0:
+        frontier_edge_count = int(row_lengths[frontier].sum())
+        if not is_bottom_up and frontier_edge_count > unexplored_edge_count / alpha:
+            is_bottom_up = True
+        elif is_bottom_up and len(frontier) < number_of_nodes / beta:
+            is_bottom_up = False
+
+        if is_bottom_up:
+            incoming_offsets, incoming_sources, incoming_positions = getIncomingEdgeArrays(compressed_graph)
+            frontier_ranks[frontier] = np.arange(len(frontier), dtype=np.int64)
+            is_in_frontier[frontier] = True
+
+            unvisited_nodes = np.flatnonzero(~is_visited)
+            positions, unvisited_incoming_counts = getRowPositions(incoming_offsets, unvisited_nodes)
+            sources = incoming_sources[positions]
+            is_from_frontier = is_in_frontier[sources]
+            ends = np.repeat(unvisited_nodes, unvisited_incoming_counts)[is_from_frontier]
+            keys = frontier_ranks[sources[is_from_frontier]] * key_base + incoming_positions[positions[is_from_frontier]]
+
+            is_in_frontier[frontier] = False
+            key_order = np.argsort(keys, kind="stable")
+            ends = ends[key_order]
+            keys = keys[key_order]
+            step_directions.append("Bottom Up")
+        else:
+            positions, frontier_row_lengths = getRowPositions(offsets, frontier)
+            ends = targets[positions]
+            # the edges are gathered in frontier order and then row order, so the keys are already ascending
+            keys = np.repeat(np.arange(len(frontier), dtype=np.int64), frontier_row_lengths) * key_base + positions
+            is_unvisited = ~is_visited[ends]
+            ends = ends[is_unvisited]
+            keys = keys[is_unvisited]
+            step_directions.append("Top Down")
+
+        # the first entry for each node holds its smallest key, and ordering the nodes by it gives the order they are discovered
+        _, first_indices = np.unique(ends, return_index=True)
+        first_indices.sort()
+        new_nodes = ends[first_indices]
+
+        parents[new_nodes] = frontier[keys[first_indices] // key_base]
+        level += 1
+        levels[new_nodes] = level
+        is_visited[new_nodes] = True
+        unexplored_edge_count -= int(incoming_counts[new_nodes].sum())
+
+        discovered_nodes.append(new_nodes)
+        frontier = new_nodes
+
+    return parents, levels, np.concatenate(discovered_nodes), step_directions
@@ -0,0 +1,105 @@
+import random
+import time
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+
+def createPreferentialAttachmentGraph(number_of_nodes, edges_per_node=8, seed=0):
+    '''
+    This function creates an undirected small world graph resembling a social network, where each new node joins nodes chosen in proportion to their degree
+
+    Parameters :
+        number_of_nodes : int
+            The number of nodes in the graph
+        edges_per_node : int, optional
+            The number of edges each new node adds (default is 8)
+        seed : int, optional
+            The seed for the random edges (default is 0)
+
+    Returns :
+        compressed_graph : CompressedSparseRowGraph
+            The preferential attachment graph
+    '''
+
+    randomizer = random.Random(seed)
+    # every edge adds both of its nodes, so choosing uniformly from this list chooses nodes in proportion to their degree
+    edge_nodes = list(range(0, edges_per_node))
+    edges = []
+    for node in range(edges_per_node, number_of_nodes):
+        neighbors = {randomizer.choice(edge_nodes) for _ in range(0, edges_per_node)}
+        for neighbor in neighbors:
+            edges.append((node, neighbor))
+            edge_nodes.append(node)
+            edge_nodes.append(neighbor)
+
+    return CompressedSparseRowGraph(number_of_nodes, edge_tuples=edges, is_directed=False)
+
+def measureDuration(search, repeat_count=3):
+    '''
+    This function measures the fastest of several runs of a search
+
+    Parameters :
+        search : function
+            The function running the search
+        repeat_count : int, optional
+            The number of runs (default is 3)
+
+    Returns :
+        duration : float
+            The number of seconds taken by the fastest run
+    '''
+
+    durations = []
+    for _ in range(0, repeat_count):
+        start = time.perf_counter()
+        search()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+def visitFromNode(compressed_graph, start_node_index):
+    '''
+    This function runs the queue based breadth first visit from a node
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being searched
+        start_node_index : int
+            The node the search starts at
+    '''
+
+    compressed_graph.resetTraversalInformation()
+    compressed_graph.node_visit(start_node_index)
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    node_counts = []
+    edge_counts = []
+    queue_durations = []
+    top_down_durations = []
+    direction_optimizing_durations = []
+    step_directions = []
+
+    for number_of_nodes in [20000, 200000, 1000000]:
+        compressed_graph = createPreferentialAttachmentGraph(number_of_nodes)
+        compressed_graph.breadthFirstSearchUsingBitsets(0)
+
+        node_counts.append(number_of_nodes)
+        edge_counts.append(compressed_graph.getEdgeCount())
+        queue_durations.append(measureDuration(lambda : visitFromNode(compressed_graph, 0)))
+        top_down_durations.append(measureDuration(lambda : compressed_graph.breadthFirstSearchUsingBitsets(0, alpha=0.000001)))
+        direction_optimizing_durations.append(measureDuration(lambda : compressed_graph.breadthFirstSearchUsingBitsets(0)))
+        step_directions.append(" ".join("B" if direction == "Bottom Up" else "T" for direction in compressed_graph.breadth_first_step_directions))
+
+    dictionary = {
+        "Nodes": node_counts,
+        "Edges": edge_counts,
+        "Queue Seconds": queue_durations,
+        "Top Down Bitset Seconds": top_down_durations,
+        "Direction Optimizing Seconds": direction_optimizing_durations,
+        "Steps": step_directions
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    dataframe["Speedup"] = dataframe["Queue Seconds"] / dataframe["Direction Optimizing Seconds"]
+    pd.options.display.width = 200
+    pd.options.display.max_columns = None
+    print(dataframe)
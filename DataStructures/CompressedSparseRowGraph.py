@@ -0,0 +1,1328 @@
+from array import array
+import math
+import mmap as mmap_module
+import struct
+import sys
+from collections import deque
+from contextlib import nullcontext
+import heapq
+
+# the graph file starts with a header of the magic bytes, the format version, the number of nodes, the number of edges, the number of row entries,
+# and whether the graph is directed, weighted and has float weights, followed by the offsets, targets, target weights, edge starts, edge ends
+# and edge weights as little endian int64 (or float64 for float weights) arrays
+GRAPH_FILE_MAGIC = b"CSRGRAPH"
+GRAPH_FILE_VERSION = 1
+GRAPH_FILE_HEADER = struct.Struct("<8s7q")
+
+class CompressedSparseRowGraph():
+    '''
+    This class contains a compact, read only graph stored in compressed sparse row form
+
+    The neighbors of node i are targets[offsets[i]:offsets[i+1]] with the matching weights in target_weights
+    The rows are the only copy of the edges, so a flat list of the edges is built from them when it is needed by getEdgeTuples or getEdgeArrays
+    All of the arrays are python arrays of machine integers or floats rather than lists of objects,
+    or memoryviews of the same values when the graph is loaded from a memory mapped file
+
+    Unlike the Graph, whose adjacency lists keep one entry for each neighbor with the lightest of its repeated edges, the rows keep every repeated edge
+    and self loop. A search never takes the heavier copies of an edge, so the traversal orders and the shortest distances still match the Graph's
+    '''
+
+    def __init__(self, number_of_nodes, edge_tuples=None, is_directed=False, is_weighted=False):
+        '''
+        This method builds the compressed sparse row graph from a list of edges
+
+        Parameters :
+            number_of_nodes : int
+                The number of nodes in the graph
+            edge_tuples : [(int,int)] or [(int,int,int)], optional
+                The edges in the graph, with a weight as the third value if the graph is weighted (default is None)
+            is_directed : Boolean, optional
+                Whether the edges only run from their start node to their end node (default is False)
+            is_weighted : Boolean, optional
+                Whether the edges include a weight (default is False, every edge has a weight of 1)
+        '''
+
+        if edge_tuples == None:
+            edge_tuples = []
+
+        self.number_of_nodes = number_of_nodes
+        self.is_directed = is_directed
+        self.is_weighted = is_weighted
+
+        edge_starts = array('q')
+        edge_ends = array('q')
+        edge_weights = array('q')
+
+        for edge in edge_tuples:
+            if is_weighted:
+                start, end, weight = edge
+            else:
+                start, end = edge
+                weight = 1
+            if isinstance(weight, float) and edge_weights.typecode == 'q':
+                edge_weights = array('d', edge_weights)
+            edge_starts.append(start)
+            edge_ends.append(end)
+            edge_weights.append(weight)
+        self.weight_typecode = edge_weights.typecode
+        self.memory_map = None
+        self.memory_map_path = None
+
+        self.buildRows(edge_starts, edge_ends, edge_weights)
+        self.resetTraversalInformation()
+        self.reversed_graph = None
+        self.incoming_edge_arrays = None
+        self.settled_node_count = 0
+        self.delta_stepping_phase_count = 0
+        self.breadth_first_step_directions = []
+
+    def buildRows(self, edge_starts, edge_ends, edge_weights):
+        '''
+        This method builds the offsets, targets and target weights arrays from flat edge arrays using a counting sort
+
+        Each node's neighbors stay in the order their edges were added, matching the order of the Graph's adjacency lists apart from repeated edges
+        The flat arrays are not kept once the rows are built
+
+        Parameters :
+            edge_starts : array
+                The start node of each edge
+            edge_ends : array
+                The end node of each edge
+            edge_weights : array
+                The weight of each edge, with the graph's weight typecode
+        '''
+
+        number_of_nodes = self.number_of_nodes
+
+        degrees = array('q', bytes(8 * (number_of_nodes + 1)))
+        for start in edge_starts:
+            degrees[start + 1] += 1
+        if not self.is_directed:
+            for end in edge_ends:
+                degrees[end + 1] += 1
+
+        for i in range(0, number_of_nodes):
+            degrees[i + 1] += degrees[i]
+        self.offsets = degrees
+
+        entry_count = self.offsets[number_of_nodes]
+        self.targets = array('q', bytes(8 * entry_count))
+        self.target_weights = array(self.weight_typecode, bytes(8 * entry_count))
+
+        next_slots = array('q', self.offsets)
+        for j in range(0, len(edge_starts)):
+            start = edge_starts[j]
+            end = edge_ends[j]
+            weight = edge_weights[j]
+
+            slot = next_slots[start]
+            self.targets[slot] = end
+            self.target_weights[slot] = weight
+            next_slots[start] = slot + 1
+
+            if not self.is_directed:
+                slot = next_slots[end]
+                self.targets[slot] = start
+                self.target_weights[slot] = weight
+                next_slots[end] = slot + 1
+
+    def getEdgeCount(self):
+        '''
+        This method returns the number of edges in the graph
+
+        Returns :
+            edge_count : int
+                The number of edges which were added to the graph
+        '''
+
+        # an undirected edge, including a self loop, has an entry in the row of each of its nodes
+        if self.is_directed:
+            return len(self.targets)
+        return len(self.targets) // 2
+
+    def getEdgeTuples(self):
+        '''
+        This method builds a list of every edge from the rows
+
+        The edges are in order of their start node, and then in the order they were added
+        Each undirected edge is listed once from the row of its smaller node, so its start and end may be swapped from when it was added
+
+        Returns :
+            edges : [(int,int,int)]
+                The start node, end node and weight of each edge
+        '''
+
+        offsets = self.offsets
+        targets = self.targets
+        target_weights = self.target_weights
+        is_directed = self.is_directed
+
+        edges = []
+        for node_number in range(0, self.number_of_nodes):
+            # an undirected self loop fills two entries of its node's row, so only every other one is listed
+            is_loop_listed = False
+            for slot in range(offsets[node_number], offsets[node_number + 1]):
+                target = targets[slot]
+                if is_directed or node_number < target:
+                    edges.append((node_number, target, target_weights[slot]))
+                elif node_number == target:
+                    if not is_loop_listed:
+                        edges.append((node_number, target, target_weights[slot]))
+                    is_loop_listed = not is_loop_listed
+        return edges
+
+    def getNeighbors(self, node_number):
+        '''
+        This method returns the neighbors of a node and the weights of the edges to them
+
+        Parameters :
+            node_number : int
+                The number of the node
+
+        Returns :
+            neighbors : array
+                The numbers of the nodes connected to the node
+            neighbor_weights : array
+                The weights of the edges to each of the neighbors
+        '''
+
+        row_start = self.offsets[node_number]
+        row_end = self.offsets[node_number + 1]
+        return self.targets[row_start:row_end], self.target_weights[row_start:row_end]
+
+    def getMemoryUsage(self):
+        '''
+        This method returns the number of bytes used by the graph's arrays
+
+        Returns :
+            byte_count : int
+                The number of bytes held by the offsets, targets and target weights arrays
+        '''
+
+        byte_count = 0
+        for values in [self.offsets, self.targets, self.target_weights]:
+            byte_count += len(values) * values.itemsize
+        return byte_count
+
+    def getReversedGraph(self):
+        '''
+        This method returns the graph with every edge reversed, building it the first time it is needed
+
+        An undirected graph is its own reverse
+
+        Returns :
+            reversed_graph : CompressedSparseRowGraph
+                The graph where the neighbors of a node are the nodes with an edge to it
+        '''
+
+        if not self.is_directed:
+            return self
+        if self.reversed_graph == None:
+            self.reversed_graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=[(end, start, weight) for start, end, weight in self.getEdgeTuples()], is_directed=True, is_weighted=True)
+        return self.reversed_graph
+
+    def getEdgeArrays(self):
+        '''
+        This method builds numpy arrays of every edge from the rows, in the same order as getEdgeTuples
+
+        Returns :
+            edge_starts : ndarray
+                The start node of each edge
+            edge_ends : ndarray
+                The end node of each edge
+            edge_weights : ndarray
+                The weight of each edge
+        '''
+
+        import numpy as np
+        offsets = np.frombuffer(self.offsets, dtype=np.int64)
+        targets = np.frombuffer(self.targets, dtype=np.int64)
+        target_weights = np.frombuffer(self.target_weights, dtype=np.int64 if self.weight_typecode == 'q' else np.float64)
+        row_nodes = np.repeat(np.arange(self.number_of_nodes, dtype=np.int64), np.diff(offsets))
+        if self.is_directed:
+            return row_nodes, targets, target_weights
+
+        is_listed = row_nodes < targets
+        is_listed[np.flatnonzero(row_nodes == targets)[::2]] = True
+        return row_nodes[is_listed], targets[is_listed], target_weights[is_listed]
+
+    def resetTraversalInformation(self):
+        '''
+        This method resets the traversal information for all of the nodes
+        '''
+
+        self.parents = [None] * self.number_of_nodes
+        self.discovered_times = [None] * self.number_of_nodes
+        self.finished_times = [None] * self.number_of_nodes
+        self.back_edges = []
+        self.counter = 0
+
+    def node_visit(self, node_number, is_breadth_first=True):
+        '''
+        This method visits all nodes reachable from a node which have not already been visited
+
+        The traversal uses a queue when it is breadth first and an explicit stack when it is depth first, so it does not recurse
+        A breadth first traversal finishes the nodes in the order they left the queue once the queue is empty
+
+        Parameters :
+            node_number : int
+                The number of the node the traversal is starting at
+            is_breadth_first : Boolean, optional
+                Whether the traversal shall be breadth first rather than depth first (default is True)
+        '''
+
+        offsets = self.offsets
+        targets = self.targets
+        parents = self.parents
+        discovered_times = self.discovered_times
+        finished_times = self.finished_times
+        back_edges = self.back_edges
+        counter = self.counter
+
+        if discovered_times[node_number] == None:
+            discovered_times[node_number] = counter
+            counter += 1
+
+        if is_breadth_first:
+            # nodes leave the queue in the order they were discovered, so a neighbor is still waiting
+            # in the queue if it was discovered after the current node and has not been finished
+            queue = deque([node_number])
+            scanned_nodes = []
+            while queue:
+                node = queue.popleft()
+                scanned_nodes.append(node)
+                node_discovered_time = discovered_times[node]
+                for position in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[position]
+                    if discovered_times[neighbor] == None:
+                        discovered_times[neighbor] = counter
+                        counter += 1
+                        parents[neighbor] = node
+                        queue.append(neighbor)
+                    elif finished_times[neighbor] == None and discovered_times[neighbor] > node_discovered_time:
+                        back_edges.append((node, neighbor))
+
+            for node in scanned_nodes:
+                finished_times[node] = counter
+                counter += 1
+
+        else:
+            stack_nodes = [node_number]
+            stack_positions = [offsets[node_number]]
+            while stack_nodes:
+                node = stack_nodes[-1]
+                position = stack_positions[-1]
+                row_end = offsets[node + 1]
+                descended = False
+                while position < row_end:
+                    neighbor = targets[position]
+                    position += 1
+                    if discovered_times[neighbor] == None:
+                        parents[neighbor] = node
+                        discovered_times[neighbor] = counter
+                        counter += 1
+                        stack_positions[-1] = position
+                        stack_nodes.append(neighbor)
+                        stack_positions.append(offsets[neighbor])
+                        descended = True
+                        break
+                    elif finished_times[neighbor] == None:
+                        back_edges.append((node, neighbor))
+
+                if not descended:
+                    finished_times[node] = counter
+                    counter += 1
+                    stack_nodes.pop()
+                    stack_positions.pop()
+
+        self.counter = counter
+
+    def traverseGraph(self, is_breadth_first=True):
+        '''
+        This method traverses the entire graph by visiting each node which was not previously visited
+
+        Parameters :
+            is_breadth_first : Boolean, optional
+                Whether the traversal shall be breadth first rather than depth first (default is True)
+
+        Returns :
+            parents : [int]
+                The parent of each node in the traversal (None for the first node of each segment)
+            discovered_times : [int]
+                The counter value when each node was discovered
+            finished_times : [int]
+                The counter value when each node was finished
+        '''
+
+        self.resetTraversalInformation()
+        for node_number in range(0, self.number_of_nodes):
+            if self.discovered_times[node_number] == None:
+                self.node_visit(node_number, is_breadth_first=is_breadth_first)
+
+        return self.parents, self.discovered_times, self.finished_times
+
+    def breadthFirstSearchUsingBitsets(self, start_node_index, alpha=2, beta=24):
+        '''
+        This method performs a direction optimizing breadth first search from a node, with numpy boolean arrays for the frontier and visited nodes
+
+        Each level is expanded top down from the frontier or bottom up from the unvisited nodes, whichever touches fewer edges,
+        and the parents match those of a queue based breadth first traversal from the same node
+
+        Parameters :
+            start_node_index : int
+                The node the search starts at
+            alpha : float, optional
+                The search turns bottom up once the frontier's edges exceed the unexplored edges divided by alpha (default is 2)
+            beta : float, optional
+                The search turns back to top down once the frontier holds fewer than the number of nodes divided by beta (default is 24)
+
+        Returns :
+            parents_for_nodes : [int]
+                The parent of each node in the search (None for the start node and the nodes which can not be reached)
+            levels_for_nodes : [int]
+                The number of edges from the start node to each node (None if the node can not be reached)
+        '''
+
+        import BitsetBreadthFirstSearch
+
+        parents, levels, _, self.breadth_first_step_directions = BitsetBreadthFirstSearch.findBreadthFirstLevels(self, start_node_index, alpha=alpha, beta=beta)
+
+        parents_for_nodes = [None if parent == -1 else parent for parent in parents.tolist()]
+        levels_for_nodes = [None if level == -1 else level for level in levels.tolist()]
+        return parents_for_nodes, levels_for_nodes
+
+    def shortestPathFromNodeUsingBellmanFord(self, start_node):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using the bellman ford algorithm
+
+        It relaxes the edges from getEdgeTuples, which are grouped by start node rather than in the order they were added, so the distances match
+        Graph.shortestPathFromNodeUsingBellmanFord but a node with several shortest routes may be given a different parent
+        If there is a negative edge loop the method returns none instead of both arrays
+
+        Parameters :
+            start_node : int
+                The node that each node's distance is being calculated from
+
+        Returns :
+            distances_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the distance from the starting node to every other node
+            parents_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        distances_to_nodes = [None] * self.number_of_nodes
+        parents_for_nodes = [None] * self.number_of_nodes
+        distances_to_nodes[start_node] = 0
+
+        edges = self.getEdgeTuples()
+
+        for i in range(0, self.number_of_nodes):
+            is_changed = False
+            for edge_start, edge_end, edge_weight in edges:
+                start_distance = distances_to_nodes[edge_start]
+                if start_distance != None :
+                    end_distance = distances_to_nodes[edge_end]
+                    if end_distance == None or start_distance + edge_weight < end_distance:
+                        if i == self.number_of_nodes - 1:
+                            return None, None
+                        distances_to_nodes[edge_end] = start_distance + edge_weight
+                        parents_for_nodes[edge_end] = edge_start
+                        is_changed = True
+
+                if not self.is_directed :
+                    end_distance = distances_to_nodes[edge_end]
+                    if end_distance != None :
+                        start_distance = distances_to_nodes[edge_start]
+                        if start_distance == None or end_distance + edge_weight < start_distance:
+                            if i == self.number_of_nodes - 1:
+                                return None, None
+                            distances_to_nodes[edge_start] = end_distance + edge_weight
+                            parents_for_nodes[edge_start] = edge_end
+                            is_changed = True
+
+            if not is_changed:
+                break
+
+        return distances_to_nodes, parents_for_nodes
+
+    def shortestPathFromNodeUsingVectorizedBellmanFord(self, start_node, is_directed=None):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using a vectorized bellman ford algorithm
+
+        Each pass relaxes every edge at once from the previous pass's distances using numpy.minimum.at
+        If there is a negative edge loop the method returns none instead of both arrays
+
+        Parameters :
+            start_node : int
+                The node that each node's distance is being calculated from
+            is_directed : Boolean, optional
+                Whether the edges only run from their start node to their end node (default is None, which uses the graph's setting)
+
+        Returns :
+            distances_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the distance from the starting node to every other node
+            parents_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        import numpy as np
+
+        if is_directed == None:
+            is_directed = self.is_directed
+
+        number_of_nodes = self.number_of_nodes
+        edge_starts, edge_ends, edge_weights = self.getEdgeArrays()
+        if not is_directed:
+            edge_starts, edge_ends = np.concatenate((edge_starts, edge_ends)), np.concatenate((edge_ends, edge_starts))
+            edge_weights = np.concatenate((edge_weights, edge_weights))
+        edge_weights = edge_weights.astype(np.float64)
+
+        distances = np.full(number_of_nodes, np.inf)
+        distances[start_node] = 0
+        parents = np.full(number_of_nodes, -1, dtype=np.int64)
+
+        for i in range(0, number_of_nodes):
+            candidate_distances = distances[edge_starts] + edge_weights
+            new_distances = distances.copy()
+            np.minimum.at(new_distances, edge_ends, candidate_distances)
+
+            is_improved = new_distances < distances
+            if not is_improved.any():
+                break
+
+            # returns None if there is a negative edge loop
+            if i == number_of_nodes - 1:
+                return None, None
+
+            is_parent_edge = is_improved[edge_ends] & (candidate_distances == new_distances[edge_ends])
+            parents[edge_ends[is_parent_edge]] = edge_starts[is_parent_edge]
+            distances = new_distances
+
+        is_integer_weighted = self.weight_typecode == 'q'
+        distances_to_nodes = []
+        parents_for_nodes = []
+        for distance, parent in zip(distances.tolist(), parents.tolist()):
+            if distance == np.inf:
+                distances_to_nodes.append(None)
+            elif is_integer_weighted:
+                distances_to_nodes.append(int(distance))
+            else:
+                distances_to_nodes.append(distance)
+            parents_for_nodes.append(None if parent == -1 else parent)
+
+        return distances_to_nodes, parents_for_nodes
+
+    def getNodePotentials(self):
+        '''
+        This method calculates a potential for every node for use in johnson's algorithm
+
+        The potentials are the shortest distances from an added node which has an edge with a weight of 0 to every node,
+        calculated with a queue based bellman ford algorithm that starts with every node at a distance of 0
+
+        Returns :
+            potentials : [int] (or None if there is a negative edge loop)
+                The potential for each node, which is never more than 0
+        '''
+
+        number_of_nodes = self.number_of_nodes
+        offsets = self.offsets
+        targets = self.targets
+        target_weights = self.target_weights
+
+        potentials = [0] * number_of_nodes
+        path_edge_counts = [0] * number_of_nodes
+        is_in_queue = [True] * number_of_nodes
+        queue = deque(range(0, number_of_nodes))
+
+        while queue:
+            node = queue.popleft()
+            is_in_queue[node] = False
+            node_potential = potentials[node]
+
+            for position in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[position]
+                new_potential = node_potential + target_weights[position]
+
+                if new_potential < potentials[neighbor]:
+                    # a path of number_of_nodes edges after the added node's edge must repeat a node
+                    path_edge_counts[neighbor] = path_edge_counts[node] + 1
+                    if path_edge_counts[neighbor] >= number_of_nodes:
+                        return None
+
+                    potentials[neighbor] = new_potential
+                    if not is_in_queue[neighbor]:
+                        queue.append(neighbor)
+                        is_in_queue[neighbor] = True
+
+        return potentials
+
+    def getReweightedTargetWeights(self, potentials):
+        '''
+        This method reweights every edge using the node potentials so that none of the weights are negative
+
+        The weight of the edge from u to v becomes weight + potentials[u] - potentials[v]
+
+        Parameters :
+            potentials : [int]
+                The potential for each node from getNodePotentials
+
+        Returns :
+            reweighted_target_weights : array
+                The reweighted weights in the same order as the target weights
+        '''
+
+        reweighted_target_weights = array(self.weight_typecode, self.target_weights)
+        offsets = self.offsets
+        targets = self.targets
+        for node in range(0, self.number_of_nodes):
+            node_potential = potentials[node]
+            for position in range(offsets[node], offsets[node + 1]):
+                reweighted_target_weights[position] += node_potential - potentials[targets[position]]
+        return reweighted_target_weights
+
+    def shortestPathFromNodeUsingQueueBellmanFord(self, start_node):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using a queue based bellman ford algorithm
+
+        A node is only added to the queue when its distance changes, so only the edges out of changed nodes are relaxed
+        A shortest path can use at most number_of_nodes - 1 edges, so a longer path means there is a negative edge loop
+
+        Parameters :
+            start_node : int
+                The node that each node's distance is being calculated from
+
+        Returns :
+            distances_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the distance from the starting node to every other node
+            parents_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        number_of_nodes = self.number_of_nodes
+        offsets = self.offsets
+        targets = self.targets
+        target_weights = self.target_weights
+
+        distances_to_nodes = [None] * number_of_nodes
+        parents_for_nodes = [None] * number_of_nodes
+        path_edge_counts = [0] * number_of_nodes
+        is_in_queue = [False] * number_of_nodes
+
+        distances_to_nodes[start_node] = 0
+        queue = deque([start_node])
+        is_in_queue[start_node] = True
+
+        while queue:
+            node = queue.popleft()
+            is_in_queue[node] = False
+            node_distance = distances_to_nodes[node]
+
+            for position in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[position]
+                new_distance = node_distance + target_weights[position]
+                neighbor_distance = distances_to_nodes[neighbor]
+
+                if neighbor_distance == None or new_distance < neighbor_distance:
+                    path_edge_counts[neighbor] = path_edge_counts[node] + 1
+                    if path_edge_counts[neighbor] >= number_of_nodes:
+                        return None, None
+
+                    distances_to_nodes[neighbor] = new_distance
+                    parents_for_nodes[neighbor] = node
+                    if not is_in_queue[neighbor]:
+                        queue.append(neighbor)
+                        is_in_queue[neighbor] = True
+
+        return distances_to_nodes, parents_for_nodes
+
+    def shortestPathsFromNodeUsingDijkstra(self, start_node_index, end_node_index=None, target_weights=None, end_node_indices=None):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using dijkstra's algorithm
+
+        The priority queue is a heap of (distance, node) pairs where outdated pairs are skipped when they are popped
+
+        Parameters :
+            start_node_index : int
+                The index of the node that each node's distance is being calculated from
+            end_node_index : int, optional
+                The index of a node at which the search may stop once it is settled (default is None)
+            target_weights : array, optional
+                Non negative weights to use in place of the graph's target weights, in the same order (default is None)
+            end_node_indices : [int], optional
+                The indices of several nodes at which the search may stop once they are all settled (default is None)
+
+        Returns :
+            distances_to_nodes : [int]
+                The list of the distance from the starting node to every other node (None if the node can not be reached)
+            parents_for_nodes : [int]
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        remaining_end_nodes = None
+        if end_node_indices != None:
+            remaining_end_nodes = set(end_node_indices)
+        elif end_node_index != None:
+            remaining_end_nodes = {end_node_index}
+
+        offsets = self.offsets
+        targets = self.targets
+        if target_weights == None:
+            target_weights = self.target_weights
+
+        distances_to_nodes = [None] * self.number_of_nodes
+        parents_for_nodes = [None] * self.number_of_nodes
+        is_settled = [False] * self.number_of_nodes
+
+        distances_to_nodes[start_node_index] = 0
+        priority_queue = [(0, start_node_index)]
+        settled_node_count = 0
+
+        while priority_queue:
+            current_distance, current_node = heapq.heappop(priority_queue)
+            if is_settled[current_node]:
+                continue
+            is_settled[current_node] = True
+            settled_node_count += 1
+
+            if remaining_end_nodes != None and current_node in remaining_end_nodes:
+                remaining_end_nodes.discard(current_node)
+                if not remaining_end_nodes:
+                    break
+
+            for position in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[position]
+                new_distance = current_distance + target_weights[position]
+                neighbor_distance = distances_to_nodes[neighbor]
+                if neighbor_distance == None or new_distance < neighbor_distance:
+                    distances_to_nodes[neighbor] = new_distance
+                    parents_for_nodes[neighbor] = current_node
+                    heapq.heappush(priority_queue, (new_distance, neighbor))
+
+        self.settled_node_count = settled_node_count
+        return distances_to_nodes, parents_for_nodes
+
+    def createDeltaSteppingWorkerPool(self, n_workers):
+        '''
+        This method starts worker processes holding the graph's arrays, which several delta stepping searches can share
+
+        Parameters :
+            n_workers : int
+                The number of worker processes
+
+        Returns :
+            worker_pool : DeltaSteppingWorkerPool
+                The workers, which should be closed with close or by using them in a with statement
+        '''
+
+        import DeltaStepping
+
+        return DeltaStepping.DeltaSteppingWorkerPool(self, n_workers)
+
+    def shortestPathsFromNodeUsingDeltaStepping(self, start_node_index, delta=None, n_workers=1, worker_pool=None):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using delta stepping
+
+        Nodes are bucketed by tentative distance and the edges of a whole bucket are relaxed at once with numpy, optionally spread over worker processes
+        The distances match dijkstra's algorithm, while the parents may differ between routes of equal length
+
+        Parameters :
+            start_node_index : int
+                The index of the node that each node's distance is being calculated from
+            delta : float, optional
+                The bucket width, where smaller values do less repeated work in more phases (default is None, which picks one from the edge weights)
+            n_workers : int, optional
+                The number of worker processes relaxing large buckets (default is 1, which works in this process)
+            worker_pool : DeltaSteppingWorkerPool, optional
+                Workers from createDeltaSteppingWorkerPool to search with, which are left running for later searches (default is None)
+
+        Returns :
+            distances_to_nodes : [int]
+                The list of the distance from the starting node to every other node (None if the node can not be reached)
+            parents_for_nodes : [int]
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        import DeltaStepping
+
+        distances, parents, self.delta_stepping_phase_count = DeltaStepping.findShortestPathsUsingDeltaStepping(self, start_node_index, delta=delta, n_workers=n_workers, worker_pool=worker_pool)
+
+        is_integer_weighted = self.weight_typecode == 'q'
+        distances_to_nodes = []
+        parents_for_nodes = []
+        for distance, parent in zip(distances.tolist(), parents.tolist()):
+            if distance == math.inf:
+                distances_to_nodes.append(None)
+            elif is_integer_weighted:
+                distances_to_nodes.append(int(distance))
+            else:
+                distances_to_nodes.append(distance)
+            parents_for_nodes.append(None if parent == -1 else parent)
+
+        return distances_to_nodes, parents_for_nodes
+
+    def shortestPathBetweenTwoNodesUsingDijkstra(self, start_node_index, end_node_index):
+        '''
+        This method finds the shortest path between a given start node and a given end node
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+
+        Returns :
+            path : [int]
+                the path of nodes to reach the end node (None if it can not be reached)
+            distance : int
+                The distance of the path to the end node (None if it can not be reached)
+        '''
+
+        distances_to_nodes, parents_for_nodes = self.shortestPathsFromNodeUsingDijkstra(start_node_index, end_node_index=end_node_index)
+
+        if distances_to_nodes[end_node_index] == None:
+            return None, None
+
+        path = []
+        parent = end_node_index
+        while parent != None :
+            path.append(parent)
+            parent = parents_for_nodes[parent]
+        path.reverse()
+
+        return path, distances_to_nodes[end_node_index]
+
+    def shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(self, start_node_index, end_node_index):
+        '''
+        This method finds the shortest path between a given start node and a given end node by searching forward from the start
+        and backward from the end until the two searches meet
+
+        The search with the smaller next distance is advanced each step, and the searches stop once the sum of their next distances
+        is no smaller than the shortest path found through a node reached by both
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+
+        Returns :
+            path : [int]
+                the path of nodes to reach the end node (None if it can not be reached)
+            distance : int
+                The distance of the path to the end node (None if it can not be reached)
+        '''
+
+        if start_node_index == end_node_index:
+            self.settled_node_count = 1
+            return [start_node_index], 0
+
+        reversed_graph = self.getReversedGraph()
+        number_of_nodes = self.number_of_nodes
+
+        # index 0 holds the forward search from the start and index 1 holds the backward search from the end
+        rows = [(self.offsets, self.targets, self.target_weights), (reversed_graph.offsets, reversed_graph.targets, reversed_graph.target_weights)]
+        distances = [[None] * number_of_nodes, [None] * number_of_nodes]
+        parents = [[None] * number_of_nodes, [None] * number_of_nodes]
+        is_settled = [[False] * number_of_nodes, [False] * number_of_nodes]
+        priority_queues = [[(0, start_node_index)], [(0, end_node_index)]]
+        distances[0][start_node_index] = 0
+        distances[1][end_node_index] = 0
+
+        best_distance = None
+        meeting_node = None
+        settled_node_count = 0
+
+        while priority_queues[0] and priority_queues[1]:
+            forward_top = priority_queues[0][0][0]
+            backward_top = priority_queues[1][0][0]
+            if best_distance != None and forward_top + backward_top >= best_distance:
+                break
+
+            side = 0 if forward_top <= backward_top else 1
+            current_distance, current_node = heapq.heappop(priority_queues[side])
+            if is_settled[side][current_node]:
+                continue
+            is_settled[side][current_node] = True
+            settled_node_count += 1
+
+            side_distances = distances[side]
+            other_distances = distances[1 - side]
+            side_parents = parents[side]
+            offsets, targets, target_weights = rows[side]
+
+            for position in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[position]
+                new_distance = current_distance + target_weights[position]
+                if side_distances[neighbor] == None or new_distance < side_distances[neighbor]:
+                    side_distances[neighbor] = new_distance
+                    side_parents[neighbor] = current_node
+                    heapq.heappush(priority_queues[side], (new_distance, neighbor))
+
+                if other_distances[neighbor] != None:
+                    meeting_distance = side_distances[neighbor] + other_distances[neighbor]
+                    if best_distance == None or meeting_distance < best_distance:
+                        best_distance = meeting_distance
+                        meeting_node = neighbor
+
+        self.settled_node_count = settled_node_count
+
+        if best_distance == None:
+            return None, None
+
+        path = []
+        node = meeting_node
+        while node != None:
+            path.append(node)
+            node = parents[0][node]
+        path.reverse()
+
+        node = parents[1][meeting_node]
+        while node != None:
+            path.append(node)
+            node = parents[1][node]
+
+        return path, best_distance
+
+    def shortestPathBetweenTwoNodesUsingAStar(self, start_node_index, end_node_index, heuristic):
+        '''
+        This method finds the shortest path between a given start node and a given end node using the A* algorithm
+
+        Nodes are taken from the priority queue in order of their distance plus the heuristic's estimate of the distance left,
+        so the heuristic must never over estimate the distance to the end node
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+            heuristic : function(int, int)
+                A function taking a node and the end node which returns a lower bound on the distance between them
+
+        Returns :
+            path : [int]
+                the path of nodes to reach the end node (None if it can not be reached)
+            distance : int
+                The distance of the path to the end node (None if it can not be reached)
+        '''
+
+        offsets = self.offsets
+        targets = self.targets
+        target_weights = self.target_weights
+
+        distances_to_nodes = [None] * self.number_of_nodes
+        parents_for_nodes = [None] * self.number_of_nodes
+
+        distances_to_nodes[start_node_index] = 0
+        priority_queue = [(heuristic(start_node_index, end_node_index), 0, start_node_index)]
+        settled_node_count = 0
+        found_end_node = False
+
+        while priority_queue:
+            _, current_distance, current_node = heapq.heappop(priority_queue)
+            # skip the entry if the node has been reached by a shorter route since it was added
+            if current_distance > distances_to_nodes[current_node]:
+                continue
+            settled_node_count += 1
+
+            if current_node == end_node_index:
+                found_end_node = True
+                break
+
+            for position in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[position]
+                new_distance = current_distance + target_weights[position]
+                if distances_to_nodes[neighbor] == None or new_distance < distances_to_nodes[neighbor]:
+                    distances_to_nodes[neighbor] = new_distance
+                    parents_for_nodes[neighbor] = current_node
+                    heapq.heappush(priority_queue, (new_distance + heuristic(neighbor, end_node_index), new_distance, neighbor))
+
+        self.settled_node_count = settled_node_count
+
+        if not found_end_node:
+            return None, None
+
+        path = []
+        node = end_node_index
+        while node != None:
+            path.append(node)
+            node = parents_for_nodes[node]
+        path.reverse()
+
+        return path, distances_to_nodes[end_node_index]
+
+    def findSpurPath(self, spur_node_index, end_node_index, blocked_next_nodes, is_removed_node, distances_to_end):
+        '''
+        This method finds the shortest path from a spur node to the end node for yen's algorithm, with some nodes and edges masked out
+
+        The search is A* with each node's distance to the end node in the whole graph as the heuristic, which stays a lower bound once
+        nodes and edges are masked, and nodes which can not reach the end node at all are never added to the queue
+
+        Parameters :
+            spur_node_index : int
+                The node the spur path starts at
+            end_node_index : int
+                The node the spur path ends at
+            blocked_next_nodes : set(int)
+                The nodes which may not be reached directly from the spur node, as earlier paths already continue to them
+            is_removed_node : bytearray
+                Whether each node is on the root path and may not be used
+            distances_to_end : [int]
+                The distance from each node to the end node in the whole graph (None if it can not reach the end node)
+
+        Returns :
+            path : [int]
+                The nodes of the spur path (None if the end node can not be reached)
+            path_distances : [int]
+                The distance from the spur node to each node of the spur path (None if the end node can not be reached)
+        '''
+
+        offsets = self.offsets
+        targets = self.targets
+        target_weights = self.target_weights
+
+        distances_to_nodes = {spur_node_index: 0}
+        parents_for_nodes = {spur_node_index: None}
+        priority_queue = [(distances_to_end[spur_node_index], 0, spur_node_index)]
+        settled_node_count = 0
+        found_end_node = False
+
+        while priority_queue:
+            _, current_distance, current_node = heapq.heappop(priority_queue)
+            if current_distance > distances_to_nodes[current_node]:
+                continue
+            settled_node_count += 1
+
+            if current_node == end_node_index:
+                found_end_node = True
+                break
+
+            for position in range(offsets[current_node], offsets[current_node + 1]):
+                neighbor = targets[position]
+                distance_to_end = distances_to_end[neighbor]
+                if distance_to_end == None or is_removed_node[neighbor] or (current_node == spur_node_index and neighbor in blocked_next_nodes):
+                    continue
+                new_distance = current_distance + target_weights[position]
+                neighbor_distance = distances_to_nodes.get(neighbor)
+                if neighbor_distance == None or new_distance < neighbor_distance:
+                    distances_to_nodes[neighbor] = new_distance
+                    parents_for_nodes[neighbor] = current_node
+                    heapq.heappush(priority_queue, (new_distance + distance_to_end, new_distance, neighbor))
+
+        self.settled_node_count += settled_node_count
+
+        if not found_end_node:
+            return None, None
+
+        path = []
+        node = end_node_index
+        while node != None:
+            path.append(node)
+            node = parents_for_nodes[node]
+        path.reverse()
+
+        return path, [distances_to_nodes[node] for node in path]
+
+    def kShortestPathsUsingYen(self, start_node_index, end_node_index, k):
+        '''
+        This method finds the k shortest loopless paths between a given start node and a given end node using yen's algorithm
+
+        Each new path is found by following an accepted path to a spur node, masking the root path's nodes and the edges other accepted paths
+        with the same root take from the spur node, and searching for the shortest spur path to the end node. The candidates are kept in a heap
+        Following lawler, a path is only spurred from the node where it left the path it was derived from, as the earlier spur nodes
+        would repeat searches already made
+        The edge weights must not be negative
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the routes
+            end_node_index : int
+                The index of the end node for the routes
+            k : int
+                The most paths to find
+
+        Returns :
+            paths : [([int], int)]
+                Each path and its distance, from shortest to longest (fewer than k if there are not that many loopless paths)
+        '''
+
+        if len(self.target_weights) > 0 and min(self.target_weights) < 0:
+            raise ValueError("Yen's algorithm can not be used with negative edge weights")
+
+        self.settled_node_count = 0
+        distances_to_end, _ = self.getReversedGraph().shortestPathsFromNodeUsingDijkstra(end_node_index)
+        if k < 1 or distances_to_end[start_node_index] == None:
+            return []
+
+        is_removed_node = bytearray(self.number_of_nodes)
+        path, path_distances = self.findSpurPath(start_node_index, end_node_index, set(), is_removed_node, distances_to_end)
+
+        # each accepted path is kept with the distance to each of its nodes and the position where it left the path it came from
+        accepted_paths = [(path, path_distances, 0)]
+        candidate_paths = []
+        seen_paths = {tuple(path)}
+
+        while len(accepted_paths) < k:
+            path, path_distances, deviation_index = accepted_paths[-1]
+
+            for spur_index in range(deviation_index, len(path) - 1):
+                spur_node_index = path[spur_index]
+                root_path = path[0:spur_index + 1]
+
+                blocked_next_nodes = set()
+                for accepted_path, _, _ in accepted_paths:
+                    if len(accepted_path) > spur_index + 1 and accepted_path[0:spur_index + 1] == root_path:
+                        blocked_next_nodes.add(accepted_path[spur_index + 1])
+
+                for node in root_path[0:-1]:
+                    is_removed_node[node] = 1
+                spur_path, spur_distances = self.findSpurPath(spur_node_index, end_node_index, blocked_next_nodes, is_removed_node, distances_to_end)
+                for node in root_path[0:-1]:
+                    is_removed_node[node] = 0
+
+                if spur_path != None:
+                    candidate_path = root_path + spur_path[1:]
+                    if tuple(candidate_path) not in seen_paths:
+                        seen_paths.add(tuple(candidate_path))
+                        root_distance = path_distances[spur_index]
+                        candidate_distances = path_distances[0:spur_index] + [root_distance + distance for distance in spur_distances]
+                        heapq.heappush(candidate_paths, (candidate_distances[-1], candidate_path, candidate_distances, spur_index))
+
+            if not candidate_paths:
+                break
+            _, candidate_path, candidate_distances, spur_index = heapq.heappop(candidate_paths)
+            accepted_paths.append((candidate_path, candidate_distances, spur_index))
+
+        return [(path, path_distances[-1]) for path, path_distances, _ in accepted_paths]
+
+    def save(self, path, is_weighted=None, edge_tuples=None):
+        '''
+        This method writes the graph to a binary file which load can memory map without copying
+
+        Parameters :
+            path : str
+                The path of the file to write
+            is_weighted : Boolean, optional
+                The weighted setting to record for the graph (default is None, which records the graph's setting)
+            edge_tuples : [(int,int,int)], optional
+                The graph's edges in the order they were added, written as the file's flat edge arrays (default is None, which lists them from the rows)
+        '''
+
+        if is_weighted == None:
+            is_weighted = self.is_weighted
+
+        edges = self.getEdgeTuples() if edge_tuples == None else edge_tuples
+        edge_starts = array('q', [start for start, _, _ in edges])
+        edge_ends = array('q', [end for _, end, _ in edges])
+        edge_weights = array(self.weight_typecode, [weight for _, _, weight in edges])
+        edges = None
+
+        header = GRAPH_FILE_HEADER.pack(GRAPH_FILE_MAGIC, GRAPH_FILE_VERSION, self.number_of_nodes, len(edge_starts), len(self.targets),
+                                        int(self.is_directed), int(is_weighted), int(self.weight_typecode == 'd'))
+
+        with open(path, "wb") as graph_file:
+            graph_file.write(header)
+            for values, typecode in [(self.offsets, 'q'), (self.targets, 'q'), (self.target_weights, self.weight_typecode),
+                                     (edge_starts, 'q'), (edge_ends, 'q'), (edge_weights, self.weight_typecode)]:
+                values = array(typecode, values)
+                if sys.byteorder != "little":
+                    values.byteswap()
+                graph_file.write(values.tobytes())
+
+    @staticmethod
+    def load(path, mmap=True):
+        '''
+        This method reads a graph written by save
+
+        When memory mapped, the arrays are read only memoryviews of the file, so loading takes the same time however large the graph is
+        and processes which load the same file share its pages. The memoryviews can not be pickled, so the path is kept for processes
+        which are not forked to map the file themselves
+
+        Parameters :
+            path : str
+                The path of the file to read
+            mmap : Boolean, optional
+                Whether the file is memory mapped rather than copied into python arrays (default is True)
+
+        Returns :
+            compressed_graph : CompressedSparseRowGraph
+                The graph stored in the file
+        '''
+
+        header = readGraphFileHeader(path)
+        graph = CompressedSparseRowGraph(0, is_directed=header["is_directed"], is_weighted=header["is_weighted"])
+        graph.number_of_nodes = header["number_of_nodes"]
+        graph.weight_typecode = header["weight_typecode"]
+
+        is_memory_mapped = mmap and sys.byteorder == "little"
+        with open(path, "rb") as graph_file:
+            if is_memory_mapped:
+                graph.memory_map = mmap_module.mmap(graph_file.fileno(), 0, access=mmap_module.ACCESS_READ)
+                graph.memory_map_path = path
+                file_view = memoryview(graph.memory_map)
+            else:
+                file_bytes = graph_file.read()
+
+        # the file's flat edge arrays are left for other readers such as numpy.memmap, since the graph only keeps its rows
+        for name, typecode in [("offsets", 'q'), ("targets", 'q'), ("target_weights", graph.weight_typecode)]:
+            array_start, array_length = header["array_positions"][name]
+            array_end = array_start + 8 * array_length
+            if is_memory_mapped:
+                values = file_view[array_start:array_end].cast(typecode)
+            else:
+                values = array(typecode)
+                values.frombytes(file_bytes[array_start:array_end])
+                if sys.byteorder != "little":
+                    values.byteswap()
+            setattr(graph, name, values)
+
+        graph.resetTraversalInformation()
+        return graph
+
+def readGraphFileEdgeTuples(path, memory_map=None):
+    '''
+    This function reads the flat edge arrays of a graph file written by save, in the order they were written
+
+    Parameters :
+        path : str
+            The path of the graph file
+        memory_map : mmap, optional
+            The file already memory mapped by load, which is read instead of opening the path again (default is None)
+
+    Returns :
+        edges : [(int,int,int)]
+            The start node, end node and weight of each edge
+    '''
+
+    header = readGraphFileHeader(path) if memory_map == None else readGraphFileHeaderBytes(bytes(memory_map[0:GRAPH_FILE_HEADER.size]), path)
+    edge_arrays = []
+    with open(path, "rb") if memory_map == None else nullcontext(memory_map) as graph_file:
+        for name, typecode in [("edge_starts", 'q'), ("edge_ends", 'q'), ("edge_weights", header["weight_typecode"])]:
+            array_start, array_length = header["array_positions"][name]
+            graph_file.seek(array_start)
+            values = array(typecode)
+            values.frombytes(graph_file.read(8 * array_length))
+            if sys.byteorder != "little":
+                values.byteswap()
+            edge_arrays.append(values)
+    return list(zip(*edge_arrays))
+
+def readGraphFileHeader(path):
+    '''
+    This function reads the header of a graph file written by save, including where each array starts
+
+    The positions allow the arrays to be opened with numpy.memmap, for example
+    numpy.memmap(path, dtype=numpy.int64, mode="r", offset=array_start, shape=(array_length,))
+
+    Parameters :
+        path : str
+            The path of the graph file
+
+    Returns :
+        header : {str:}
+            The number of nodes, edges and row entries, the directed and weighted settings, the weight typecode ('q' or 'd'),
+            and the (byte offset, length) of each array keyed by its name
+    '''
+
+    with open(path, "rb") as graph_file:
+        header_bytes = graph_file.read(GRAPH_FILE_HEADER.size)
+
+    return readGraphFileHeaderBytes(header_bytes, path)
+
+def readGraphFileHeaderBytes(header_bytes, path):
+    '''
+    This function unpacks the header bytes at the start of a graph file written by save
+
+    Parameters :
+        header_bytes : bytes
+            The bytes at the start of the file
+        path : str
+            The path of the graph file, used in the error message
+
+    Returns :
+        header : {str:}
+            The header, as described by readGraphFileHeader
+    '''
+
+    if len(header_bytes) < GRAPH_FILE_HEADER.size:
+        raise ValueError(f"{path} is not a graph file")
+    magic, version, number_of_nodes, edge_count, target_count, is_directed, is_weighted, is_float_weighted = GRAPH_FILE_HEADER.unpack(header_bytes)
+    if magic != GRAPH_FILE_MAGIC or version != GRAPH_FILE_VERSION:
+        raise ValueError(f"{path} is not a graph file of version {GRAPH_FILE_VERSION}")
+
+    array_positions = {}
+    array_start = GRAPH_FILE_HEADER.size
+    for name, array_length in [("offsets", number_of_nodes + 1), ("targets", target_count), ("target_weights", target_count),
+                               ("edge_starts", edge_count), ("edge_ends", edge_count), ("edge_weights", edge_count)]:
+        array_positions[name] = (array_start, array_length)
+        array_start += 8 * array_length
+
+    return {
+        "number_of_nodes": number_of_nodes,
+        "edge_count": edge_count,
+        "target_count": target_count,
+        "is_directed": bool(is_directed),
+        "is_weighted": bool(is_weighted),
+        "weight_typecode": 'd' if is_float_weighted else 'q',
+        "array_positions": array_positions
+    }
+
+def getEuclideanHeuristic(coordinates):
+    '''
+    This function creates an A* heuristic from the coordinates of each node
+
+    The straight line distance is only a lower bound if no edge weight is shorter than the distance between its nodes
+
+    Parameters :
+        coordinates : [(float, float)]
+            The x and y coordinates of each node
+
+    Returns :
+        heuristic : function(int, int)
+            A function returning the straight line distance between two nodes
+    '''
+
+    def heuristic(node_index, end_node_index):
+        x, y = coordinates[node_index]
+        end_x, end_y = coordinates[end_node_index]
+        return math.hypot(x - end_x, y - end_y)
+
+    return heuristic
+
+def findPathsFromSources(compressed_graph, source_targets):
+    '''
+    This function answers groups of point to point queries which share a start node, with one dijkstra search per start node
+    which stops once all of that start node's end nodes are settled
+
+    It is a module level function so it can be sent to a process pool as well as a thread pool
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being searched
+        source_targets : [(int, [int])]
+            Each start node with the end nodes requested from it
+
+    Returns :
+        source_results : [[([int], int)]]
+            For each start node, the path and distance to each of its end nodes in the same order (None, None if it can not be reached)
+    '''
+
+    source_results = []
+    for start_node_index, end_node_indices in source_targets:
+        distances_to_nodes, parents_for_nodes = compressed_graph.shortestPathsFromNodeUsingDijkstra(start_node_index, end_node_indices=end_node_indices)
+
+        results = []
+        for end_node_index in end_node_indices:
+            if distances_to_nodes[end_node_index] == None:
+                results.append((None, None))
+                continue
+
+            path = []
+            parent = end_node_index
+            while parent != None :
+                path.append(parent)
+                parent = parents_for_nodes[parent]
+            path.reverse()
+            results.append((path, distances_to_nodes[end_node_index]))
+        source_results.append(results)
+
+    return source_results
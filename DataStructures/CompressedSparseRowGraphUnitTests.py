@@ -0,0 +1,399 @@
+import os
+import tempfile
+import unittest
+import DeltaStepping
+from Graph import Graph
+from CompressedSparseRowGraph import CompressedSparseRowGraph, findPathsFromSources, getEuclideanHeuristic, readGraphFileHeader
+
+class CompressedSparseRowGraphUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for the compressed sparse row graph data structure
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up the edge lists to be used with the following unit tests
+
+        Number of nodes : 10
+        Number of edges : 13
+        '''
+
+        self.edge_list = [(0,1),(2,1),(2,3),(3,4),(4,5),(5,6),(1,6),(6,3),(2,4),(2,5),(7,8),(9,8),(9,7)]
+        self.weighted_edge_list = [(0,1,2),(2,1,1),(2,3,4),(3,4,6),(4,5,3),(5,6,2),(1,6,1),(6,3,3),(2,4,4),(2,5,2),(7,8,5),(9,8,2),(9,7,1)]
+
+        self.number_of_nodes = 10
+
+    def createGraphs(self, is_directed, is_weighted=True, is_breadth_first=True):
+        '''
+        This method creates a graph of the ten nodes and thirteen edges set up for the unit tests, along with its compressed sparse row copy
+
+        Parameters :
+            is_directed : Boolean
+                Whether the edges only run from their start node to their end node
+            is_weighted : Boolean, optional
+                Whether the weighted edge list is used rather than the unweighted one (default is True)
+            is_breadth_first : Boolean, optional
+                Whether the graph is traversed breadth first (default is True)
+
+        Returns :
+            graph : Graph
+                The graph of the edge list
+            compressed_graph : CompressedSparseRowGraph
+                The graph's compressed sparse row copy
+        '''
+
+        edge_tuples = self.weighted_edge_list if is_weighted else self.edge_list
+        graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=edge_tuples, is_breadth_first=is_breadth_first, is_directed=is_directed, is_weighted=is_weighted)
+        return graph, graph.getCompressedSparseRow()
+
+    def assertSearchesMatch(self, search, expected_search, number_of_nodes=None):
+        '''
+        This method checks that a search from every node gives the same result as the search it is compared to
+
+        Parameters :
+            search : function
+                The search being checked, taking a start node
+            expected_search : function
+                The search giving the expected result, taking a start node
+            number_of_nodes : int, optional
+                The number of start nodes (default is None, which uses the number of nodes set up for the unit tests)
+        '''
+
+        if number_of_nodes == None:
+            number_of_nodes = self.number_of_nodes
+        for start_index in range(0, number_of_nodes):
+            self.assertEqual(search(start_index), expected_search(start_index), f"Search from node {start_index}")
+
+    def test_rows(self):
+        '''
+        This method tests that the rows of an undirected graph hold each node's neighbors in the order the edges were added
+        '''
+
+        graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.edge_list, is_directed=False)
+
+        self.assertEqual(graph.getEdgeCount(), 13)
+        self.assertEqual(len(graph.targets), 26)
+        neighbors, weights = graph.getNeighbors(2)
+        self.assertListEqual(list(neighbors), [1,3,4,5])
+        self.assertListEqual(list(weights), [1,1,1,1])
+
+    def test_built_from_graph(self):
+        '''
+        This method tests that the graph's compressed sparse row copy is rebuilt after an edge is added
+        '''
+
+        graph, compressed_graph = self.createGraphs(True)
+
+        self.assertIs(graph.getCompressedSparseRow(), compressed_graph)
+        self.assertListEqual(list(compressed_graph.getNeighbors(2)[0]), [1,3,4,5])
+
+        graph.addWeightedEdge(0, 2, 7)
+        self.assertIsNot(graph.getCompressedSparseRow(), compressed_graph)
+        self.assertListEqual(list(graph.getCompressedSparseRow().getNeighbors(0)[0]), [1,2])
+
+    def test_breadth_first_traversal(self):
+        '''
+        This method tests directed breadth first travel from the first node
+        '''
+
+        graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.edge_list, is_directed=True)
+        graph.node_visit(0)
+
+        self.assertListEqual(graph.parents, [None, 0, None, 6, 3, 4, 1, None, None, None])
+        self.assertEqual(graph.discovered_times[6], 2)
+
+    def test_weighted_bellman_matches_graph(self):
+        '''
+        This method tests bellman ford against the graph for directed and undirected weighted graphs
+        '''
+
+        for is_directed in [False, True]:
+            graph, compressed_graph = self.createGraphs(is_directed)
+
+            self.assertEqual(compressed_graph.shortestPathFromNodeUsingBellmanFord(0), graph.shortestPathFromNodeUsingBellmanFord(0))
+            # the rows relax the edges in a different order to the graph's edge list, so only the distances are compared when a parent is tied
+            self.assertSearchesMatch(lambda start_index : compressed_graph.shortestPathFromNodeUsingBellmanFord(start_index)[0], lambda start_index : graph.shortestPathFromNodeUsingBellmanFord(start_index)[0])
+
+    def test_bellman_negative_edge(self):
+        '''
+        This method tests bellman using a weighted, undirected graph with a negative loop
+        '''
+
+        graph = CompressedSparseRowGraph(3, edge_tuples=[(0,1,1),(1,2,-1),(0,2,1)], is_directed=False, is_weighted=True)
+
+        distances, parents = graph.shortestPathFromNodeUsingBellmanFord(0)
+
+        self.assertEqual(distances, None)
+        self.assertEqual(parents, None)
+
+    def test_weighted_dijkstra(self):
+        '''
+        This method tests dijkstra using weighted, undirected graph
+        '''
+
+        graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=False, is_weighted=True)
+
+        distances, parents = graph.shortestPathsFromNodeUsingDijkstra(0)
+        self.assertListEqual(distances, [0, 2, 3, 6, 7, 5, 3, None, None, None])
+
+        path, distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 4)
+        self.assertListEqual(path, [0, 1, 2, 4])
+        self.assertEqual(distance, 7)
+
+        path, distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 8)
+        self.assertEqual(path, None)
+        self.assertEqual(distance, None)
+
+    def test_edges_built_from_rows(self):
+        '''
+        This method tests that the edges listed from the rows hold every edge once, including repeated edges and self loops,
+        and that the rows keep the repeated edges which the graph's adjacency lists hold once with the lightest weight
+        '''
+
+        edge_list = [(1,0,5),(0,1,2),(1,2,1),(2,2,3),(2,2,4)]
+        for is_directed, expected_edges in [(True, [(0,1,2),(1,0,5),(1,2,1),(2,2,3),(2,2,4)]), (False, [(0,1,5),(0,1,2),(1,2,1),(2,2,3),(2,2,4)])]:
+            compressed_graph = CompressedSparseRowGraph(3, edge_tuples=edge_list, is_directed=is_directed, is_weighted=True)
+
+            self.assertEqual(compressed_graph.getEdgeCount(), 5)
+            self.assertListEqual(compressed_graph.getEdgeTuples(), expected_edges)
+            edge_starts, edge_ends, edge_weights = compressed_graph.getEdgeArrays()
+            self.assertListEqual(list(zip(edge_starts.tolist(), edge_ends.tolist(), edge_weights.tolist())), expected_edges)
+            self.assertEqual(compressed_graph.getMemoryUsage(), 8 * (len(compressed_graph.offsets) + 2 * len(compressed_graph.targets)))
+
+        graph = Graph(number_of_nodes=3, edge_tuples=edge_list, is_directed=False, is_weighted=True)
+        compressed_graph = graph.getCompressedSparseRow()
+        self.assertListEqual(graph.getNode(0).connected_nodes, [1])
+        self.assertListEqual(list(compressed_graph.getNeighbors(0)[0]), [1, 1])
+
+        graph.node_visit(0)
+        compressed_graph.node_visit(0)
+        self.assertListEqual(compressed_graph.parents, [graph.getNodeParent(i) for i in range(0, 3)])
+
+        self.assertListEqual(graph.getNode(0).connected_edge_weights, [2])
+        self.assertEqual(graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 2)[1], 3)
+        self.assertEqual(compressed_graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 2)[1], 3)
+
+    def test_traversal_matches_graph(self):
+        '''
+        This method tests that breadth first and depth first traversal match the graph's traversal for directed and undirected graphs
+        '''
+
+        for is_directed, is_breadth_first in [(False, False), (True, False), (False, True), (True, True)]:
+            graph, compressed_graph = self.createGraphs(is_directed, is_weighted=False, is_breadth_first=is_breadth_first)
+            graph.traverseGraph()
+
+            parents, discovered_times, finished_times = compressed_graph.traverseGraph(is_breadth_first=is_breadth_first)
+
+            for node_number in range(0, self.number_of_nodes):
+                self.assertEqual(parents[node_number], graph.getNodeParent(node_number))
+                self.assertEqual(discovered_times[node_number], graph.getNodeDiscoveredTime(node_number))
+                self.assertEqual(finished_times[node_number], graph.getNodeFinishedTime(node_number))
+            self.assertListEqual(compressed_graph.back_edges, graph.back_edges)
+
+    def test_bidirectional_dijkstra(self):
+        '''
+        This method tests bidirectional dijkstra against dijkstra using weighted, directed and undirected graphs
+        '''
+
+        for is_directed in [False, True]:
+            graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=is_directed, is_weighted=True)
+
+            for start_index in range(0, self.number_of_nodes):
+                distances, _ = graph.shortestPathsFromNodeUsingDijkstra(start_index)
+                for end_index in range(0, self.number_of_nodes):
+                    path, distance = graph.shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(start_index, end_index)
+                    self.assertEqual(distance, distances[end_index])
+                    if distance == None:
+                        self.assertEqual(path, None)
+                    else:
+                        self.assertEqual(path[0], start_index)
+                        self.assertEqual(path[-1], end_index)
+
+        graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=True, is_weighted=True)
+        self.assertListEqual(graph.shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(0, 5)[0], [0, 1, 6, 3, 4, 5])
+
+    def test_a_star(self):
+        '''
+        This method tests A* with a euclidean heuristic on a grid, where it should settle fewer nodes than dijkstra
+        '''
+
+        width = 20
+        coordinates = [(node % width, node // width) for node in range(0, width * width)]
+        grid_edges = []
+        for node in range(0, width * width):
+            x, y = coordinates[node]
+            if x + 1 < width:
+                grid_edges.append((node, node + 1, 1))
+            if y + 1 < width:
+                grid_edges.append((node, node + width, 1))
+        graph = CompressedSparseRowGraph(width * width, edge_tuples=grid_edges, is_directed=False, is_weighted=True)
+
+        start_index = width * 10
+        end_index = width * 10 + width - 1
+
+        dijkstra_path, dijkstra_distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)
+        dijkstra_settled_node_count = graph.settled_node_count
+
+        path, distance = graph.shortestPathBetweenTwoNodesUsingAStar(start_index, end_index, getEuclideanHeuristic(coordinates))
+        self.assertEqual(distance, dijkstra_distance)
+        self.assertEqual(len(path), len(dijkstra_path))
+        self.assertLess(graph.settled_node_count, dijkstra_settled_node_count)
+
+        graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=True, is_weighted=True)
+        path, distance = graph.shortestPathBetweenTwoNodesUsingAStar(0, 2, lambda node_index, end_node_index : 0)
+        self.assertEqual(path, None)
+        self.assertEqual(distance, None)
+
+    def test_repeated_edges_match_graph(self):
+        '''
+        This method tests that the point to point engines find the same path and distance as the graph when an edge is repeated with a lighter weight
+        '''
+
+        edge_list = [(0,1,5),(0,1,2),(1,2,1),(2,3,4),(2,3,7)]
+        for is_directed in [True, False]:
+            graph = Graph(number_of_nodes=4, edge_tuples=edge_list, is_directed=is_directed, is_weighted=True)
+            compressed_graph = graph.getCompressedSparseRow()
+
+            for start_index in range(0, 4):
+                for end_index in range(0, 4):
+                    expected_result = graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)
+                    self.assertEqual(compressed_graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index), expected_result)
+                    self.assertEqual(compressed_graph.shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(start_index, end_index), expected_result)
+                    self.assertEqual(compressed_graph.shortestPathBetweenTwoNodesUsingAStar(start_index, end_index, lambda node_index, end_node_index : 0), expected_result)
+                    self.assertEqual(findPathsFromSources(compressed_graph, [(start_index, [end_index])])[0][0], expected_result)
+
+            self.assertEqual(graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 3), ([0, 1, 2, 3], 7))
+            self.assertSearchesMatch(lambda start_index : graph.shortestPathsFromNodeUsingDijkstra(start_index)[0], lambda start_index : graph.shortestPathFromNodeUsingBellmanFord(start_index)[0], number_of_nodes=4)
+
+    def test_save_and_load(self):
+        '''
+        This method tests that a graph loaded from a file, memory mapped or copied, has the same rows and search results as the saved graph
+        '''
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.csr")
+
+            for is_directed in [False, True]:
+                graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=is_directed, is_weighted=True)
+                graph.save(path)
+
+                header = readGraphFileHeader(path)
+                self.assertEqual(header["number_of_nodes"], self.number_of_nodes)
+                self.assertEqual(header["edge_count"], 13)
+                self.assertEqual(os.path.getsize(path), header["array_positions"]["edge_weights"][0] + 8 * 13)
+
+                for is_memory_mapped in [True, False]:
+                    loaded_graph = CompressedSparseRowGraph.load(path, mmap=is_memory_mapped)
+
+                    self.assertEqual(loaded_graph.is_directed, is_directed)
+                    self.assertListEqual(list(loaded_graph.offsets), list(graph.offsets))
+                    self.assertListEqual(list(loaded_graph.targets), list(graph.targets))
+                    self.assertListEqual(list(loaded_graph.target_weights), list(graph.target_weights))
+                    self.assertEqual(loaded_graph.getMemoryUsage(), graph.getMemoryUsage())
+                    self.assertEqual(loaded_graph.traverseGraph(), graph.traverseGraph())
+                    self.assertSearchesMatch(loaded_graph.shortestPathsFromNodeUsingDijkstra, graph.shortestPathsFromNodeUsingDijkstra)
+                    self.assertSearchesMatch(lambda start_index : loaded_graph.shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(start_index, 5), lambda start_index : graph.shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(start_index, 5))
+
+                    loaded_graph = None
+
+    def test_save_and_load_float_weights(self):
+        '''
+        This method tests that float weights are kept when a graph is saved and memory mapped
+        '''
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.csr")
+
+            graph = CompressedSparseRowGraph(3, edge_tuples=[(0,1,0.5),(1,2,1.25)], is_directed=True, is_weighted=True)
+            graph.save(path)
+            loaded_graph = CompressedSparseRowGraph.load(path)
+
+            self.assertEqual(loaded_graph.weight_typecode, 'd')
+            self.assertEqual(loaded_graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 2), ([0, 1, 2], 1.75))
+            loaded_graph = None
+
+    def test_delta_stepping_matches_dijkstra(self):
+        '''
+        This method tests that delta stepping finds the same distances as dijkstra with several bucket widths, in this process and with workers,
+        including on repeated edges, and that each parent is on a shortest route
+        '''
+
+        float_edge_list = [(start, end, weight / 4) for start, end, weight in self.weighted_edge_list]
+        repeated_edge_list = self.weighted_edge_list + [(0,1,5),(2,4,1),(6,3,9),(2,4,3)]
+        original_minimum_nodes_per_worker = DeltaStepping.MINIMUM_NODES_PER_WORKER
+        DeltaStepping.MINIMUM_NODES_PER_WORKER = 1
+        try:
+            for edge_list in [self.weighted_edge_list, float_edge_list, repeated_edge_list]:
+                for is_directed in [True, False]:
+                    graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=edge_list, is_directed=is_directed, is_weighted=True)
+                    weights = {}
+                    for start, end, weight in edge_list:
+                        weights[(start, end)] = min(weight, weights.get((start, end), weight))
+                        if not is_directed:
+                            weights[(end, start)] = weights[(start, end)]
+
+                    for start_index in [0, 2, 9]:
+                        dijkstra_distances, _ = graph.shortestPathsFromNodeUsingDijkstra(start_index)
+                        for delta, n_workers in [(None, 1), (0.5, 1), (3, 1), (100, 1), (1, 2)]:
+                            distances, parents = graph.shortestPathsFromNodeUsingDeltaStepping(start_index, delta=delta, n_workers=n_workers)
+                            self.assertListEqual(distances, dijkstra_distances)
+                            for node in range(0, self.number_of_nodes):
+                                if distances[node] == None or node == start_index:
+                                    self.assertEqual(parents[node], None)
+                                else:
+                                    self.assertEqual(distances[parents[node]] + weights[(parents[node], node)], distances[node])
+        finally:
+            DeltaStepping.MINIMUM_NODES_PER_WORKER = original_minimum_nodes_per_worker
+
+        graph = CompressedSparseRowGraph(3, edge_tuples=[(0,1,1),(1,2,-1)], is_directed=True, is_weighted=True)
+        with self.assertRaises(ValueError):
+            graph.shortestPathsFromNodeUsingDeltaStepping(0)
+
+    def test_delta_stepping_worker_pool(self):
+        '''
+        This method tests that one pool of delta stepping workers can be shared by several searches and is refused for another graph
+        '''
+
+        graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=False, is_weighted=True)
+        other_graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=True, is_weighted=True)
+        original_minimum_nodes_per_worker = DeltaStepping.MINIMUM_NODES_PER_WORKER
+        DeltaStepping.MINIMUM_NODES_PER_WORKER = 1
+        try:
+            with graph.createDeltaSteppingWorkerPool(2) as worker_pool:
+                pool = worker_pool.pool
+                for start_index in range(0, self.number_of_nodes):
+                    for delta in [None, 1, 3]:
+                        distances, _ = graph.shortestPathsFromNodeUsingDeltaStepping(start_index, delta=delta, worker_pool=worker_pool)
+                        self.assertListEqual(distances, graph.shortestPathsFromNodeUsingDijkstra(start_index)[0])
+                self.assertIs(worker_pool.pool, pool)
+                with self.assertRaises(ValueError):
+                    other_graph.shortestPathsFromNodeUsingDeltaStepping(0, worker_pool=worker_pool)
+            self.assertEqual(worker_pool.pool, None)
+        finally:
+            DeltaStepping.MINIMUM_NODES_PER_WORKER = original_minimum_nodes_per_worker
+
+    def test_bitset_breadth_first_search(self):
+        '''
+        This method tests that top down, bottom up and switching breadth first searches give the parents of the queue based visit
+        on a graph with repeated and self loop edges
+        '''
+
+        edge_list = self.edge_list + [(1,6),(3,3),(4,2),(8,7)]
+        for is_directed in [False, True]:
+            graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=edge_list, is_directed=is_directed)
+            for start_index in range(0, self.number_of_nodes):
+                graph.resetTraversalInformation()
+                graph.node_visit(start_index)
+
+                for alpha, beta, expected_direction in [(0.001, 24, "Top Down"), (float("inf"), float("inf"), "Bottom Up"), (0.5, 3, None)]:
+                    parents, levels = graph.breadthFirstSearchUsingBitsets(start_index, alpha=alpha, beta=beta)
+                    self.assertListEqual(parents, graph.parents)
+                    for node_number in range(0, self.number_of_nodes):
+                        self.assertEqual(levels[node_number] == None, graph.discovered_times[node_number] == None)
+
+                    # a start node without edges has no frontier edges, so even the bottom up search takes its one step top down
+                    if expected_direction != None and graph.getNeighbors(start_index)[0]:
+                        self.assertTrue(all(direction == expected_direction for direction in graph.breadth_first_step_directions))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,298 @@
+import heapq
+
+class ContractionHierarchy():
+    '''
+    This class serves as a contraction hierarchy, which preprocesses a static weighted graph so point to point shortest path queries are fast
+
+    The nodes are contracted one at a time in order of importance, and whenever removing a node would lengthen the shortest path between two of
+    its neighbors a shortcut edge is added between them. A query then searches upward in the order from the start node and from the end node,
+    and the shortcuts on the best route are unpacked back into the original edges
+
+    The edge weights must not be negative
+    '''
+
+    def __init__(self, graph, maximum_settled_nodes=100):
+        '''
+        This method initializes the contraction hierarchy by contracting every node of a graph
+
+        Parameters :
+            graph : Graph
+                The graph being preprocessed, whose adjacency lists are read so the same edges are used as by its dijkstra's algorithm
+            maximum_settled_nodes : int, optional
+                The most nodes each witness search may settle before a shortcut is added anyway (default is 100)
+        '''
+
+        self.number_of_nodes = graph.number_of_nodes
+        self.maximum_settled_nodes = maximum_settled_nodes
+
+        # the remaining graph during contraction, as {neighbor:(weight, middle node)} for each node, where the middle node is None for original edges
+        self.outgoing_edges = [{} for _ in range(0, self.number_of_nodes)]
+        self.incoming_edges = [{} for _ in range(0, self.number_of_nodes)]
+        for node_number in range(0, self.number_of_nodes):
+            node = graph.nodes[node_number]
+            for neighbor_number, weight in zip(node.connected_nodes, node.connected_edge_weights):
+                if weight < 0:
+                    raise ValueError("A contraction hierarchy can not be built for a graph with negative edge weights")
+                if neighbor_number != node_number:
+                    self.outgoing_edges[node_number][neighbor_number] = (weight, None)
+                    self.incoming_edges[neighbor_number][node_number] = (weight, None)
+
+        self.ranks = [None] * self.number_of_nodes
+        self.upward_edges = [[] for _ in range(0, self.number_of_nodes)]
+        self.downward_edges = [[] for _ in range(0, self.number_of_nodes)]
+        self.edge_middles = {}
+        self.shortcut_count = 0
+        self.settled_node_count = 0
+
+        self.contractNodes()
+
+        self.outgoing_edges = None
+        self.incoming_edges = None
+
+    def findWitnessDistances(self, start_node, skipped_node, target_distances):
+        '''
+        This method searches the remaining graph from a node, without passing through the node being contracted, for paths to its other neighbors
+
+        The search stops once every target is settled, the next distance is beyond the furthest target, or too many nodes are settled
+
+        Parameters :
+            start_node : int
+                The neighbor the search starts at
+            skipped_node : int
+                The node being contracted
+            target_distances : {int:int}
+                The distance through the contracted node to each of its other neighbors
+
+        Returns :
+            witness_distances : {int:int}
+                The shortest distance found to each node reached
+        '''
+
+        maximum_distance = max(target_distances.values())
+        remaining_targets = len(target_distances)
+        witness_distances = {start_node: 0}
+        is_settled = set()
+        priority_queue = [(0, start_node)]
+
+        while priority_queue and len(is_settled) < self.maximum_settled_nodes:
+            current_distance, current_node = heapq.heappop(priority_queue)
+            if current_node in is_settled:
+                continue
+            if current_distance > maximum_distance:
+                break
+            is_settled.add(current_node)
+            if current_node in target_distances:
+                remaining_targets -= 1
+                if remaining_targets == 0:
+                    break
+
+            for neighbor, (weight, _) in self.outgoing_edges[current_node].items():
+                if neighbor == skipped_node:
+                    continue
+                new_distance = current_distance + weight
+                if new_distance <= maximum_distance and (neighbor not in witness_distances or new_distance < witness_distances[neighbor]):
+                    witness_distances[neighbor] = new_distance
+                    heapq.heappush(priority_queue, (new_distance, neighbor))
+
+        return witness_distances
+
+    def findShortcuts(self, node_number):
+        '''
+        This method finds the shortcuts needed to contract a node, which are the routes through it with no witness path of equal or shorter length
+
+        Parameters :
+            node_number : int
+                The node being contracted
+
+        Returns :
+            shortcuts : [(int,int,int)]
+                The start node, end node and weight of each shortcut through the node
+        '''
+
+        outgoing_edges = self.outgoing_edges[node_number]
+        shortcuts = []
+
+        for incoming_neighbor, (incoming_weight, _) in self.incoming_edges[node_number].items():
+            target_distances = {}
+            for outgoing_neighbor, (outgoing_weight, _) in outgoing_edges.items():
+                if outgoing_neighbor != incoming_neighbor:
+                    target_distances[outgoing_neighbor] = incoming_weight + outgoing_weight
+            if not target_distances:
+                continue
+
+            witness_distances = self.findWitnessDistances(incoming_neighbor, node_number, target_distances)
+            for outgoing_neighbor, shortcut_weight in target_distances.items():
+                witness_distance = witness_distances.get(outgoing_neighbor)
+                if witness_distance == None or witness_distance > shortcut_weight:
+                    shortcuts.append((incoming_neighbor, outgoing_neighbor, shortcut_weight))
+
+        return shortcuts
+
+    def getContractionPriority(self, node_number, contracted_neighbor_counts):
+        '''
+        This method estimates how costly it is to contract a node now, as the shortcuts it adds less the edges it removes plus its contracted neighbors
+
+        Parameters :
+            node_number : int
+                The node being considered
+            contracted_neighbor_counts : [int]
+                How many neighbors of each node have already been contracted
+
+        Returns :
+            priority : int
+                The node's priority, where lower values are contracted first
+            shortcuts : [(int,int,int)]
+                The shortcuts which contracting the node now would add
+        '''
+
+        shortcuts = self.findShortcuts(node_number)
+        removed_edge_count = len(self.outgoing_edges[node_number]) + len(self.incoming_edges[node_number])
+        return len(shortcuts) - removed_edge_count + contracted_neighbor_counts[node_number], shortcuts
+
+    def contractNodes(self):
+        '''
+        This method contracts every node in order of priority, updating the priorities lazily as nodes are taken from the queue
+
+        Each contracted node's remaining edges become its upward (outgoing) and downward (incoming) edges, as they all lead to nodes contracted later
+        '''
+
+        contracted_neighbor_counts = [0] * self.number_of_nodes
+        priority_queue = [(self.getContractionPriority(node_number, contracted_neighbor_counts)[0], node_number) for node_number in range(0, self.number_of_nodes)]
+        heapq.heapify(priority_queue)
+        next_rank = 0
+
+        while priority_queue:
+            _, node_number = heapq.heappop(priority_queue)
+            priority, shortcuts = self.getContractionPriority(node_number, contracted_neighbor_counts)
+            if priority_queue and priority > priority_queue[0][0]:
+                heapq.heappush(priority_queue, (priority, node_number))
+                continue
+
+            self.ranks[node_number] = next_rank
+            next_rank += 1
+
+            for neighbor, (weight, middle) in self.outgoing_edges[node_number].items():
+                self.upward_edges[node_number].append((neighbor, weight))
+                self.edge_middles[(node_number, neighbor)] = middle
+                del self.incoming_edges[neighbor][node_number]
+                contracted_neighbor_counts[neighbor] += 1
+            for neighbor, (weight, middle) in self.incoming_edges[node_number].items():
+                self.downward_edges[node_number].append((neighbor, weight))
+                self.edge_middles[(neighbor, node_number)] = middle
+                del self.outgoing_edges[neighbor][node_number]
+                contracted_neighbor_counts[neighbor] += 1
+            self.outgoing_edges[node_number] = {}
+            self.incoming_edges[node_number] = {}
+
+            for start_node, end_node, weight in shortcuts:
+                existing_edge = self.outgoing_edges[start_node].get(end_node)
+                if existing_edge == None or weight < existing_edge[0]:
+                    self.outgoing_edges[start_node][end_node] = (weight, node_number)
+                    self.incoming_edges[end_node][start_node] = (weight, node_number)
+                    self.shortcut_count += 1
+
+    def unpackEdge(self, start_node, end_node):
+        '''
+        This method replaces an edge of the hierarchy with the original edges it stands for, expanding shortcuts with an explicit stack
+
+        Parameters :
+            start_node : int
+                The start of the edge
+            end_node : int
+                The end of the edge
+
+        Returns :
+            path : [int]
+                The nodes from the start node to the end node, not including the start node
+        '''
+
+        path = []
+        stack = [(start_node, end_node)]
+        while stack:
+            edge_start, edge_end = stack.pop()
+            middle = self.edge_middles[(edge_start, edge_end)]
+            if middle == None:
+                path.append(edge_end)
+            else:
+                stack.append((middle, edge_end))
+                stack.append((edge_start, middle))
+        return path
+
+    def shortestPathBetweenTwoNodes(self, start_node_index, end_node_index):
+        '''
+        This method finds the shortest path between a given start node and a given end node
+
+        A forward search from the start node follows only upward edges and a backward search from the end node follows only downward edges in reverse,
+        so both climb the order and meet at the highest node of the shortest path
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+
+        Returns :
+            path : [int]
+                the path of nodes to reach the end node (None if it can not be reached)
+            distance : int
+                The distance of the path to the end node (None if it can not be reached)
+        '''
+
+        # index 0 holds the forward search from the start and index 1 holds the backward search from the end
+        edges = [self.upward_edges, self.downward_edges]
+        distances = [{start_node_index: 0}, {end_node_index: 0}]
+        parents = [{start_node_index: None}, {end_node_index: None}]
+        is_settled = [set(), set()]
+        priority_queues = [[(0, start_node_index)], [(0, end_node_index)]]
+
+        best_distance = None
+        meeting_node = None
+
+        while priority_queues[0] or priority_queues[1]:
+            side = 0 if priority_queues[0] and (not priority_queues[1] or priority_queues[0][0][0] <= priority_queues[1][0][0]) else 1
+            current_distance, current_node = heapq.heappop(priority_queues[side])
+            if best_distance != None and current_distance >= best_distance:
+                priority_queues[side] = []
+                continue
+            if current_node in is_settled[side]:
+                continue
+            is_settled[side].add(current_node)
+
+            other_distance = distances[1 - side].get(current_node)
+            if other_distance != None and (best_distance == None or current_distance + other_distance < best_distance):
+                best_distance = current_distance + other_distance
+                meeting_node = current_node
+
+            side_distances = distances[side]
+            side_parents = parents[side]
+            for neighbor, weight in edges[side][current_node]:
+                new_distance = current_distance + weight
+                if neighbor not in side_distances or new_distance < side_distances[neighbor]:
+                    side_distances[neighbor] = new_distance
+                    side_parents[neighbor] = current_node
+                    heapq.heappush(priority_queues[side], (new_distance, neighbor))
+
+        self.settled_node_count = len(is_settled[0]) + len(is_settled[1])
+
+        if best_distance == None:
+            return None, None
+
+        forward_nodes = []
+        node = meeting_node
+        while node != None:
+            forward_nodes.append(node)
+            node = parents[0][node]
+        forward_nodes.reverse()
+
+        path = [start_node_index]
+        for i in range(1, len(forward_nodes)):
+            path.extend(self.unpackEdge(forward_nodes[i - 1], forward_nodes[i]))
+
+        node = meeting_node
+        parent = parents[1][node]
+        while parent != None:
+            path.extend(self.unpackEdge(node, parent))
+            node = parent
+            parent = parents[1][node]
+
+        return path, best_distance
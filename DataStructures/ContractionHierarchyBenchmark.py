@@ -0,0 +1,155 @@
+import math
+import random
+import time
+from Graph import Graph
+
+def createGridGraph(width, seed=0):
+    '''
+    This function creates an undirected square grid graph with random edge weights
+
+    Parameters :
+        width : int
+            The number of nodes along each side of the grid
+        seed : int, optional
+            The seed for the random weights (default is 0)
+
+    Returns :
+        graph : Graph
+            The grid graph
+    '''
+
+    randomizer = random.Random(seed)
+    edges = []
+    for node in range(0, width * width):
+        if node % width + 1 < width:
+            edges.append((node, node + 1, randomizer.randint(1, 10)))
+        if node // width + 1 < width:
+            edges.append((node, node + width, randomizer.randint(1, 10)))
+
+    return Graph(number_of_nodes=width * width, edge_tuples=edges, is_directed=False, is_weighted=True)
+
+def createRoadLikeGraph(number_of_nodes, neighbor_count=3, seed=0):
+    '''
+    This function creates an undirected graph resembling a road network, by joining random points to their nearest neighbors
+
+    The points are placed in a unit square and bucketed into cells, each point is joined to its nearest neighbors in the surrounding cells,
+    and the weight of each edge is its length
+
+    Parameters :
+        number_of_nodes : int
+            The number of points
+        neighbor_count : int, optional
+            How many of its nearest points each point is joined to (default is 3)
+        seed : int, optional
+            The seed for the random points (default is 0)
+
+    Returns :
+        graph : Graph
+            The road like graph
+    '''
+
+    randomizer = random.Random(seed)
+    coordinates = [(randomizer.random(), randomizer.random()) for _ in range(0, number_of_nodes)]
+
+    cell_count = max(1, int(math.sqrt(number_of_nodes / 2)))
+    cells = {}
+    for node in range(0, number_of_nodes):
+        x, y = coordinates[node]
+        cells.setdefault((int(x * cell_count), int(y * cell_count)), []).append(node)
+
+    edges = set()
+    for node in range(0, number_of_nodes):
+        x, y = coordinates[node]
+        cell_x, cell_y = int(x * cell_count), int(y * cell_count)
+        candidates = []
+        for nearby_x in range(cell_x - 1, cell_x + 2):
+            for nearby_y in range(cell_y - 1, cell_y + 2):
+                for other in cells.get((nearby_x, nearby_y), []):
+                    if other != node:
+                        candidates.append((math.dist(coordinates[node], coordinates[other]), other))
+        candidates.sort()
+        for distance, other in candidates[0:neighbor_count]:
+            edges.add((min(node, other), max(node, other), int(distance * 10000) + 1))
+
+    return Graph(number_of_nodes=number_of_nodes, edge_tuples=sorted(edges), is_directed=False, is_weighted=True)
+
+def measureQueryDurations(graph, query_count=50, seed=0):
+    '''
+    This function measures the preprocessing time of a graph's contraction hierarchy and the average query time compared with dijkstra's algorithm
+
+    Parameters :
+        graph : Graph
+            The graph being measured
+        query_count : int, optional
+            The number of random point to point queries (default is 50)
+        seed : int, optional
+            The seed for the random queries (default is 0)
+
+    Returns :
+        preprocessing_duration : float
+            The number of seconds taken to build the contraction hierarchy
+        shortcut_count : int
+            The number of shortcuts added
+        dijkstra_duration : float
+            The average number of seconds for a dijkstra query
+        contraction_hierarchy_duration : float
+            The average number of seconds for a contraction hierarchy query
+    '''
+
+    randomizer = random.Random(seed)
+    queries = [(randomizer.randrange(graph.number_of_nodes), randomizer.randrange(graph.number_of_nodes)) for _ in range(0, query_count)]
+
+    start = time.perf_counter()
+    contraction_hierarchy = graph.getContractionHierarchy()
+    preprocessing_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dijkstra_distances = [graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)[1] for start_index, end_index in queries]
+    dijkstra_duration = (time.perf_counter() - start) / query_count
+
+    start = time.perf_counter()
+    contraction_hierarchy_distances = [graph.shortestPathBetweenTwoNodesUsingContractionHierarchy(start_index, end_index)[1] for start_index, end_index in queries]
+    contraction_hierarchy_duration = (time.perf_counter() - start) / query_count
+
+    if dijkstra_distances != contraction_hierarchy_distances:
+        print("The contraction hierarchy distances do not match dijkstra's algorithm")
+
+    return preprocessing_duration, contraction_hierarchy.shortcut_count, dijkstra_duration, contraction_hierarchy_duration
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    graph_types = []
+    node_counts = []
+    edge_counts = []
+    preprocessing_durations = []
+    shortcut_counts = []
+    dijkstra_durations = []
+    contraction_hierarchy_durations = []
+
+    for graph_type, graph in [("Grid", createGridGraph(32)), ("Grid", createGridGraph(64)), ("Grid", createGridGraph(100)),
+                              ("Road Like", createRoadLikeGraph(1000)), ("Road Like", createRoadLikeGraph(4000)), ("Road Like", createRoadLikeGraph(10000))]:
+        preprocessing_duration, shortcut_count, dijkstra_duration, contraction_hierarchy_duration = measureQueryDurations(graph)
+        graph_types.append(graph_type)
+        node_counts.append(graph.number_of_nodes)
+        edge_counts.append(len(graph.weighted_edges))
+        preprocessing_durations.append(preprocessing_duration)
+        shortcut_counts.append(shortcut_count)
+        dijkstra_durations.append(dijkstra_duration * 1000)
+        contraction_hierarchy_durations.append(contraction_hierarchy_duration * 1000)
+
+    dictionary = {
+        "Graph": graph_types,
+        "Nodes": node_counts,
+        "Edges": edge_counts,
+        "Preprocessing Seconds": preprocessing_durations,
+        "Shortcuts": shortcut_counts,
+        "Dijkstra Query Milliseconds": dijkstra_durations,
+        "Hierarchy Query Milliseconds": contraction_hierarchy_durations
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    dataframe["Speedup"] = dataframe["Dijkstra Query Milliseconds"] / dataframe["Hierarchy Query Milliseconds"]
+    pd.options.display.width = 200
+    pd.options.display.max_columns = None
+    print(dataframe)
@@ -0,0 +1,128 @@
+import unittest
+from Graph import Graph
+from ContractionHierarchy import ContractionHierarchy
+
+class ContractionHierarchyUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for the contraction hierarchy
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up the edge list to be used with the following unit tests
+
+        Number of nodes : 10
+        Number of edges : 13
+        '''
+
+        self.weighted_edge_list = [(0,1,2),(2,1,1),(2,3,4),(3,4,6),(4,5,3),(5,6,2),(1,6,1),(6,3,3),(2,4,4),(2,5,2),(7,8,5),(9,8,2),(9,7,1)]
+
+        self.number_of_nodes = 10
+
+    def assertIsShortestPath(self, graph, path, distance, start_index, end_index):
+        '''
+        This method checks that a path runs between two nodes along the graph's edges and that its weight matches the distance
+
+        Parameters :
+            graph : Graph
+                The graph the path belongs to
+            path : [int]
+                The path being checked
+            distance : int
+                The distance reported for the path
+            start_index : int
+                The start node of the path
+            end_index : int
+                The end node of the path
+        '''
+
+        self.assertEqual(path[0], start_index)
+        self.assertEqual(path[-1], end_index)
+        path_weight = 0
+        for i in range(1, len(path)):
+            node = graph.nodes[path[i - 1]]
+            path_weight += node.connected_edge_weights[node.connected_nodes.index(path[i])]
+        self.assertEqual(path_weight, distance)
+
+    def test_matches_dijkstra(self):
+        '''
+        This method tests contraction hierarchy queries against dijkstra for weighted, directed and undirected graphs
+        '''
+
+        for is_directed in [False, True]:
+            graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=is_directed, is_weighted=True)
+
+            for start_index in range(0, self.number_of_nodes):
+                for end_index in range(0, self.number_of_nodes):
+                    dijkstra_path, dijkstra_distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)
+                    path, distance = graph.shortestPathBetweenTwoNodesUsingContractionHierarchy(start_index, end_index)
+
+                    self.assertEqual(distance, dijkstra_distance)
+                    if dijkstra_path == None:
+                        self.assertEqual(path, None)
+                    else:
+                        self.assertIsShortestPath(graph, path, distance, start_index, end_index)
+
+    def test_shortcuts_on_path(self):
+        '''
+        This method tests that shortcuts are added when a path is contracted and that they are unpacked in queries
+        '''
+
+        path_length = 50
+        graph = Graph(number_of_nodes=path_length, edge_tuples=[(i, i+1, 1) for i in range(0, path_length - 1)], is_directed=True, is_weighted=True)
+        contraction_hierarchy = ContractionHierarchy(graph)
+
+        self.assertGreater(contraction_hierarchy.shortcut_count, 0)
+        path, distance = contraction_hierarchy.shortestPathBetweenTwoNodes(0, path_length - 1)
+        self.assertListEqual(path, list(range(0, path_length)))
+        self.assertEqual(distance, path_length - 1)
+        self.assertLess(contraction_hierarchy.settled_node_count, path_length)
+        self.assertEqual(contraction_hierarchy.shortestPathBetweenTwoNodes(path_length - 1, 0), (None, None))
+
+    def test_rebuilt_after_edge_added(self):
+        '''
+        This method tests that the graph's contraction hierarchy is rebuilt after an edge is added
+        '''
+
+        graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=True, is_weighted=True)
+
+        self.assertEqual(graph.shortestPathBetweenTwoNodesUsingContractionHierarchy(0, 8), (None, None))
+        contraction_hierarchy = graph.getContractionHierarchy()
+        self.assertIs(graph.getContractionHierarchy(), contraction_hierarchy)
+
+        graph.addWeightedEdge(6, 9, 1)
+        self.assertIsNot(graph.getContractionHierarchy(), contraction_hierarchy)
+        self.assertEqual(graph.shortestPathBetweenTwoNodesUsingContractionHierarchy(0, 8), ([0, 1, 6, 9, 8], 6))
+
+    def test_rebuilt_for_witness_search_limit(self):
+        '''
+        This method tests that the graph's contraction hierarchy is rebuilt when it is asked for with a different witness search limit,
+        and that queries keep the hierarchy which was last built
+        '''
+
+        graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=False, is_weighted=True)
+
+        contraction_hierarchy = graph.getContractionHierarchy()
+        self.assertEqual(contraction_hierarchy.maximum_settled_nodes, 100)
+        self.assertIs(graph.getContractionHierarchy(100), contraction_hierarchy)
+
+        limited_hierarchy = graph.getContractionHierarchy(1)
+        self.assertIsNot(limited_hierarchy, contraction_hierarchy)
+        self.assertEqual(limited_hierarchy.maximum_settled_nodes, 1)
+        self.assertIs(graph.getContractionHierarchy(), limited_hierarchy)
+        for end_index in range(0, self.number_of_nodes):
+            self.assertEqual(graph.shortestPathBetweenTwoNodesUsingContractionHierarchy(0, end_index)[1], graph.shortestPathBetweenTwoNodesUsingDijkstra(0, end_index)[1])
+        self.assertIs(graph.getContractionHierarchy(), limited_hierarchy)
+
+    def test_negative_edge(self):
+        '''
+        This method tests that a contraction hierarchy is not built for a graph with a negative edge
+        '''
+
+        graph = Graph(number_of_nodes=3, edge_tuples=[(0,1,1),(1,2,-1)], is_directed=True, is_weighted=True)
+
+        with self.assertRaises(ValueError):
+            ContractionHierarchy(graph)
+
+if __name__ == '__main__':
+    unittest.main()
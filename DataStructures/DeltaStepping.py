@@ -0,0 +1,312 @@
+import multiprocessing
+import numpy as np
+from ParallelShortestPaths import getPoolContext
+
+# the smallest number of frontier nodes given to each worker, below which a phase is relaxed in the coordinating process
+MINIMUM_NODES_PER_WORKER = 2048
+
+# the compressed sparse row arrays and the shared distances seen by each worker process when the pool starts
+worker_offsets = None
+worker_targets = None
+worker_target_weights = None
+worker_distances = None
+
+def getEdgeRequests(offsets, targets, target_weights, distances, frontier, delta, is_light):
+    '''
+    This function finds the relaxation requests from a frontier of nodes along either their light or their heavy edges
+
+    Every edge of every frontier node is gathered at once, and only the requests which would shorten the current distance are kept
+
+    Parameters :
+        offsets : ndarray
+            The compressed sparse row offsets of the graph
+        targets : ndarray
+            The compressed sparse row targets of the graph
+        target_weights : ndarray
+            The weight of the edge to each target as float64 values
+        distances : ndarray
+            The current tentative distance of every node (inf if it has not been reached)
+        frontier : ndarray
+            The nodes whose edges are relaxed
+        delta : float
+            The bucket width, where edges no heavier than delta are light
+        is_light : Boolean
+            Whether the light edges are relaxed rather than the heavy edges
+
+    Returns :
+        request_ends : ndarray
+            The node each request would shorten the route to
+        request_distances : ndarray
+            The distance each request offers
+        request_starts : ndarray
+            The frontier node each request comes from
+    '''
+
+    row_starts = offsets[frontier]
+    row_lengths = offsets[frontier + 1] - row_starts
+    edge_count = int(row_lengths.sum())
+
+    # the position of every edge of the frontier, built without a python loop by offsetting a single range per row
+    positions = np.arange(edge_count, dtype=np.int64) + np.repeat(row_starts - (np.cumsum(row_lengths) - row_lengths), row_lengths)
+    request_starts = np.repeat(frontier, row_lengths)
+    weights = target_weights[positions]
+
+    is_kept = weights <= delta if is_light else weights > delta
+    positions = positions[is_kept]
+    request_starts = request_starts[is_kept]
+    request_ends = targets[positions]
+    request_distances = distances[request_starts] + weights[is_kept]
+
+    is_shorter = request_distances < distances[request_ends]
+    return request_ends[is_shorter], request_distances[is_shorter], request_starts[is_shorter]
+
+def initializeWorker(offsets, targets, target_weights, shared_distances):
+    '''
+    This function stores the graph arrays and the shared distances in a worker process
+
+    Parameters :
+        offsets : ndarray
+            The compressed sparse row offsets of the graph
+        targets : ndarray
+            The compressed sparse row targets of the graph
+        target_weights : ndarray
+            The weight of the edge to each target as float64 values
+        shared_distances : RawArray
+            The tentative distances, written by the coordinating process and read by the workers
+    '''
+
+    global worker_offsets, worker_targets, worker_target_weights, worker_distances
+    worker_offsets = offsets
+    worker_targets = targets
+    worker_target_weights = target_weights
+    worker_distances = np.frombuffer(shared_distances, dtype=np.float64)
+
+def getEdgeRequestsForBlock(request_block):
+    '''
+    This function finds the relaxation requests for a block of the frontier in a worker process
+
+    Parameters :
+        request_block : (ndarray, float, Boolean)
+            The frontier nodes of the block, the bucket width and whether the light edges are relaxed
+
+    Returns :
+        request_ends : ndarray
+            The node each request would shorten the route to
+        request_distances : ndarray
+            The distance each request offers
+        request_starts : ndarray
+            The frontier node each request comes from
+    '''
+
+    frontier, delta, is_light = request_block
+    return getEdgeRequests(worker_offsets, worker_targets, worker_target_weights, worker_distances, frontier, delta, is_light)
+
+def getDefaultDelta(target_weights, number_of_nodes):
+    '''
+    This function chooses a bucket width as the heaviest edge weight divided by the average number of edges per node
+
+    Parameters :
+        target_weights : ndarray
+            The weight of the edge to each target as float64 values
+        number_of_nodes : int
+            The number of nodes in the graph
+
+    Returns :
+        delta : float
+            The bucket width
+    '''
+
+    if len(target_weights) == 0:
+        return 1.0
+    delta = float(target_weights.max()) / max(1.0, len(target_weights) / max(1, number_of_nodes))
+    return delta if delta > 0 else 1.0
+
+def getSearchArrays(compressed_graph):
+    '''
+    This function views the compressed sparse row arrays of a graph as numpy arrays, with the weights as float64 values
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being searched
+
+    Returns :
+        offsets : ndarray
+            The compressed sparse row offsets of the graph
+        targets : ndarray
+            The compressed sparse row targets of the graph
+        target_weights : ndarray
+            The weight of the edge to each target as float64 values
+    '''
+
+    offsets = np.frombuffer(compressed_graph.offsets, dtype=np.int64)
+    targets = np.frombuffer(compressed_graph.targets, dtype=np.int64)
+    target_weights = np.frombuffer(compressed_graph.target_weights, dtype=np.int64 if compressed_graph.weight_typecode == 'q' else np.float64).astype(np.float64)
+    return offsets, targets, target_weights
+
+class DeltaSteppingWorkerPool():
+    '''
+    This class holds a pool of worker processes for delta stepping searches on one graph, so several searches can share the same workers
+    rather than each search starting and stopping its own
+
+    The workers receive the graph's arrays and a distances array shared with the coordinating process once, when the pool starts,
+    and it should be closed with close, or by using it in a with statement, once it is no longer needed
+    '''
+
+    def __init__(self, compressed_graph, n_workers):
+        '''
+        This method starts the worker processes
+
+        Parameters :
+            compressed_graph : CompressedSparseRowGraph
+                The graph the workers search
+            n_workers : int
+                The number of worker processes
+        '''
+
+        self.compressed_graph = compressed_graph
+        self.n_workers = n_workers
+        self.offsets, self.targets, self.target_weights = getSearchArrays(compressed_graph)
+        self.shared_distances = multiprocessing.RawArray('d', compressed_graph.number_of_nodes)
+        self.pool = getPoolContext().Pool(processes=n_workers, initializer=initializeWorker, initargs=(self.offsets, self.targets, self.target_weights, self.shared_distances))
+
+    def close(self):
+        '''
+        This method stops the worker processes
+        '''
+
+        if self.pool != None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self):
+        '''
+        This method returns the worker pool at the start of a with statement
+
+        Returns :
+            worker_pool : DeltaSteppingWorkerPool
+                The worker pool
+        '''
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        '''
+        This method stops the worker processes at the end of a with statement
+        '''
+
+        self.close()
+
+def findShortestPathsUsingDeltaStepping(compressed_graph, start_node_index, delta=None, n_workers=1, worker_pool=None):
+    '''
+    This function calculates the shortest distance from a starting node to every other node using delta stepping
+
+    The nodes are kept in buckets of width delta by tentative distance. The lowest bucket is emptied by relaxing the light edges of all of its nodes
+    at once, repeatedly, as nodes may fall back into it, and then the heavy edges of every node removed from it are relaxed once, which settles it
+    With more than one worker, large frontiers are split into blocks whose requests are found in worker processes reading the shared distances
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being searched, which must not have negative edge weights
+        start_node_index : int
+            The index of the node that each node's distance is being calculated from
+        delta : float, optional
+            The bucket width (default is None, which uses getDefaultDelta)
+        n_workers : int, optional
+            The number of worker processes finding requests (default is 1, which works in this process)
+        worker_pool : DeltaSteppingWorkerPool, optional
+            Workers for the same graph to search with, which are left running afterwards (default is None, which starts a pool for
+            this search if n_workers is more than 1)
+
+    Returns :
+        distances : ndarray
+            The float64 distance from the starting node to every node (inf if the node can not be reached)
+        parents : ndarray
+            The int64 parent of every node on the routes from the starting node (-1 if there is no parent)
+        phase_count : int
+            The number of bulk relaxation phases
+    '''
+
+    number_of_nodes = compressed_graph.number_of_nodes
+    if worker_pool != None and worker_pool.compressed_graph is not compressed_graph:
+        raise ValueError("The worker pool was started for a different graph")
+    if worker_pool != None:
+        offsets, targets, target_weights = worker_pool.offsets, worker_pool.targets, worker_pool.target_weights
+        n_workers = worker_pool.n_workers
+    else:
+        offsets, targets, target_weights = getSearchArrays(compressed_graph)
+    if len(target_weights) > 0 and target_weights.min() < 0:
+        raise ValueError("Delta stepping can not be used with negative edge weights")
+    if delta == None:
+        delta = getDefaultDelta(target_weights, number_of_nodes)
+    if delta <= 0:
+        raise ValueError("The bucket width delta must be positive")
+
+    is_pool_owned = worker_pool == None and n_workers > 1
+    if is_pool_owned:
+        worker_pool = DeltaSteppingWorkerPool(compressed_graph, n_workers)
+    distances = np.frombuffer(worker_pool.shared_distances, dtype=np.float64) if n_workers > 1 else np.empty(number_of_nodes, dtype=np.float64)
+    distances[:] = np.inf
+    distances[start_node_index] = 0
+    parents = np.full(number_of_nodes, -1, dtype=np.int64)
+    is_settled = np.zeros(number_of_nodes, dtype=bool)
+
+    # each bucket holds arrays of nodes which entered it, and a node's stale entries are skipped once its distance moves to a lower bucket
+    buckets = {0: [np.array([start_node_index], dtype=np.int64)]}
+    phase_count = 0
+
+    pool = worker_pool.pool if n_workers > 1 else None
+
+    def relax(frontier, is_light):
+        '''
+        This function relaxes the light or heavy edges of a frontier and returns the nodes whose distances were shortened
+        '''
+
+        block_count = min(n_workers, len(frontier) // MINIMUM_NODES_PER_WORKER)
+        if block_count > 1:
+            request_blocks = [(block, delta, is_light) for block in np.array_split(frontier, block_count)]
+            block_requests = pool.map(getEdgeRequestsForBlock, request_blocks)
+            request_ends = np.concatenate([requests[0] for requests in block_requests])
+            request_distances = np.concatenate([requests[1] for requests in block_requests])
+            request_starts = np.concatenate([requests[2] for requests in block_requests])
+        else:
+            request_ends, request_distances, request_starts = getEdgeRequests(offsets, targets, target_weights, distances, frontier, delta, is_light)
+
+        if len(request_ends) == 0:
+            return request_ends
+
+        # every request kept is shorter than the current distance, so each end node's distance becomes its shortest request
+        np.minimum.at(distances, request_ends, request_distances)
+        is_best_request = request_distances == distances[request_ends]
+        parents[request_ends[is_best_request]] = request_starts[is_best_request]
+
+        improved_nodes = np.unique(request_ends)
+        node_buckets = (distances[improved_nodes] // delta).astype(np.int64)
+        for bucket_index in np.unique(node_buckets).tolist():
+            buckets.setdefault(bucket_index, []).append(improved_nodes[node_buckets == bucket_index])
+        return improved_nodes
+
+    try:
+        while buckets:
+            bucket_index = min(buckets)
+            removed_nodes = []
+
+            while bucket_index in buckets:
+                frontier = np.unique(np.concatenate(buckets.pop(bucket_index)))
+                frontier = frontier[~is_settled[frontier] & ((distances[frontier] // delta).astype(np.int64) == bucket_index)]
+                if len(frontier) == 0:
+                    break
+                removed_nodes.append(frontier)
+                relax(frontier, True)
+                phase_count += 1
+
+            if removed_nodes:
+                removed_nodes = np.unique(np.concatenate(removed_nodes))
+                is_settled[removed_nodes] = True
+                relax(removed_nodes, False)
+                phase_count += 1
+    finally:
+        if is_pool_owned:
+            worker_pool.close()
+
+    return distances.copy(), parents, phase_count
@@ -0,0 +1,102 @@
+import random
+import time
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+
+def createRandomGraph(number_of_nodes, edges_per_node=4, maximum_weight=100, seed=0):
+    '''
+    This function creates a directed compressed sparse row graph with random edges and random integer weights
+
+    Parameters :
+        number_of_nodes : int
+            The number of nodes in the graph
+        edges_per_node : int, optional
+            The average number of edges leaving each node (default is 4)
+        maximum_weight : int, optional
+            The heaviest edge weight (default is 100)
+        seed : int, optional
+            The seed for the random edges (default is 0)
+
+    Returns :
+        compressed_graph : CompressedSparseRowGraph
+            The random graph
+    '''
+
+    randomizer = random.Random(seed)
+    edges = ((randomizer.randrange(number_of_nodes), randomizer.randrange(number_of_nodes), randomizer.randint(1, maximum_weight)) for _ in range(0, number_of_nodes * edges_per_node))
+    return CompressedSparseRowGraph(number_of_nodes, edge_tuples=edges, is_directed=True, is_weighted=True)
+
+def measureDuration(find_shortest_paths, repeat_count=3):
+    '''
+    This function measures the fastest of several runs of a shortest path search
+
+    Parameters :
+        find_shortest_paths : function
+            The function running the search and returning its distances
+        repeat_count : int, optional
+            The number of runs (default is 3)
+
+    Returns :
+        duration : float
+            The number of seconds taken by the fastest run
+        distances : [int]
+            The distances found by the last run
+    '''
+
+    durations = []
+    for _ in range(0, repeat_count):
+        start = time.perf_counter()
+        distances = find_shortest_paths()
+        durations.append(time.perf_counter() - start)
+    return min(durations), distances
+
+if __name__ == '__main__':
+    import os
+    import pandas as pd
+
+    print(f"{os.cpu_count()} processors available")
+
+    engines = []
+    node_counts = []
+    deltas = []
+    worker_counts = []
+    phase_counts = []
+    durations = []
+
+    for number_of_nodes in [100000, 1000000]:
+        compressed_graph = createRandomGraph(number_of_nodes)
+
+        duration, dijkstra_distances = measureDuration(lambda : compressed_graph.shortestPathsFromNodeUsingDijkstra(0)[0])
+        engines.append("Dijkstra")
+        node_counts.append(number_of_nodes)
+        deltas.append(None)
+        worker_counts.append(1)
+        phase_counts.append(None)
+        durations.append(duration)
+
+        for delta in [None, 10, 100]:
+            for n_workers in [1, 2, 4, 8, 16]:
+                if delta != None and n_workers > 1:
+                    continue
+                duration, distances = measureDuration(lambda : compressed_graph.shortestPathsFromNodeUsingDeltaStepping(0, delta=delta, n_workers=n_workers)[0])
+                if distances != dijkstra_distances:
+                    print("The delta stepping distances do not match dijkstra's algorithm")
+                engines.append("Delta Stepping")
+                node_counts.append(number_of_nodes)
+                deltas.append(delta)
+                worker_counts.append(n_workers)
+                phase_counts.append(compressed_graph.delta_stepping_phase_count)
+                durations.append(duration)
+
+    dictionary = {
+        "Engine": engines,
+        "Nodes": node_counts,
+        "Delta": deltas,
+        "Workers": worker_counts,
+        "Phases": phase_counts,
+        "Seconds": durations
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    pd.options.display.width = 200
+    pd.options.display.max_columns = None
+    print(dataframe)
@@ -0,0 +1,128 @@
+
+class DisjointSet():
+    '''
+    This class serves as a disjoint set (union find) data structure, which tracks which set each item belongs to
+
+    It uses path compression and union by rank, so each operation takes close to constant time
+    '''
+
+    def __init__(self, number_of_items):
+        '''
+        This method initializes the disjoint set with each item in a set of its own
+
+        Parameters :
+            number_of_items : int
+                The number of items, which are numbered from 0 to number_of_items - 1
+        '''
+
+        self.number_of_items = number_of_items
+        self.parents = list(range(0, number_of_items))
+        self.ranks = [0] * number_of_items
+        self.set_count = number_of_items
+
+    def findSet(self, item):
+        '''
+        This method finds the representative item of the set containing an item, pointing every item on the way directly at it
+
+        Parameters :
+            item : int
+                The item being searched for
+
+        Returns :
+            representative : int
+                The representative item of the set
+        '''
+
+        parents = self.parents
+
+        representative = item
+        while parents[representative] != representative:
+            representative = parents[representative]
+
+        while parents[item] != representative:
+            next_item = parents[item]
+            parents[item] = representative
+            item = next_item
+
+        return representative
+
+    def union(self, first_item, second_item):
+        '''
+        This method merges the sets containing two items, attaching the set of lower rank beneath the other
+
+        Parameters :
+            first_item : int
+                An item in the first set
+            second_item : int
+                An item in the second set
+
+        Returns :
+            was_merged : Boolean
+                Whether the items were in different sets before the union
+        '''
+
+        first_representative = self.findSet(first_item)
+        second_representative = self.findSet(second_item)
+        if first_representative == second_representative:
+            return False
+
+        if self.ranks[first_representative] < self.ranks[second_representative]:
+            first_representative, second_representative = second_representative, first_representative
+        self.parents[second_representative] = first_representative
+        if self.ranks[first_representative] == self.ranks[second_representative]:
+            self.ranks[first_representative] += 1
+
+        self.set_count -= 1
+        return True
+
+    def isSameSet(self, first_item, second_item):
+        '''
+        This method checks whether two items are in the same set
+
+        Parameters :
+            first_item : int
+                The first item
+            second_item : int
+                The second item
+
+        Returns :
+            is_same_set : Boolean
+                Whether both items are in the same set
+        '''
+
+        return self.findSet(first_item) == self.findSet(second_item)
+
+    def getSetCount(self):
+        '''
+        This method returns the number of separate sets
+
+        Returns :
+            set_count : int
+                The number of separate sets
+        '''
+
+        return self.set_count
+
+    def getSets(self):
+        '''
+        This method groups the items by the set they belong to
+
+        Returns :
+            sets : {int:[int]}
+                The items in each set, keyed by the set's representative item
+        '''
+
+        sets = {}
+        for item in range(0, self.number_of_items):
+            sets.setdefault(self.findSet(item), []).append(item)
+        return sets
+
+if __name__ == '__main__':
+
+    disjoint_set = DisjointSet(10)
+    for first_item, second_item in [(0,1),(2,1),(2,3),(7,8),(9,8)]:
+        disjoint_set.union(first_item, second_item)
+
+    print(f"There are {disjoint_set.getSetCount()} sets : {disjoint_set.getSets()}")
+    print(f"Are 0 and 3 in the same set? {disjoint_set.isSameSet(0, 3)}")
+    print(f"Are 0 and 7 in the same set? {disjoint_set.isSameSet(0, 7)}")
@@ -0,0 +1,81 @@
+import unittest
+import random
+from DisjointSet import DisjointSet
+
+class DisjointSetUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for the disjoint set data structue
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up a disjoint set to be used as the starting point for each unit test
+
+        Number of items : 10
+        Unions : (0,1),(2,1),(2,3),(7,8),(9,8)
+        '''
+
+        self.disjoint_set = DisjointSet(10)
+        for first_item, second_item in [(0,1),(2,1),(2,3),(7,8),(9,8)]:
+            self.disjoint_set.union(first_item, second_item)
+
+    def test_set_count(self):
+        '''
+        This method tests that each union of two different sets lowers the set count
+        '''
+
+        self.assertEqual(self.disjoint_set.getSetCount(), 5)
+        self.assertFalse(self.disjoint_set.union(0, 3))
+        self.assertEqual(self.disjoint_set.getSetCount(), 5)
+        self.assertTrue(self.disjoint_set.union(3, 7))
+        self.assertEqual(self.disjoint_set.getSetCount(), 4)
+
+    def test_same_set(self):
+        '''
+        This method tests which items share a set
+        '''
+
+        self.assertTrue(self.disjoint_set.isSameSet(0, 3))
+        self.assertTrue(self.disjoint_set.isSameSet(9, 7))
+        self.assertFalse(self.disjoint_set.isSameSet(0, 7))
+        self.assertFalse(self.disjoint_set.isSameSet(4, 5))
+
+        sets = sorted(sorted(items) for items in self.disjoint_set.getSets().values())
+        self.assertListEqual(sets, [[0,1,2,3],[4],[5],[6],[7,8,9]])
+
+    def test_path_compression(self):
+        '''
+        This method tests that finding an item points it directly at its representative
+        '''
+
+        disjoint_set = DisjointSet(1000)
+        for item in range(1, 1000):
+            disjoint_set.parents[item] = item - 1
+
+        self.assertEqual(disjoint_set.findSet(999), 0)
+        for item in range(0, 1000):
+            self.assertEqual(disjoint_set.parents[item], 0)
+
+    def test_random_unions(self):
+        '''
+        This method tests random unions against a simple list of sets
+        '''
+
+        randomizer = random.Random(3)
+        disjoint_set = DisjointSet(200)
+        labels = list(range(0, 200))
+
+        for _ in range(0, 150):
+            first_item, second_item = randomizer.randrange(200), randomizer.randrange(200)
+            disjoint_set.union(first_item, second_item)
+            old_label, new_label = labels[second_item], labels[first_item]
+            labels = [new_label if label == old_label else label for label in labels]
+
+            self.assertEqual(disjoint_set.getSetCount(), len(set(labels)))
+
+        for first_item in range(0, 200, 7):
+            for second_item in range(0, 200, 11):
+                self.assertEqual(disjoint_set.isSameSet(first_item, second_item), labels[first_item] == labels[second_item])
+
+if __name__ == '__main__':
+    unittest.main()
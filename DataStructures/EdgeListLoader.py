@@ -0,0 +1,224 @@
+from array import array
+from itertools import islice
+import time
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+
+class EdgeListLoader():
+    '''
+    This class streams the edges of a graph from a text file of "start end [weight]" lines, a chunk of lines at a time
+
+    Only one chunk of lines is held as text at once, so the memory used while loading depends on the chunk size rather than the file size
+    Lines may be separated by commas, tabs or spaces, and blank lines and lines starting with # or % are skipped
+    '''
+
+    def __init__(self, source, delimiter=None, chunk_size=100000, has_header=False, is_debug=False):
+        '''
+        This method initializes the loader for a file
+
+        Parameters :
+            source : str or file
+                The path of the edge list file or an open text file
+            delimiter : str, optional
+                The separator between the values on each line (default is None, which accepts commas, tabs and spaces)
+            chunk_size : int, optional
+                The number of lines parsed at a time (default is 100000)
+            has_header : Boolean, optional
+                Whether the first line holds column names rather than an edge (default is False)
+            is_debug : Boolean, optional
+                Whether the loading progress is printed after each chunk (default is False)
+        '''
+
+        self.source = source
+        self.delimiter = delimiter
+        self.chunk_size = chunk_size
+        self.has_header = has_header
+        self.is_debug = is_debug
+
+        self.edge_count = 0
+        self.largest_node_number = -1
+        self.has_float_weights = False
+        self.duration = 0
+
+    def parseLines(self, lines):
+        '''
+        This method parses a chunk of lines into the start, end and weight of each edge, where an edge with no weight has a weight of 1
+
+        Parameters :
+            lines : [str]
+                The lines being parsed
+
+        Returns :
+            edge_starts : [int]
+                The start node of each edge
+            edge_ends : [int]
+                The end node of each edge
+            edge_weights : [int or float]
+                The weight of each edge
+        '''
+
+        edge_starts = []
+        edge_ends = []
+        edge_weights = []
+
+        for line in lines:
+            line = line.strip()
+            if line == "" or line[0] == "#" or line[0] == "%":
+                continue
+
+            if self.delimiter == None:
+                values = line.replace(",", " ").split()
+            else:
+                values = line.split(self.delimiter)
+
+            edge_starts.append(int(values[0]))
+            edge_ends.append(int(values[1]))
+            if len(values) < 3:
+                edge_weights.append(1)
+            else:
+                try:
+                    edge_weights.append(int(values[2]))
+                except ValueError:
+                    # anything int does not accept, such as 2.5, 1e3, inf or nan, is read as a float
+                    edge_weights.append(float(values[2]))
+                    self.has_float_weights = True
+
+        return edge_starts, edge_ends, edge_weights
+
+    def readChunks(self):
+        '''
+        This generator reads the file a chunk of lines at a time, counting the edges and timing the loading as it goes
+
+        Yields :
+            edge_starts : [int]
+                The start node of each edge in the chunk
+            edge_ends : [int]
+                The end node of each edge in the chunk
+            edge_weights : [int or float]
+                The weight of each edge in the chunk
+        '''
+
+        is_opened_here = isinstance(self.source, str)
+        edge_file = open(self.source, "r", newline="") if is_opened_here else self.source
+
+        try:
+            if self.has_header:
+                next(edge_file, None)
+
+            start = time.perf_counter()
+            while True:
+                lines = list(islice(edge_file, self.chunk_size))
+                if not lines:
+                    break
+
+                edge_starts, edge_ends, edge_weights = self.parseLines(lines)
+                self.edge_count += len(edge_starts)
+                if edge_starts:
+                    self.largest_node_number = max(self.largest_node_number, max(edge_starts), max(edge_ends))
+
+                # the time spent by the caller between chunks is counted, as it is part of building the graph
+                self.duration = time.perf_counter() - start
+                if self.is_debug:
+                    print(f"Loaded {self.edge_count} edges at {self.getEdgesPerSecond():,.0f} edges per second")
+
+                yield edge_starts, edge_ends, edge_weights
+            self.duration = time.perf_counter() - start
+        finally:
+            if is_opened_here:
+                edge_file.close()
+
+    def loadIntoGraph(self, graph):
+        '''
+        This method adds every edge in the file to an existing graph, a chunk at a time
+
+        Parameters :
+            graph : Graph
+                The graph the edges are added to, which must have a node for every node number in the file
+
+        Returns :
+            graph : Graph
+                The graph with the edges added
+        '''
+
+        for edge_starts, edge_ends, edge_weights in self.readChunks():
+            for start, end, weight in zip(edge_starts, edge_ends, edge_weights):
+                graph.addWeightedEdge(start, end, weight)
+
+        return graph
+
+    def loadCompressedSparseRowGraph(self, number_of_nodes=None, is_directed=False):
+        '''
+        This method builds a compressed sparse row graph from the file, appending each chunk to the flat edge arrays
+
+        No object is created for each edge, so this is the compact way to load a large edge list
+
+        Parameters :
+            number_of_nodes : int, optional
+                The number of nodes in the graph (default is None, which uses one more than the largest node number in the file)
+            is_directed : Boolean, optional
+                Whether the edges only run from their start node to their end node (default is False)
+
+        Returns :
+            compressed_graph : CompressedSparseRowGraph
+                The graph of the file's edges
+        '''
+
+        edge_starts = array('q')
+        edge_ends = array('q')
+        edge_weights = array('q')
+
+        for chunk_starts, chunk_ends, chunk_weights in self.readChunks():
+            if self.has_float_weights and edge_weights.typecode == 'q':
+                edge_weights = array('d', edge_weights)
+            edge_starts.extend(chunk_starts)
+            edge_ends.extend(chunk_ends)
+            edge_weights.extend(chunk_weights)
+
+        if number_of_nodes == None:
+            number_of_nodes = self.largest_node_number + 1
+
+        start = time.perf_counter()
+        compressed_graph = CompressedSparseRowGraph(0, is_directed=is_directed, is_weighted=True)
+        compressed_graph.number_of_nodes = number_of_nodes
+        compressed_graph.weight_typecode = edge_weights.typecode
+        compressed_graph.buildRows(edge_starts, edge_ends, edge_weights)
+        compressed_graph.resetTraversalInformation()
+        self.duration += time.perf_counter() - start
+
+        return compressed_graph
+
+    def getEdgesPerSecond(self):
+        '''
+        This method returns the loading throughput so far
+
+        Returns :
+            edges_per_second : float
+                The number of edges loaded per second
+        '''
+
+        if self.duration == 0:
+            return 0
+        return self.edge_count / self.duration
+
+if __name__ == '__main__':
+    import os
+    import random
+    import tempfile
+
+    edge_count = 2000000
+    number_of_nodes = 200000
+    randomizer = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "edges.tsv")
+        with open(path, "w") as edge_file:
+            for _ in range(0, edge_count):
+                edge_file.write(f"{randomizer.randrange(number_of_nodes)}\t{randomizer.randrange(number_of_nodes)}\t{randomizer.randint(1, 100)}\n")
+
+        loader = EdgeListLoader(path)
+        compressed_graph = loader.loadCompressedSparseRowGraph(is_directed=True)
+        print(f"Compressed sparse row graph : {loader.edge_count} edges in {loader.duration:.2f} seconds, {loader.getEdgesPerSecond():,.0f} edges per second, {compressed_graph.getMemoryUsage() / 1000000:.1f} MB")
+
+        from Graph import Graph
+        loader = EdgeListLoader(path)
+        graph = loader.loadIntoGraph(Graph(number_of_nodes=number_of_nodes, is_directed=True, is_weighted=True))
+        print(f"Graph : {loader.edge_count} edges in {loader.duration:.2f} seconds, {loader.getEdgesPerSecond():,.0f} edges per second")
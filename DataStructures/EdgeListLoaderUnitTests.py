@@ -0,0 +1,98 @@
+import io
+import math
+import os
+import tempfile
+import unittest
+from Graph import Graph
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+from EdgeListLoader import EdgeListLoader
+
+class EdgeListLoaderUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for the streaming edge list loader
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up the edge list to be used with the following unit tests
+
+        Number of nodes : 10
+        Number of edges : 13
+        '''
+
+        self.weighted_edge_list = [(0,1,2),(2,1,1),(2,3,4),(3,4,6),(4,5,3),(5,6,2),(1,6,1),(6,3,3),(2,4,4),(2,5,2),(7,8,5),(9,8,2),(9,7,1)]
+        self.number_of_nodes = 10
+
+    def test_compressed_graph_matches_edge_tuples(self):
+        '''
+        This method tests that a tab separated file loaded in small chunks gives the same rows as building the graph from the edge tuples
+        '''
+
+        text = "".join(f"{start}\t{end}\t{weight}\n" for start, end, weight in self.weighted_edge_list)
+        loader = EdgeListLoader(io.StringIO(text), chunk_size=4)
+        loaded_graph = loader.loadCompressedSparseRowGraph(is_directed=True)
+        expected_graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=True, is_weighted=True)
+
+        self.assertEqual(loader.edge_count, 13)
+        self.assertEqual(loaded_graph.number_of_nodes, self.number_of_nodes)
+        self.assertListEqual(list(loaded_graph.offsets), list(expected_graph.offsets))
+        self.assertListEqual(list(loaded_graph.targets), list(expected_graph.targets))
+        self.assertListEqual(list(loaded_graph.target_weights), list(expected_graph.target_weights))
+        self.assertEqual(loaded_graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 4), expected_graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 4))
+
+    def test_delimiters_comments_and_missing_weights(self):
+        '''
+        This method tests that commas, spaces, comments, blank lines and a header are handled, and that edges without a weight have a weight of 1
+        '''
+
+        text = "start,end,weight\n# a comment\n0,1,5\n\n1 2\n% another comment\n2\t3\t2.5\n"
+        loader = EdgeListLoader(io.StringIO(text), has_header=True)
+        loaded_graph = loader.loadCompressedSparseRowGraph(number_of_nodes=5, is_directed=True)
+
+        self.assertEqual(loader.edge_count, 3)
+        self.assertEqual(loaded_graph.number_of_nodes, 5)
+        self.assertEqual(loaded_graph.weight_typecode, 'd')
+        self.assertListEqual([weight for _, _, weight in loaded_graph.getEdgeTuples()], [5, 1, 2.5])
+        self.assertEqual(loaded_graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 3), ([0, 1, 2, 3], 8.5))
+
+    def test_special_float_weights(self):
+        '''
+        This method tests that infinite and missing weights written as inf, -inf and nan are read as floats, along with exponents
+        '''
+
+        text = "0 1 inf\n1 2 -inf\n2 3 nan\n3 4 1E2\n4 5 Infinity\n5 6 7\n"
+        loader = EdgeListLoader(io.StringIO(text))
+        loaded_graph = loader.loadCompressedSparseRowGraph(is_directed=True)
+
+        self.assertEqual(loader.edge_count, 6)
+        self.assertEqual(loaded_graph.weight_typecode, 'd')
+        weights = [weight for _, _, weight in loaded_graph.getEdgeTuples()]
+        self.assertListEqual([weights[0], weights[1], weights[3], weights[4], weights[5]], [math.inf, -math.inf, 100.0, math.inf, 7.0])
+        self.assertTrue(math.isnan(weights[2]))
+
+        with self.assertRaises(ValueError):
+            EdgeListLoader(io.StringIO("0 1 heavy\n")).loadCompressedSparseRowGraph()
+
+    def test_load_into_graph_from_path(self):
+        '''
+        This method tests that the edges of a file on disk are added to a graph, matching a graph built from the edge tuples
+        '''
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "edges.csv")
+            with open(path, "w") as edge_file:
+                for start, end, weight in self.weighted_edge_list:
+                    edge_file.write(f"{start},{end},{weight}\n")
+
+            loader = EdgeListLoader(path, chunk_size=5)
+            graph = loader.loadIntoGraph(Graph(number_of_nodes=self.number_of_nodes, is_directed=False, is_weighted=True))
+
+        expected_graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=False, is_weighted=True)
+        self.assertEqual(loader.edge_count, 13)
+        self.assertEqual(len(graph.weighted_edges), 13)
+        self.assertGreater(loader.getEdgesPerSecond(), 0)
+        for end_node in range(0, self.number_of_nodes):
+            self.assertEqual(graph.shortestPathBetweenTwoNodesUsingDijkstra(0, end_node)[1], expected_graph.shortestPathBetweenTwoNodesUsingDijkstra(0, end_node)[1])
+
+if __name__ == '__main__':
+    unittest.main()
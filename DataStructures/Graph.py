@@ -1,12 +1,23 @@
-import pandas as pd
-import networkx as nx
-from matplotlib import pyplot as plt
+from collections import deque
 import MinHeapForObjects
-import seaborn as sns
+from CompressedSparseRowGraph import CompressedSparseRowGraph, findPathsFromSources, readGraphFileEdgeTuples
+from DisjointSet import DisjointSet
+from ShortestPathCache import ShortestPathCache
+from ContractionHierarchy import ContractionHierarchy
+from EdgeListLoader import EdgeListLoader
+
+# pandas, numpy, networkx, matplotlib and seaborn are imported by the methods which build tables or plots,
+# so importing the graph for traversal and path finding does not pay their import cost
+
 class GraphNode():
     '''
     This class is a node for the undirected graph data structure
+
+    The attributes are held in slots rather than a per instance dictionary to reduce the memory used by each node
     '''
+
+    __slots__ = ("number", "parent", "discovered_time", "finished_time", "distance", "debug", "connected_nodes", "connected_edge_weights", "is_visited", "is_in_queue", "search_parent", "traversal_epoch", "search_epoch")
+
     def __init__(self, number, parent = None, discovered_time = None, finished_time = None, distance = None, debug=False):
         '''
         This method initializes the node for the undirected graph
@@ -36,6 +47,9 @@ class GraphNode():
         self.connected_edge_weights = []
         self.is_visited = False
         self.is_in_queue = False
+        self.search_parent = None
+        self.traversal_epoch = 0
+        self.search_epoch = 0
 
     def resetTrackersForDijkstra(self):
         '''
@@ -44,9 +58,35 @@ class GraphNode():
 
         self.is_visited = False
         self.is_in_queue = False
-        self.parent = None
+        self.search_parent = None
         self.distance = None
 
+    def resetTraversalForEpoch(self, traversal_epoch):
+        '''
+        This method clears the node's traversal information left by an earlier traversal and marks it as belonging to the current one
+
+        Parameters :
+            traversal_epoch : int
+                The graph's current traversal epoch
+        '''
+
+        self.parent = None
+        self.discovered_time = None
+        self.finished_time = None
+        self.traversal_epoch = traversal_epoch
+
+    def resetSearchForEpoch(self, search_epoch):
+        '''
+        This method clears the node's shortest path and spanning tree trackers left by an earlier search and marks it as belonging to the current one
+
+        Parameters :
+            search_epoch : int
+                The graph's current search epoch
+        '''
+
+        self.resetTrackersForDijkstra()
+        self.search_epoch = search_epoch
+
     def getPriority(self):
         '''
         This method returns the nodes current distance value for use in the priority min heap for dijkstra's algorithm
@@ -61,10 +101,17 @@ class GraphNode():
     def addConnectedNode(self, connected_node, connected_weight = 1):
         '''
         This method adds a connected node to this node, creating an edge
+
+        A repeated edge to a node which is already connected keeps the neighbor's place in the list and only changes its weight if it is lighter,
+        so the shortest path searches over the adjacency lists find the same distances as the searches over every edge
         '''
         if connected_node not in self.connected_nodes:
             self.connected_nodes.append(connected_node)
             self.connected_edge_weights.append(connected_weight)
+        else:
+            position = self.connected_nodes.index(connected_node)
+            if connected_weight < self.connected_edge_weights[position]:
+                self.connected_edge_weights[position] = connected_weight
 
     def resetTraversalInformation(self):
         '''
@@ -75,26 +122,34 @@ class GraphNode():
         self.discovered_time = None
         self.finished_time = None
 
-    def printNode(self):
+    def printNode(self, is_traversal_current=True):
         '''
         This method prints out the current information for this node
+
+        Parameters :
+            is_traversal_current : Boolean, optional
+                Whether the node's traversal information belongs to the graph's current traversal (default is True)
         '''
 
         print(f"Node {self.number} is connected to nodes {self.connected_nodes}")
-        if self.parent != None or self.discovered_time != None or self.finished_time != None:
+        if is_traversal_current and (self.parent != None or self.discovered_time != None or self.finished_time != None):
             print(f"Parent: {self.parent} Discovered Time: {self.discovered_time} Finished Time: {self.finished_time}")
 
     def printAbbreviated(self) :
-        print(f"(N:{self.number} PR:{self.distance} PA:{self.parent})", end=" ")
+        print(f"(N:{self.number} PR:{self.distance} PA:{self.search_parent})", end=" ")
 
     def getDescription(self):
-        return f"(N:{self.number} PR:{self.distance} PA:{self.parent})"
+        return f"(N:{self.number} PR:{self.distance} PA:{self.search_parent})"
 
 class GraphEdgeWithWeight():
     '''
     This class contains the details for each edge in a weighted graph
+
+    The attributes are held in slots rather than a per instance dictionary to reduce the memory used by each edge
     '''
 
+    __slots__ = ("start_node", "end_node", "weight", "directed", "edge_id")
+
     def __init__(self, start_node, end_node, weight, edge_id, directed=False):
         '''
         This method initializes the Graph Edge object
@@ -208,6 +263,8 @@ class Graph():
         self.is_debug = is_debug
 
         self.counter = 0
+        self.traversal_epoch = 0
+        self.search_epoch = 0
 
         self.back_edges = []
 
@@ -217,6 +274,11 @@ class Graph():
 
         self.weighted_edges = []
         self.weighted_edges_vis_list = []
+        self.compressed_sparse_row = None
+        self.connected_components = DisjointSet(self.number_of_nodes)
+        self.shortest_path_cache = None
+        self.contraction_hierarchy = None
+        self.deferred_adjacency_path = None
         self.addEdges(edge_list=edge_tuples)
 
         if self.is_debug:
@@ -268,10 +330,218 @@ class Graph():
             weight : int
                 The weight of the edge
         '''
+
+        self.buildDeferredAdjacency()
         edge_id = len(self.weighted_edges)
         self.weighted_edges.append(GraphEdgeWithWeight(start_node=start, end_node=end, weight=weight, edge_id=edge_id))
         self.weighted_edges_vis_list.append((start,end,weight))
         self.addNeighborsToNodes(start=start,end=end,weight=weight)
+        self.connected_components.union(start, end)
+        self.compressed_sparse_row = None
+        self.contraction_hierarchy = None
+        if self.shortest_path_cache != None:
+            self.shortest_path_cache.clear()
+
+    def getCompressedSparseRow(self):
+        '''
+        This method returns a compressed sparse row copy of the graph, building it the first time it is needed after edges are added
+
+        Returns :
+            compressed_sparse_row : CompressedSparseRowGraph
+                The graph's edges stored in flat offset, target and weight arrays
+        '''
+
+        if self.compressed_sparse_row == None or self.compressed_sparse_row.is_directed != self.is_directed:
+            self.buildDeferredAdjacency()
+            self.compressed_sparse_row = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edges_vis_list, is_directed=self.is_directed, is_weighted=True)
+        return self.compressed_sparse_row
+
+    def getPartitionedGraph(self, shard_count, partition_method="node range", seed=0):
+        '''
+        This method splits the graph into shards, each served by its own worker process, for breadth first and shortest path searches in rounds
+
+        The workers are started by the first search and should be stopped with close, or by using the partitioned graph in a with statement,
+        once it is no longer needed
+
+        Parameters :
+            shard_count : int
+                The number of shards and worker processes
+            partition_method : str, optional
+                "node range" for equal contiguous ranges of node numbers or "label propagation" for clusters (default is "node range")
+            seed : int, optional
+                The seed for label propagation (default is 0)
+
+        Returns :
+            partitioned_graph : PartitionedGraph
+                The graph split into shards
+        '''
+
+        from PartitionedGraph import PartitionedGraph
+        return PartitionedGraph(self.getCompressedSparseRow(), shard_count, partition_method=partition_method, seed=seed)
+
+    def save(self, path):
+        '''
+        This method writes the graph's edges to a binary compressed sparse row file, which load can memory map
+
+        Parameters :
+            path : str
+                The path of the file to write
+        '''
+
+        self.buildDeferredAdjacency()
+
+        self.getCompressedSparseRow().save(path, is_weighted=self.is_weighted, edge_tuples=self.weighted_edges_vis_list)
+
+    @staticmethod
+    def load(path, mmap=True):
+        '''
+        This method creates a graph from a file written by save
+
+        The graph's compressed sparse row copy is the loaded file, so the compressed sparse row traversal and shortest path methods run directly on
+        the memory mapped arrays, and loading takes the same time however large the graph is
+        The nodes, edge objects and connected components are only built from the file's edges the first time one of them is used,
+        so a graph which is only searched through its compressed sparse row methods never creates an object for each edge
+        Without mmap, the file is read again when they are built, so it should not be changed or removed before then
+
+        Parameters :
+            path : str
+                The path of the file to read
+            mmap : Boolean, optional
+                Whether the file is memory mapped rather than copied into python arrays (default is True)
+
+        Returns :
+            graph : Graph
+                The graph stored in the file
+        '''
+
+        compressed_graph = CompressedSparseRowGraph.load(path, mmap=mmap)
+        graph = Graph(number_of_nodes=0, is_directed=compressed_graph.is_directed, is_weighted=compressed_graph.is_weighted)
+        # like the copy built by getCompressedSparseRow, the rows keep the weights whether or not the graph is weighted
+        compressed_graph.is_weighted = True
+
+        graph.number_of_nodes = compressed_graph.number_of_nodes
+        graph.compressed_sparse_row = compressed_graph
+
+        # the adjacency is built by buildDeferredAdjacency when a method first needs it
+        graph.nodes = None
+        graph.weighted_edges = None
+        graph.weighted_edges_vis_list = None
+        graph.connected_components = None
+        graph.deferred_adjacency_path = path
+        return graph
+
+    def buildDeferredAdjacency(self):
+        '''
+        This method builds the nodes, edges and connected components of a graph created by load from the edges in its file,
+        in the order they were saved, while keeping the loaded compressed sparse row copy
+
+        Each method using the nodes or edges calls this first. It does nothing once they are built or if the graph was not created by load
+        '''
+
+        if self.deferred_adjacency_path == None:
+            return
+
+        path = self.deferred_adjacency_path
+        self.deferred_adjacency_path = None
+        compressed_graph = self.compressed_sparse_row
+
+        self.nodes = {}
+        for i in range(0, self.number_of_nodes):
+            self.nodes[i] = GraphNode(i, debug=self.is_debug)
+        self.weighted_edges = []
+        self.weighted_edges_vis_list = []
+        self.connected_components = DisjointSet(self.number_of_nodes)
+
+        # the edges are added with the saved direction even while a method has changed is_directed
+        was_directed = self.is_directed
+        self.is_directed = compressed_graph.is_directed
+        for start, end, weight in readGraphFileEdgeTuples(path, memory_map=compressed_graph.memory_map):
+            self.addWeightedEdge(start, end, weight)
+        self.is_directed = was_directed
+
+        self.compressed_sparse_row = compressed_graph
+
+    @staticmethod
+    def loadEdgeList(source, number_of_nodes, is_directed=False, delimiter=None, chunk_size=100000, has_header=False, is_debug=False):
+        '''
+        This method creates a weighted graph from a text file of "start end [weight]" lines, adding the edges a chunk of lines at a time
+
+        For a large file without the nodes' adjacency lists, use EdgeListLoader.loadCompressedSparseRowGraph instead
+
+        Parameters :
+            source : str or file
+                The path of the edge list file or an open text file
+            number_of_nodes : int
+                The number of nodes in the graph
+            is_directed : Boolean, optional
+                Whether the edges only run from their start node to their end node (default is False)
+            delimiter : str, optional
+                The separator between the values on each line (default is None, which accepts commas, tabs and spaces)
+            chunk_size : int, optional
+                The number of lines parsed at a time (default is 100000)
+            has_header : Boolean, optional
+                Whether the first line holds column names rather than an edge (default is False)
+            is_debug : Boolean, optional
+                Whether the number of edges loaded and the edges per second are printed after each chunk (default is False)
+
+        Returns :
+            graph : Graph
+                The graph of the file's edges
+        '''
+
+        loader = EdgeListLoader(source, delimiter=delimiter, chunk_size=chunk_size, has_header=has_header, is_debug=is_debug)
+        return loader.loadIntoGraph(Graph(number_of_nodes=number_of_nodes, is_directed=is_directed, is_weighted=True))
+
+    def getContractionHierarchy(self, maximum_settled_nodes=None):
+        '''
+        This method returns a contraction hierarchy of the graph, building it the first time it is needed after edges are added,
+        and building it again if it is asked for with a different witness search limit than the one it was built with
+
+        Parameters :
+            maximum_settled_nodes : int, optional
+                The most nodes each witness search may settle while the hierarchy is built (default is None, which keeps the current
+                hierarchy's limit, or uses 100 when there is no hierarchy yet)
+
+        Returns :
+            contraction_hierarchy : ContractionHierarchy
+                The preprocessed graph used for fast point to point queries
+        '''
+
+        self.buildDeferredAdjacency()
+
+        if maximum_settled_nodes == None:
+            maximum_settled_nodes = 100 if self.contraction_hierarchy == None else self.contraction_hierarchy.maximum_settled_nodes
+        if self.contraction_hierarchy == None or self.contraction_hierarchy.maximum_settled_nodes != maximum_settled_nodes:
+            self.contraction_hierarchy = ContractionHierarchy(self, maximum_settled_nodes=maximum_settled_nodes)
+        return self.contraction_hierarchy
+
+    def enableShortestPathCache(self, maximum_entries=128, maximum_bytes=None):
+        '''
+        This method turns on a least recently used cache of single source dijkstra results for shortestPathBetweenTwoNodesUsingDijkstra
+
+        The first query from a start node searches the whole graph, then later queries from it only rebuild the path from the cached parents
+        The cache is cleared whenever an edge is added
+
+        Parameters :
+            maximum_entries : int, optional
+                The most start nodes whose results are kept (default is 128, None for no limit)
+            maximum_bytes : int, optional
+                The most bytes the cached distance and parent lists may use (default is None for no limit)
+
+        Returns :
+            shortest_path_cache : ShortestPathCache
+                The cache, whose counters show its hits, misses and evictions
+        '''
+
+        self.shortest_path_cache = ShortestPathCache(maximum_entries=maximum_entries, maximum_bytes=maximum_bytes)
+        return self.shortest_path_cache
+
+    def disableShortestPathCache(self):
+        '''
+        This method turns off and discards the shortest path cache
+        '''
+
+        self.shortest_path_cache = None
 
     def addNeighborsToNodes(self, start, end, weight):
         '''
@@ -295,13 +565,90 @@ class Graph():
     def resetTraversalInformation(self):
         '''
         This method resets the traversal information for all of the nodes
-        '''
 
-        for node_number in range(0,self.number_of_nodes):
-            self.nodes[node_number].resetTraversalInformation()
+        The nodes are not visited, instead a new traversal epoch is started so each node's information is treated as cleared until the traversal reaches it
+        '''
 
+        self.startNewTraversalEpoch()
+        self.back_edges = []
         self.resetCounter()
 
+    def startNewTraversalEpoch(self):
+        '''
+        This method starts a new traversal epoch, so the parents and times any earlier traversal left on the nodes are treated as cleared
+
+        This takes the same time however large the graph is, and each traversal only pays to clear the nodes it reaches
+        Searches keep their trackers under a separate epoch, so a search does not clear the results of a traversal
+        '''
+
+        self.traversal_epoch += 1
+
+    def startNewSearchEpoch(self):
+        '''
+        This method starts a new search epoch, so the distances and parents any earlier shortest path or spanning tree search left on the nodes are treated as cleared
+        '''
+
+        self.search_epoch += 1
+
+    def getNode(self, node_number):
+        '''
+        This method returns a node without changing it
+
+        The node's traversal information is only current if its traversal epoch matches the graph's, which the getNode... methods check
+
+        Parameters :
+            node_number : int
+                The number of the node
+
+        Returns :
+            node : GraphNode
+                The node
+        '''
+
+        self.buildDeferredAdjacency()
+
+        return self.nodes[node_number]
+
+    def getNodeForTraversal(self, node_number):
+        '''
+        This method returns a node for a traversal to update, first clearing the traversal information left by an earlier traversal epoch
+
+        Parameters :
+            node_number : int
+                The number of the node
+
+        Returns :
+            node : GraphNode
+                The node with traversal information belonging to the current traversal epoch
+        '''
+
+        self.buildDeferredAdjacency()
+
+        node = self.nodes[node_number]
+        if node.traversal_epoch != self.traversal_epoch:
+            node.resetTraversalForEpoch(self.traversal_epoch)
+        return node
+
+    def getNodeForSearch(self, node_number):
+        '''
+        This method returns a node for a search to update, first clearing the search trackers left by an earlier search epoch
+
+        Parameters :
+            node_number : int
+                The number of the node
+
+        Returns :
+            node : GraphNode
+                The node with search trackers belonging to the current search epoch
+        '''
+
+        self.buildDeferredAdjacency()
+
+        node = self.nodes[node_number]
+        if node.search_epoch != self.search_epoch:
+            node.resetSearchForEpoch(self.search_epoch)
+        return node
+
     def getCounter(self):
         '''
         This method returns the current counter value for the graph
@@ -335,52 +682,122 @@ class Graph():
         self.printGraphSummary()
 
         for node_number in range(0,self.number_of_nodes):
-            node = self.nodes[node_number]
-            node.printNode()
+            node = self.getNode(node_number)
+            node.printNode(is_traversal_current=node.traversal_epoch == self.traversal_epoch)
         
     def node_visit(self, node_number):
         '''
-        This method is a recursive method to visit all nodes after this point based on whether the current traversal style is breadth first or depth first
+        This method visits all nodes after this point based on whether the current traversal style is breadth first or depth first
+
+        Breadth first traversal uses a first in first out queue and depth first traversal uses an explicit stack, so neither recurses
         
         Parameters :
             node_number : int
                 The number of the node the traversal is starting at
         '''
 
-        node = self.nodes[node_number]
-        
+        if self.is_breadth_first:
+            self.node_visit_breadth_first(node_number)
+        else:
+            self.node_visit_depth_first(node_number)
+
+    def node_visit_breadth_first(self, node_number):
+        '''
+        This method visits all nodes after this point breadth first using a queue
+
+        Each node is discovered when it is added to the queue
+        Once the queue is empty, the nodes are finished in the order they left the queue
+
+        Parameters :
+            node_number : int
+                The number of the node the traversal is starting at
+        '''
+
+        self.buildDeferredAdjacency()
+
+        nodes = self.nodes
+        traversal_epoch = self.traversal_epoch
+        node = self.getNodeForTraversal(node_number)
+
         if node.discovered_time == None:
             node.discovered_time = self.getCounter()
             self.incrementCounter()
 
-        connected_node_numbers = node.connected_nodes
+        queue = deque([node])
+        scanned_nodes = []
+        while queue:
+            node = queue.popleft()
+            scanned_nodes.append(node)
 
-        if self.is_breadth_first:
-            visit_list = []
-            for neighbor_number in connected_node_numbers:
-                neighbor = self.nodes[neighbor_number]
+            for neighbor_number in node.connected_nodes:
+                neighbor = nodes[neighbor_number]
+                if neighbor.traversal_epoch != traversal_epoch:
+                    neighbor.resetTraversalForEpoch(traversal_epoch)
                 if neighbor.discovered_time == None:
-                    visit_list.append(neighbor_number)
                     neighbor.discovered_time = self.getCounter()
                     neighbor.parent = node.number
                     self.incrementCounter()
-                elif neighbor.finished_time == None:
+                    queue.append(neighbor)
+                # nodes leave the queue in the order they were discovered, so an unfinished neighbor
+                # discovered after this node is still waiting in the queue
+                elif neighbor.finished_time == None and neighbor.discovered_time > node.discovered_time:
                     self.back_edges.append((node.number,neighbor.number))
-            for neighbor_number in visit_list:
-                self.node_visit(neighbor_number)
 
-        else:
-            for neighbor_number in connected_node_numbers:    
-                neighbor = self.nodes[neighbor_number]
+        for node in scanned_nodes:
+            node.finished_time = self.getCounter()
+            self.incrementCounter()
+
+    def node_visit_depth_first(self, node_number):
+        '''
+        This method visits all nodes after this point depth first using an explicit stack
+
+        Each stack entry holds a node and the position of the next neighbor to check,
+        so the discovered times, finished times and back edges are the same as a recursive depth first traversal
+
+        Parameters :
+            node_number : int
+                The number of the node the traversal is starting at
+        '''
+
+        self.buildDeferredAdjacency()
+
+        nodes = self.nodes
+        traversal_epoch = self.traversal_epoch
+        node = self.getNodeForTraversal(node_number)
+
+        if node.discovered_time == None:
+            node.discovered_time = self.getCounter()
+            self.incrementCounter()
+
+        stack = [[node, 0]]
+        while stack:
+            stack_entry = stack[-1]
+            node, neighbor_position = stack_entry
+            connected_node_numbers = node.connected_nodes
+            descended = False
+
+            while neighbor_position < len(connected_node_numbers):
+                neighbor = nodes[connected_node_numbers[neighbor_position]]
+                neighbor_position += 1
+                if neighbor.traversal_epoch != traversal_epoch:
+                    neighbor.resetTraversalForEpoch(traversal_epoch)
+
                 if neighbor.discovered_time == None:
                     neighbor.parent = node.number
-                    self.node_visit(neighbor_number)
+                    neighbor.discovered_time = self.getCounter()
+                    self.incrementCounter()
+                    stack_entry[1] = neighbor_position
+                    stack.append([neighbor, 0])
+                    descended = True
+                    break
 
                 elif neighbor.finished_time == None:
                     self.back_edges.append((node.number,neighbor.number))
 
-        node.finished_time = self.getCounter()
-        self.incrementCounter()
+            if not descended:
+                node.finished_time = self.getCounter()
+                self.incrementCounter()
+                stack.pop()
 
     def printTraversalDataTable(self):
         '''
@@ -391,6 +808,60 @@ class Graph():
 
         print(table)
 
+    def breadthFirstSearchUsingBitsets(self, start_node_index, alpha=2, beta=24):
+        '''
+        This method performs a direction optimizing breadth first search from a node on the compressed sparse row graph
+
+        Whole levels are expanded at once with numpy, switching between top down and bottom up steps on the size of the frontier,
+        so there is no dictionary lookup for each neighbor, and the parents match the traversal table of a breadth first visit from the same node
+
+        Parameters :
+            start_node_index : int
+                The node the search starts at
+            alpha : float, optional
+                The search turns bottom up once the frontier's edges exceed the unexplored edges divided by alpha (default is 2)
+            beta : float, optional
+                The search turns back to top down once the frontier holds fewer than the number of nodes divided by beta (default is 24)
+
+        Returns :
+            parents_for_nodes : [int]
+                The parent of each node in the search (None for the start node and the nodes which can not be reached)
+            levels_for_nodes : [int]
+                The number of edges from the start node to each node (None if the node can not be reached)
+        '''
+
+        return self.getCompressedSparseRow().breadthFirstSearchUsingBitsets(start_node_index, alpha=alpha, beta=beta)
+
+    def getTraversalResult(self):
+        '''
+        This method gathers the current traversal information into numpy arrays, without creating a dataframe
+
+        Returns :
+            traversal_result : TraversalResult
+                The parent, discovered time and finished time of every node, with -1 for the entries a node does not have
+        '''
+
+        import numpy as np
+        from GraphResults import TraversalResult
+
+        node_parents = np.full(self.number_of_nodes, -1, dtype=np.int64)
+        node_discovered_times = np.full(self.number_of_nodes, -1, dtype=np.int64)
+        node_finished_times = np.full(self.number_of_nodes, -1, dtype=np.int64)
+
+        for node_number in range(0,self.number_of_nodes):
+            node = self.getNode(node_number)
+            if node.traversal_epoch != self.traversal_epoch:
+                continue
+
+            if node.parent != None:
+                node_parents[node_number] = node.parent
+            if node.discovered_time != None:
+                node_discovered_times[node_number] = node.discovered_time
+            if node.finished_time != None:
+                node_finished_times[node_number] = node.finished_time
+
+        return TraversalResult(node_parents, node_discovered_times, node_finished_times)
+
     def getTraversalTable(self):
         '''
         This method creates a table of the current traveral information
@@ -400,27 +871,7 @@ class Graph():
                 A Dataframe containing the information about the graphs traversal
         '''
 
-        node_numbers = []
-        node_parents = []
-        node_discovered_times = []
-        node_finished_times = []
-
-        for node_number in range(0,self.number_of_nodes):
-            node = self.nodes[node_number]
-
-            node_numbers.append(node_number)
-            node_parents.append(node.parent)
-            node_discovered_times.append(node.discovered_time)
-            node_finished_times.append(node.finished_time)
-        
-        data_dictionary ={
-            "Node":node_numbers,
-            "Parent":node_parents,
-            "Discovered":node_discovered_times,
-            "Finished":node_finished_times
-        }
-        table = pd.DataFrame.from_dict(data_dictionary)
-        return table
+        return self.getTraversalResult().toDataFrame()
     
     def traverseGraph(self):
         '''
@@ -439,8 +890,7 @@ class Graph():
                 print("Traversing graph depth first")
 
         for node_number in range(0, self.number_of_nodes):
-            node = self.nodes[node_number]
-            if node.discovered_time == None:
+            if self.getNodeDiscoveredTime(node_number) == None:
                 self.node_visit(node_number)
 
         return self.getTraversalTable()
@@ -456,59 +906,238 @@ class Graph():
 
         segments_counted = 0
         for node_number in range(0, self.number_of_nodes):
-            node = self.nodes[node_number]
-            if node.parent == None:
+            if self.getNodeParent(node_number) == None:
                 segments_counted += 1
         return segments_counted
     
-    def getUnvisitedNodes(self):
-        '''
-        This method counts how many unvisited nodes are in a graph
-
-        Returns :
-            unvisited_nodes : [int]
-                The list of unvisited nodes in the graph
+    def componentOf(self, node_number):
         '''
+        This method finds which connected component a node is in, without traversing the graph
 
-        unvisited_nodes = []
-        for node_number in range(0, self.number_of_nodes):
-            node = self.nodes[node_number]
-            if node.discovered_time == None:
-                unvisited_nodes.append(node_number)
-        return unvisited_nodes
-    
-    
-    def getNodeDiscoveredTime(self, node_number):
-        '''
-        This method gets the discovered time of a given node
+        The components are kept up to date as each edge is added, ignoring the direction of the edges
 
         Parameters :
             node_number : int
-                The number of the node
+                The node being looked up
 
-        Returns : 
-            discovered_time : int
-                The counter value when the node was discovered
+        Returns :
+            component : int
+                The representative node of the node's component
         '''
 
-        return self.nodes[node_number].discovered_time
-    
-    def getNodeParent(self, node_number):
+        self.buildDeferredAdjacency()
+
+        return self.connected_components.findSet(node_number)
+
+    def sameComponent(self, first_node_number, second_node_number):
         '''
-        This method gets the parent node number of a given node
+        This method checks whether two nodes are in the same connected component, ignoring the direction of the edges
 
         Parameters :
-            node_number : int
-                The number of the node
+            first_node_number : int
+                The first node
+            second_node_number : int
+                The second node
 
-        Returns : 
-            parent : int
-                The node number of the parent node
+        Returns :
+            is_same_component : Boolean
+                Whether the nodes are connected
         '''
 
-        return self.nodes[node_number].parent
+        self.buildDeferredAdjacency()
 
-    def getNodeFinishedTime(self, node_number):
+        return self.connected_components.isSameSet(first_node_number, second_node_number)
+
+    def getComponentCount(self):
+        '''
+        This method returns how many connected components the graph currently has, ignoring the direction of the edges
+
+        Unlike getIndependantSegmentCount, the graph does not need to have been traversed
+
+        Returns :
+            component_count : int
+                The number of connected components
+        '''
+
+        self.buildDeferredAdjacency()
+
+        return self.connected_components.getSetCount()
+
+    def getStronglyConnectedComponents(self):
+        '''
+        This method finds the strongly connected components of the graph using tarjan's algorithm with an explicit stack
+
+        Each stack entry holds a node and the position of the next neighbor to check, so graphs deeper than the recursion limit can be searched
+        The traversal information of the nodes is left unchanged
+
+        Returns :
+            components : [[int]]
+                The nodes in each strongly connected component, with each component listed before any component that has an edge into it
+        '''
+
+        self.buildDeferredAdjacency()
+
+        nodes = self.nodes
+        index_of_nodes = [None] * self.number_of_nodes
+        lowest_reachable_index = [0] * self.number_of_nodes
+        is_on_component_stack = [False] * self.number_of_nodes
+        component_stack = []
+        components = []
+        next_index = 0
+
+        for root_number in range(0, self.number_of_nodes):
+            if index_of_nodes[root_number] != None:
+                continue
+
+            index_of_nodes[root_number] = next_index
+            lowest_reachable_index[root_number] = next_index
+            next_index += 1
+            component_stack.append(root_number)
+            is_on_component_stack[root_number] = True
+
+            stack = [[root_number, 0]]
+            while stack:
+                stack_entry = stack[-1]
+                node_number, neighbor_position = stack_entry
+                connected_node_numbers = nodes[node_number].connected_nodes
+                descended = False
+
+                while neighbor_position < len(connected_node_numbers):
+                    neighbor_number = connected_node_numbers[neighbor_position]
+                    neighbor_position += 1
+
+                    if index_of_nodes[neighbor_number] == None:
+                        index_of_nodes[neighbor_number] = next_index
+                        lowest_reachable_index[neighbor_number] = next_index
+                        next_index += 1
+                        component_stack.append(neighbor_number)
+                        is_on_component_stack[neighbor_number] = True
+                        stack_entry[1] = neighbor_position
+                        stack.append([neighbor_number, 0])
+                        descended = True
+                        break
+
+                    elif is_on_component_stack[neighbor_number] and index_of_nodes[neighbor_number] < lowest_reachable_index[node_number]:
+                        lowest_reachable_index[node_number] = index_of_nodes[neighbor_number]
+
+                if descended:
+                    continue
+
+                stack.pop()
+                if stack and lowest_reachable_index[node_number] < lowest_reachable_index[stack[-1][0]]:
+                    lowest_reachable_index[stack[-1][0]] = lowest_reachable_index[node_number]
+
+                if lowest_reachable_index[node_number] == index_of_nodes[node_number]:
+                    component = []
+                    while True:
+                        component_node_number = component_stack.pop()
+                        is_on_component_stack[component_node_number] = False
+                        component.append(component_node_number)
+                        if component_node_number == node_number:
+                            break
+                    components.append(component)
+
+        return components
+
+    def topologicalSortUsingKahn(self):
+        '''
+        This method orders the nodes of a directed graph so every edge runs from an earlier node to a later one, using kahn's algorithm
+
+        Nodes with no remaining incoming edges are taken from a queue, and taking a node removes its outgoing edges
+        If some nodes are never taken, they are part of or reachable from a cycle and there is no order
+
+        Returns :
+            sorted_nodes : [int] (or None if the graph has a cycle)
+                The nodes in topological order
+        '''
+
+        self.buildDeferredAdjacency()
+
+        nodes = self.nodes
+        incoming_edge_counts = [0] * self.number_of_nodes
+        for node_number in range(0, self.number_of_nodes):
+            for neighbor_number in nodes[node_number].connected_nodes:
+                incoming_edge_counts[neighbor_number] += 1
+
+        ready_nodes = deque(node_number for node_number in range(0, self.number_of_nodes) if incoming_edge_counts[node_number] == 0)
+        sorted_nodes = []
+
+        while ready_nodes:
+            node_number = ready_nodes.popleft()
+            sorted_nodes.append(node_number)
+            for neighbor_number in nodes[node_number].connected_nodes:
+                incoming_edge_counts[neighbor_number] -= 1
+                if incoming_edge_counts[neighbor_number] == 0:
+                    ready_nodes.append(neighbor_number)
+
+        if len(sorted_nodes) < self.number_of_nodes:
+            return None
+        return sorted_nodes
+
+    def hasCycle(self):
+        '''
+        This method checks whether a directed graph contains a cycle
+
+        Returns :
+            has_cycle : Boolean
+                Whether there is no topological order for the graph
+        '''
+
+        return self.topologicalSortUsingKahn() == None
+
+    def getUnvisitedNodes(self):
+        '''
+        This method counts how many unvisited nodes are in a graph
+
+        Returns :
+            unvisited_nodes : [int]
+                The list of unvisited nodes in the graph
+        '''
+
+        unvisited_nodes = []
+        for node_number in range(0, self.number_of_nodes):
+            if self.getNodeDiscoveredTime(node_number) == None:
+                unvisited_nodes.append(node_number)
+        return unvisited_nodes
+    
+    
+    def getNodeDiscoveredTime(self, node_number):
+        '''
+        This method gets the discovered time of a given node
+
+        Parameters :
+            node_number : int
+                The number of the node
+
+        Returns : 
+            discovered_time : int
+                The counter value when the node was discovered
+        '''
+
+        self.buildDeferredAdjacency()
+
+        node = self.nodes[node_number]
+        return node.discovered_time if node.traversal_epoch == self.traversal_epoch else None
+    
+    def getNodeParent(self, node_number):
+        '''
+        This method gets the parent node number of a given node
+
+        Parameters :
+            node_number : int
+                The number of the node
+
+        Returns : 
+            parent : int
+                The node number of the parent node
+        '''
+
+        self.buildDeferredAdjacency()
+
+        node = self.nodes[node_number]
+        return node.parent if node.traversal_epoch == self.traversal_epoch else None
+
+    def getNodeFinishedTime(self, node_number):
         '''
         This method gets the finished time of a given node
 
@@ -521,7 +1150,10 @@ class Graph():
                 The counter value when the node was finished
         '''
 
-        return self.nodes[node_number].finished_time
+        self.buildDeferredAdjacency()
+
+        node = self.nodes[node_number]
+        return node.finished_time if node.traversal_epoch == self.traversal_epoch else None
         
     def printGraphSummary(self):
         '''
@@ -546,6 +1178,8 @@ class Graph():
         It relies on the edges being weighted
         '''
 
+        self.buildDeferredAdjacency()
+
         for weighted_edge in self.weighted_edges:
             weighted_edge.printEdge()
         
@@ -556,6 +1190,8 @@ class Graph():
         It relies on the edges being weighted
         '''
 
+        self.buildDeferredAdjacency()
+
         for weighted_edge in self.weighted_edges:
             weighted_edge.printEdgeAbbreviated()
         print()
@@ -567,6 +1203,8 @@ class Graph():
         It relies on the edges being weighted
         '''
 
+        self.buildDeferredAdjacency()
+
         self.weighted_edges = sorted(self.weighted_edges, key=lambda edg_data: edg_data.weight)
 
     def shortestPathFromNodeUsingBellmanFord(self, start_node):
@@ -587,71 +1225,138 @@ class Graph():
                 The list of the parent node for the route from the starting node to every other node
         '''
 
-        distances_to_nodes = []
-        parents_for_nodes = []
-        for _ in range(0,self.number_of_nodes):
-            distances_to_nodes.append(None)
-            parents_for_nodes.append(None)
-            
+        self.buildDeferredAdjacency()
 
+        distances_to_nodes = [None] * self.number_of_nodes
+        parents_for_nodes = [None] * self.number_of_nodes
         distances_to_nodes[start_node] = 0
 
+        # read every edge once into flat tuples rather than calling getStartEndWeight on every pass
+        edges = [edge.getStartEndWeight() for edge in self.weighted_edges]
+        is_directed = self.is_directed
+
         for i in range(0,self.number_of_nodes):
-            for j in range(0,len(self.weighted_edges)):
-                edge = self.weighted_edges[j]
-                start_node, end_node, edge_weight = edge.getStartEndWeight()
+            is_changed = False
+            for edge_start, edge_end, edge_weight in edges:
 
                 # relax along the edge from start to end
-                if distances_to_nodes[start_node] != None and ( (distances_to_nodes[end_node]!= None and distances_to_nodes[start_node] + edge_weight < distances_to_nodes[end_node]) or distances_to_nodes[end_node] == None) :
-                    distances_to_nodes[end_node] = distances_to_nodes[start_node] + edge_weight
-                    parents_for_nodes[end_node] = start_node
-
-                    # returns None if there is a negative edge loop
-                    if i == self.number_of_nodes - 1:
-                        return None, None
-                
-                # if the graph does not have edge directions
-                # also relax along the edge from end to start
-                if not self.is_directed :
-                    if distances_to_nodes[end_node] != None and ( (distances_to_nodes[start_node]!= None and distances_to_nodes[end_node] + edge_weight < distances_to_nodes[start_node]) or distances_to_nodes[start_node] == None) :
-                        distances_to_nodes[start_node] = distances_to_nodes[end_node] + edge_weight
-                        parents_for_nodes[start_node] = end_node
-
+                start_distance = distances_to_nodes[edge_start]
+                if start_distance != None :
+                    end_distance = distances_to_nodes[edge_end]
+                    if end_distance == None or start_distance + edge_weight < end_distance :
                         # returns None if there is a negative edge loop
                         if i == self.number_of_nodes - 1:
                             return None, None
+                        distances_to_nodes[edge_end] = start_distance + edge_weight
+                        parents_for_nodes[edge_end] = edge_start
+                        is_changed = True
+                
+                # if the graph does not have edge directions
+                # also relax along the edge from end to start
+                if not is_directed :
+                    end_distance = distances_to_nodes[edge_end]
+                    if end_distance != None :
+                        start_distance = distances_to_nodes[edge_start]
+                        if start_distance == None or end_distance + edge_weight < start_distance :
+                            # returns None if there is a negative edge loop
+                            if i == self.number_of_nodes - 1:
+                                return None, None
+                            distances_to_nodes[edge_start] = end_distance + edge_weight
+                            parents_for_nodes[edge_start] = edge_end
+                            is_changed = True
+
+            # a pass without any changes means every distance is final
+            if not is_changed:
+                break
     
         return distances_to_nodes, parents_for_nodes
+
+    def shortestPathFromNodeUsingQueueBellmanFord(self, start_node):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using a queue based bellman ford algorithm
+
+        Only the edges out of nodes whose distance has changed are relaxed, using the compressed sparse row copy of the graph
+        If there is a negative edge loop the method returns none instead of both arrays
+
+        Parameters :
+            start_node : int
+                The node that each node's distance is being calculated from
+        
+        Returns :
+            distances_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the distance from the starting node to every other node
+            parents_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        return self.getCompressedSparseRow().shortestPathFromNodeUsingQueueBellmanFord(start_node)
     
-    def getBellmanFordDirectedComparisonDataFrame(self, start_node):
+    def shortestPathFromNodeUsingVectorizedBellmanFord(self, start_node, is_directed=None):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using a vectorized bellman ford algorithm
+
+        Every edge is relaxed in one numpy operation per pass over the compressed sparse row copy's edge arrays
+        If there is a negative edge loop the method returns none instead of both arrays
+
+        Parameters :
+            start_node : int
+                The node that each node's distance is being calculated from
+            is_directed : Boolean, optional
+                Whether the edges only run from their start node to their end node (default is None, which uses the graph's setting)
+        
+        Returns :
+            distances_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the distance from the starting node to every other node
+            parents_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        return self.getCompressedSparseRow().shortestPathFromNodeUsingVectorizedBellmanFord(start_node, is_directed=is_directed)
+
+    def getBellmanFordDirectedComparison(self, start_node, is_vectorized=False):
+        '''
+        This algorithm finds the distance and parent to reach each node if the graph is directed or undirected, keeping them in numpy arrays
+
+        Parameters : 
+            start_node : int
+                The index of the node to start finding the path
+            is_vectorized : Boolean, optional
+                Whether the vectorized bellman ford algorithm should be used (default is False)
+
+        Returns :
+            comparison_result : BellmanFordComparisonResult
+                The undirected and directed distances and parents of each node
+        '''
+
+        from GraphResults import BellmanFordComparisonResult
+
+        if is_vectorized:
+            bellman_ford_distances, bellman_ford_parents = self.shortestPathFromNodeUsingVectorizedBellmanFord(start_node=start_node, is_directed=False)
+            bellman_ford_directed_distances, bellman_ford_directed_parents = self.shortestPathFromNodeUsingVectorizedBellmanFord(start_node=start_node, is_directed=True)
+        else:
+            was_directed = self.is_directed
+            self.is_directed = False
+            bellman_ford_distances, bellman_ford_parents = self.shortestPathFromNodeUsingBellmanFord(start_node=start_node)
+            self.is_directed = True
+            bellman_ford_directed_distances, bellman_ford_directed_parents = self.shortestPathFromNodeUsingBellmanFord(start_node=start_node)
+            self.is_directed = was_directed
+
+        return BellmanFordComparisonResult(self.number_of_nodes, bellman_ford_distances, bellman_ford_parents, bellman_ford_directed_distances, bellman_ford_directed_parents,
+                                           is_integer_weighted=self.getCompressedSparseRow().weight_typecode == 'q')
+
+    def getBellmanFordDirectedComparisonDataFrame(self, start_node, is_vectorized=False):
         '''
         This algorithm creates a datafrom of the distance and parent to reach each node if the graph is directed or undirected
 
         Parameters : 
             start_node : int
                 The index of the node to start finding the path
+            is_vectorized : Boolean, optional
+                Whether the vectorized bellman ford algorithm should be used (default is False)
         '''
 
         print(f"\nThe shortest distance to each node using bellman ford from node {start_node}:")
-        was_directed = self.is_directed
-        self.is_directed = False
-        bellman_ford_distances, bellman_ford_parents = self.shortestPathFromNodeUsingBellmanFord(start_node=start_node)
-        self.is_directed = True
-        bellman_ford_directed_distances, bellman_ford_directed_parents = self.shortestPathFromNodeUsingBellmanFord(start_node=start_node)
-        self.is_directed = was_directed
-
-        destination_nodes = []
-        for i in range(0,self.number_of_nodes):
-            destination_nodes.append(i)
-
-        bellman_ford_dictionary = {
-            "Destination Node": destination_nodes,
-            "Undirected Distance":bellman_ford_distances,
-            "Undirected Parents": bellman_ford_parents,
-            "Directed Distance": bellman_ford_directed_distances,
-            "Directed Parents":bellman_ford_directed_parents
-        }
-        bellman_ford_dataframe = pd.DataFrame.from_dict(bellman_ford_dictionary)
+        bellman_ford_dataframe = self.getBellmanFordDirectedComparison(start_node, is_vectorized=is_vectorized).toDataFrame()
         print(bellman_ford_dataframe)
         return bellman_ford_dataframe
     
@@ -659,6 +1364,8 @@ class Graph():
         '''
         This method finds the shortest path between a given start node and a given end node
 
+        If the shortest path cache is enabled, the search from the start node is cached and the path is rebuilt from its parents
+
         Parameters :
             start_node_index : int
                 The index of the start node for the route
@@ -672,9 +1379,22 @@ class Graph():
                 The distance of the path to the end node
         '''
 
-        priority_queue = MinHeapForObjects.MinHeapForObjects()
-        start_node = self.nodes[start_node_index]
-        end_node = self.nodes[end_node_index]
+        self.buildDeferredAdjacency()
+
+        if self.shortest_path_cache != None:
+            distances_to_nodes, parents_for_nodes = self.shortest_path_cache.getResult(start_node_index)
+            if distances_to_nodes == None:
+                distances_to_nodes, parents_for_nodes = self.shortestPathsFromNodeUsingDijkstra(start_node_index)
+                self.shortest_path_cache.storeResult(start_node_index, distances_to_nodes, parents_for_nodes)
+            return self.getPathFromParents(parents_for_nodes, start_node_index, end_node_index), distances_to_nodes[end_node_index]
+
+        self.resetAllNodesTrackersForDijkstra()
+
+        nodes = self.nodes
+        search_epoch = self.search_epoch
+        priority_queue = MinHeapForObjects.IndexedMinHeapForObjects()
+        start_node = self.getNodeForSearch(start_node_index)
+        end_node = self.getNodeForSearch(end_node_index)
         found_end_node = False
 
         start_node.distance = 0
@@ -684,8 +1404,7 @@ class Graph():
 
         while not priority_queue.isEmpty() :
             current_node = priority_queue.deleteItem(0)
-            current_node.is_visted = True
-            current_node.in_in_queue = False
+            current_node.is_visited = True
 
             if current_node.number == end_node.number :
                 end_node = current_node
@@ -696,13 +1415,15 @@ class Graph():
             neighbor_weights = current_node.connected_edge_weights
 
             for i in range(0,len(neighbors)):
-                neighbor_node = self.nodes[neighbors[i]]
+                neighbor_node = nodes[neighbors[i]]
+                if neighbor_node.search_epoch != search_epoch:
+                    neighbor_node.resetSearchForEpoch(search_epoch)
                 edge_weight = neighbor_weights[i]
 
                 if neighbor_node.is_visited == False and ( (neighbor_node.distance != None and neighbor_node.distance > current_node.distance + edge_weight) or neighbor_node.distance == None ):
                     # print(f"({neighbor_node.number}) -> Dist = {current_node.distance + edge_weight} and Parent = ({current_node.number})")
                     neighbor_node.distance = current_node.distance + edge_weight
-                    neighbor_node.parent = current_node.number
+                    neighbor_node.search_parent = current_node.number
                     if not neighbor_node.is_in_queue :
                         priority_queue.addItem(neighbor_node)
                     else :
@@ -713,51 +1434,504 @@ class Graph():
             parent = end_node.number
             while parent != None :
                 path.insert(0, parent)
-                parent_node = self.nodes[parent]
-                parent = parent_node.parent
+                parent_node = nodes[parent]
+                parent = parent_node.search_parent
         else:
             path = None
 
         # print(f"Calculating from {start_node_index} to {end_node_index} distance is {end_node.distance}")
         return path, end_node.distance
-    
+
+    def shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(self, start_node_index, end_node_index):
+        '''
+        This method finds the shortest path between a given start node and a given end node using dijkstra's algorithm from both ends at once
+
+        The search runs over the compressed sparse row copy of the graph
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+
+        Returns :
+            path : [int]
+                the path of nodes to reach the end node
+            distance : int
+                The distance of the path to the end node
+        '''
+
+        return self.getCompressedSparseRow().shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(start_node_index, end_node_index)
+
+    def shortestPathBetweenTwoNodesUsingContractionHierarchy(self, start_node_index, end_node_index):
+        '''
+        This method finds the shortest path between a given start node and a given end node using the graph's contraction hierarchy
+
+        The hierarchy is built by the first query after edges are added, which is far slower than a single dijkstra search,
+        but every later query only searches upward from both ends of the route
+        The weights must not be negative
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+
+        Returns :
+            path : [int]
+                the path of nodes to reach the end node (None if it can not be reached)
+            distance : int
+                The distance of the path to the end node (None if it can not be reached)
+        '''
+
+        return self.getContractionHierarchy().shortestPathBetweenTwoNodes(start_node_index, end_node_index)
+
+    def shortestPathBetweenTwoNodesUsingAStar(self, start_node_index, end_node_index, heuristic):
+        '''
+        This method finds the shortest path between a given start node and a given end node using the A* algorithm
+
+        The search runs over the compressed sparse row copy of the graph
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+            heuristic : function(int, int)
+                A function taking a node and the end node which returns a lower bound on the distance between them,
+                such as CompressedSparseRowGraph.getEuclideanHeuristic(coordinates)
+
+        Returns :
+            path : [int]
+                the path of nodes to reach the end node
+            distance : int
+                The distance of the path to the end node
+        '''
+
+        return self.getCompressedSparseRow().shortestPathBetweenTwoNodesUsingAStar(start_node_index, end_node_index, heuristic)
+
+    def shortestPathsFromNodeUsingDijkstra(self, start_node_index):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using dijkstra's algorithm
+
+        Every reachable node is settled in a single pass, so the results can answer every destination from the start node
+
+        Parameters :
+            start_node_index : int
+                The index of the node that each node's distance is being calculated from
+
+        Returns :
+            distances_to_nodes : [int]
+                The list of the distance from the starting node to every other node (None if the node can not be reached)
+            parents_for_nodes : [int]
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        self.buildDeferredAdjacency()
+
+        self.resetAllNodesTrackersForDijkstra()
+
+        nodes = self.nodes
+        search_epoch = self.search_epoch
+        priority_queue = MinHeapForObjects.IndexedMinHeapForObjects()
+        start_node = self.getNodeForSearch(start_node_index)
+        start_node.distance = 0
+        priority_queue.addItem(start_node)
+
+        while not priority_queue.isEmpty() :
+            current_node = priority_queue.deleteItem(0)
+            current_node.is_visited = True
+
+            neighbors = current_node.connected_nodes
+            neighbor_weights = current_node.connected_edge_weights
+
+            for i in range(0,len(neighbors)):
+                neighbor_node = nodes[neighbors[i]]
+                if neighbor_node.search_epoch != search_epoch:
+                    neighbor_node.resetSearchForEpoch(search_epoch)
+                new_distance = current_node.distance + neighbor_weights[i]
+
+                if neighbor_node.distance == None or new_distance < neighbor_node.distance :
+                    neighbor_node.distance = new_distance
+                    neighbor_node.search_parent = current_node.number
+                    if not neighbor_node.is_in_queue :
+                        priority_queue.addItem(neighbor_node)
+                    else :
+                        priority_queue.updateItemPriority(neighbor_node)
+
+        distances_to_nodes = []
+        parents_for_nodes = []
+        for i in range(0, self.number_of_nodes):
+            node = nodes[i]
+            if node.search_epoch == search_epoch:
+                distances_to_nodes.append(node.distance)
+                parents_for_nodes.append(node.search_parent)
+            else:
+                distances_to_nodes.append(None)
+                parents_for_nodes.append(None)
+
+        return distances_to_nodes, parents_for_nodes
+
+    def shortestPathsFromNodeUsingDeltaStepping(self, start_node_index, delta=None, n_workers=1, worker_pool=None):
+        '''
+        This method calculates the shortest distance from a starting node to every other node using delta stepping on the compressed sparse row graph
+
+        Rather than settling one node at a time, every node within a band of width delta of tentative distance has its edges relaxed at once,
+        so the distances match dijkstra's algorithm while the parents may differ between routes of equal length
+
+        Parameters :
+            start_node_index : int
+                The index of the node that each node's distance is being calculated from
+            delta : float, optional
+                The bucket width (default is None, which picks one from the edge weights)
+            n_workers : int, optional
+                The number of worker processes relaxing large buckets (default is 1, which works in this process)
+            worker_pool : DeltaSteppingWorkerPool, optional
+                Workers from createDeltaSteppingWorkerPool to search with, which are left running for later searches (default is None)
+
+        Returns :
+            distances_to_nodes : [int]
+                The list of the distance from the starting node to every other node (None if the node can not be reached)
+            parents_for_nodes : [int]
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        return self.getCompressedSparseRow().shortestPathsFromNodeUsingDeltaStepping(start_node_index, delta=delta, n_workers=n_workers, worker_pool=worker_pool)
+
+    def createDeltaSteppingWorkerPool(self, n_workers):
+        '''
+        This method starts worker processes which several delta stepping searches on the compressed sparse row graph can share
+
+        Adding an edge rebuilds the compressed sparse row graph, after which the pool can no longer be used
+
+        Parameters :
+            n_workers : int
+                The number of worker processes
+
+        Returns :
+            worker_pool : DeltaSteppingWorkerPool
+                The workers, which should be closed with close or by using them in a with statement
+        '''
+
+        return self.getCompressedSparseRow().createDeltaSteppingWorkerPool(n_workers)
+
+    def kShortestPathsUsingYen(self, start_node_index, end_node_index, k):
+        '''
+        This method finds the k shortest loopless paths between a given start node and a given end node using yen's algorithm
+
+        The spur path searches run on the compressed sparse row graph, masking nodes and edges in place rather than copying the graph
+
+        Parameters :
+            start_node_index : int
+                The index of the start node for the routes
+            end_node_index : int
+                The index of the end node for the routes
+            k : int
+                The most paths to find
+
+        Returns :
+            paths : [([int], int)]
+                Each path and its distance, from shortest to longest (fewer than k if there are not that many loopless paths)
+        '''
+
+        return self.getCompressedSparseRow().kShortestPathsUsingYen(start_node_index, end_node_index, k)
+
+    def getPathFromParents(self, parents_for_nodes, start_node_index, end_node_index):
+        '''
+        This method rebuilds the path from a start node to an end node by following a list of parents back from the end node
+
+        Parameters :
+            parents_for_nodes : [int]
+                The list of the parent node for the route from the start node to every other node
+            start_node_index : int
+                The index of the start node for the route
+            end_node_index : int
+                The index of the end node for the route
+
+        Returns :
+            path : [int]
+                The path of nodes to reach the end node (None if the end node can not be reached)
+        '''
+
+        if end_node_index != start_node_index and parents_for_nodes[end_node_index] == None:
+            return None
+
+        path = []
+        parent = end_node_index
+        while parent != None :
+            path.append(parent)
+            parent = parents_for_nodes[parent]
+        path.reverse()
+        return path
+
+    def shortestPathsBatch(self, pairs, executor=None, sources_per_task=16):
+        '''
+        This method finds the shortest path for each of a batch of (start node, end node) pairs
+
+        The pairs are grouped by start node and one dijkstra search is run over the compressed sparse row graph for each distinct start node,
+        stopping once all of that start node's end nodes are settled
+        The groups are split into tasks of several start nodes, which may be spread over a thread pool or a process pool,
+        where a process pool is sent a copy of the compressed sparse row graph with each task
+
+        Parameters :
+            pairs : [(int, int)]
+                The start node and end node of each query
+            executor : Executor, optional
+                A concurrent.futures executor the tasks are submitted to (default is None, which searches in this thread)
+            sources_per_task : int, optional
+                The number of start nodes searched in each task (default is 16)
+
+        Returns :
+            results : [([int], int)]
+                The path and distance for each pair in the order they were given (None, None if the end node can not be reached)
+        '''
+
+        # the end nodes for each start node, as a dictionary so each is searched for once but stays in order
+        end_nodes_by_start_node = {}
+        for start_node_index, end_node_index in pairs:
+            end_nodes_by_start_node.setdefault(start_node_index, {})[end_node_index] = None
+
+        source_targets = [(start_node_index, list(end_nodes)) for start_node_index, end_nodes in end_nodes_by_start_node.items()]
+        tasks = [source_targets[i:i + sources_per_task] for i in range(0, len(source_targets), sources_per_task)]
+
+        compressed_graph = self.getCompressedSparseRow()
+        if executor == None:
+            task_results = [findPathsFromSources(compressed_graph, task) for task in tasks]
+        else:
+            futures = [executor.submit(findPathsFromSources, compressed_graph, task) for task in tasks]
+            task_results = [future.result() for future in futures]
+
+        results_by_pair = {}
+        for task, source_results in zip(tasks, task_results):
+            for (start_node_index, end_node_indices), results in zip(task, source_results):
+                for end_node_index, result in zip(end_node_indices, results):
+                    results_by_pair[(start_node_index, end_node_index)] = result
+
+        return [results_by_pair[(start_node_index, end_node_index)] for start_node_index, end_node_index in pairs]
+
     def resetAllNodesTrackersForDijkstra(self):
         '''
         This method resets the trackers used for djakstra's algorithm for all nodes in the graph
+
+        The nodes are not visited, instead a new search epoch is started so each node's trackers are cleared when the search first reaches it
         '''
 
-        for i in range(0, self.number_of_nodes):
-            self.nodes[i].resetTrackersForDijkstra()
+        self.startNewSearchEpoch()
+
+    def findAllShortestPathsUsingDijkstra(self, n_workers=1):
+        '''
+        This method finds the shortest distance between every pair of nodes using one run of dijkstra's algorithm per start node,
+        keeping the distances in a dense float64 matrix and the parents in a predecessor matrix from which any path can be rebuilt
+
+        With more than one worker, blocks of start nodes are searched in worker processes which share the compressed sparse row graph
+
+        Parameters :
+            n_workers : int, optional
+                The number of worker processes to search with (default is 1, which searches in this process)
+
+        Returns :
+            all_paths_result : AllPairsShortestPathsResult
+                The distance matrix and predecessor matrix, with a row for each start node
+        '''
+
+        from GraphResults import AllPairsShortestPathsResult
+
+        is_integer_weighted = self.getCompressedSparseRow().weight_typecode == 'q'
+
+        if n_workers > 1:
+            import ParallelShortestPaths
+
+            distance_matrix, parent_matrix = ParallelShortestPaths.findAllShortestPathsInParallel(self.getCompressedSparseRow(), n_workers)
+            return AllPairsShortestPathsResult(distance_matrix, parent_matrix, is_integer_weighted=is_integer_weighted)
+
+        all_paths_result = AllPairsShortestPathsResult.createEmpty(self.number_of_nodes, is_integer_weighted=is_integer_weighted)
+        for start_index in range(0, self.number_of_nodes):
+            distances_list, parents_list = self.shortestPathsFromNodeUsingDijkstra(start_node_index=start_index)
+            all_paths_result.setRow(start_index, distances_list, parents_list)
+
+        return all_paths_result
+
+    def findAllPathsDijkstra(self, include_paths=True, n_workers=1):
+        '''
+        This method finds the shortest distance and path between every pair of nodes using one run of dijkstra's algorithm per start node
+
+        The paths are only rebuilt from the predecessor matrix once the searches are complete, and only if they are requested
+
+        Parameters :
+            include_paths : Boolean, optional
+                Whether the paths should be rebuilt from the predecessor matrix (default is True)
+            n_workers : int, optional
+                The number of worker processes to search with (default is 1, which searches in this process)
+
+        Returns :
+            distances_dataframe : DataFrame
+                The float64 distances between all nodes, with a column for each start node, a row for each end node and NaN if it can not be reached
+            paths_dataframe : DataFrame
+                The paths between all nodes in the same layout as the distances (None if include_paths is False)
+        '''
+
+        return self.findAllShortestPathsUsingDijkstra(n_workers=n_workers).toDataFrames(include_paths=include_paths)
+
+    def findAllShortestPathsUsingJohnson(self):
+        '''
+        This method finds the shortest distance between every pair of nodes using johnson's algorithm, which allows negative edges,
+        keeping the distances in a dense float64 matrix and the parents in a predecessor matrix from which any path can be rebuilt
+
+        One bellman ford run finds a potential for each node, the edges are reweighted so none are negative,
+        and then dijkstra's algorithm is run from every node over the reweighted edges
 
-    def findAllPathsDijkstra(self):
-        distances_dictionary = {}
-        paths_dictionary = {}
+        Returns :
+            all_paths_result : AllPairsShortestPathsResult
+                The distance matrix and predecessor matrix, with a row for each start node (None if there is a negative edge loop)
+        '''
+
+        import numpy as np
+        from GraphResults import AllPairsShortestPathsResult
 
+        compressed_graph = self.getCompressedSparseRow()
+        potentials = compressed_graph.getNodePotentials()
+        if potentials == None:
+            return None
+
+        reweighted_target_weights = compressed_graph.getReweightedTargetWeights(potentials)
+        potentials_array = np.array(potentials, dtype=np.float64)
+
+        all_paths_result = AllPairsShortestPathsResult.createEmpty(self.number_of_nodes, is_integer_weighted=compressed_graph.weight_typecode == 'q')
         for start_index in range(0, self.number_of_nodes):
+            reweighted_distances, parents_list = compressed_graph.shortestPathsFromNodeUsingDijkstra(start_index, target_weights=reweighted_target_weights)
+            all_paths_result.setRow(start_index, reweighted_distances, parents_list)
 
-            distances_list = []
-            paths_list = []
+        # undo the reweighting for all pairs at once, unreachable nodes stay infinite
+        all_paths_result.distance_matrix += potentials_array[np.newaxis, :] - potentials_array[:, np.newaxis]
 
-            for end_index in range(0, self.number_of_nodes):
-                self.resetAllNodesTrackersForDijkstra()
+        return all_paths_result
 
-                path, distance = self.shortestPathBetweenTwoNodesUsingDijkstra(start_node_index=start_index,end_node_index=end_index)
-                distances_list.append(distance)
-                paths_list.append(path)
+    def findAllPathsJohnson(self, include_paths=True):
+        '''
+        This method finds the shortest distance and path between every pair of nodes using johnson's algorithm, which allows negative edges
 
-            distances_dictionary[start_index] = distances_list
-            paths_dictionary[start_index] = paths_list
+        Parameters :
+            include_paths : Boolean, optional
+                Whether the paths should be rebuilt from the predecessor matrix (default is True)
 
-        distances_dataframe = pd.DataFrame.from_dict(distances_dictionary)
-        paths_dataframe = pd.DataFrame.from_dict(paths_dictionary)
+        Returns :
+            distances_dataframe : DataFrame (or None if there is a negative edge loop)
+                The float64 distances between all nodes, with a column for each start node, a row for each end node and NaN if it can not be reached
+            paths_dataframe : DataFrame (or None if there is a negative edge loop)
+                The paths between all nodes in the same layout as the distances (None if include_paths is False)
+        '''
 
-        return distances_dataframe, paths_dataframe
+        all_paths_result = self.findAllShortestPathsUsingJohnson()
+        if all_paths_result == None:
+            return None, None
+
+        return all_paths_result.toDataFrames(include_paths=include_paths)
     
+    def minimumSpanningTreeUsingKruskal(self):
+        '''
+        This method finds a minimum spanning tree using kruskal's algorithm
+
+        A copy of the weighted edges is sorted by weight, and each edge is added to the tree unless its nodes are already connected by the tree,
+        which is checked using a disjoint set
+        The direction of the edges is ignored, and if the graph is not connected the result is a minimum spanning forest
+
+        Returns :
+            tree_edges : [(int,int,int)]
+                The start node, end node and weight of each edge in the tree
+            total_weight : int
+                The sum of the weights of the edges in the tree
+        '''
+
+        self.buildDeferredAdjacency()
+
+        # a sorted copy is used so the graph's edges keep the order they were added in
+        sorted_edges = sorted(self.weighted_edges, key=lambda edge : edge.weight)
+
+        tree_components = DisjointSet(self.number_of_nodes)
+        tree_edges = []
+        total_weight = 0
+
+        for edge in sorted_edges:
+            start, end, weight = edge.getStartEndWeight()
+            if tree_components.union(start, end):
+                tree_edges.append((start, end, weight))
+                total_weight += weight
+                if len(tree_edges) == self.number_of_nodes - 1:
+                    break
+
+        return tree_edges, total_weight
+
+    def minimumSpanningTreeUsingPrim(self):
+        '''
+        This method finds a minimum spanning tree using prim's algorithm
+
+        The tree grows from a node by repeatedly adding the cheapest edge to a node outside of it,
+        with the nodes held in an indexed min heap by the weight of their cheapest edge so each update is a decrease key
+        The direction of the edges is ignored, and if the graph is not connected the result is a minimum spanning forest
+
+        Returns :
+            tree_edges : [(int,int,int)]
+                The start node, end node and weight of each edge in the tree
+            total_weight : int
+                The sum of the weights of the edges in the tree
+        '''
+
+        self.buildDeferredAdjacency()
+
+        if self.is_directed:
+            compressed_graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edges_vis_list, is_directed=False, is_weighted=True)
+        else:
+            compressed_graph = self.getCompressedSparseRow()
+        offsets = compressed_graph.offsets
+        targets = compressed_graph.targets
+        target_weights = compressed_graph.target_weights
+
+        self.resetAllNodesTrackersForDijkstra()
+
+        tree_edges = []
+        total_weight = 0
+
+        for root_index in range(0, self.number_of_nodes):
+            root_node = self.getNodeForSearch(root_index)
+            if root_node.is_visited:
+                continue
+
+            priority_queue = MinHeapForObjects.IndexedMinHeapForObjects()
+            root_node.distance = 0
+            priority_queue.addItem(root_node)
+
+            while not priority_queue.isEmpty() :
+                current_node = priority_queue.deleteItem(0)
+                current_node.is_visited = True
+                if current_node.search_parent != None:
+                    tree_edges.append((current_node.search_parent, current_node.number, current_node.distance))
+                    total_weight += current_node.distance
+
+                for i in range(offsets[current_node.number], offsets[current_node.number + 1]):
+                    neighbor_node = self.getNodeForSearch(targets[i])
+                    weight = target_weights[i]
+
+                    if not neighbor_node.is_visited and (neighbor_node.distance == None or weight < neighbor_node.distance):
+                        neighbor_node.distance = weight
+                        neighbor_node.search_parent = current_node.number
+                        if not neighbor_node.is_in_queue :
+                            priority_queue.addItem(neighbor_node)
+                        else :
+                            priority_queue.updateItemPriority(neighbor_node)
+
+        return tree_edges, total_weight
+
     def visualize_graph(self):
         '''
         This method creates a graphical visualization of the graph using matplotlib and networkx
         '''
 
+        self.buildDeferredAdjacency()
+
+        import networkx as nx
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         options = {"edgecolors": "tab:gray", "node_size": 800, "alpha": 1, "font_color":"whitesmoke", "font_size":16}
         bright_palette = sns.hls_palette(h=.5)
         graph_visualization = nx.DiGraph()
@@ -0,0 +1,94 @@
+import os
+import random
+import tempfile
+import time
+from Graph import Graph
+
+def createRandomGraph(number_of_nodes, edges_per_node=4, maximum_weight=100, seed=0):
+    '''
+    This function creates a directed graph with random edges and random integer weights
+
+    Parameters :
+        number_of_nodes : int
+            The number of nodes in the graph
+        edges_per_node : int, optional
+            The average number of edges leaving each node (default is 4)
+        maximum_weight : int, optional
+            The heaviest edge weight (default is 100)
+        seed : int, optional
+            The seed for the random edges (default is 0)
+
+    Returns :
+        graph : Graph
+            The random graph
+    '''
+
+    randomizer = random.Random(seed)
+    edges = [(randomizer.randrange(number_of_nodes), randomizer.randrange(number_of_nodes), randomizer.randint(1, maximum_weight)) for _ in range(0, number_of_nodes * edges_per_node)]
+    return Graph(number_of_nodes=number_of_nodes, edge_tuples=edges, is_directed=True, is_weighted=True)
+
+def measureDuration(step):
+    '''
+    This function measures how long a step takes
+
+    Parameters :
+        step : function
+            The function running the step and returning its result
+
+    Returns :
+        duration : float
+            The number of seconds taken by the step
+        result : object
+            The result of the step
+    '''
+
+    start = time.perf_counter()
+    result = step()
+    return time.perf_counter() - start, result
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    node_counts = []
+    edge_counts = []
+    file_sizes = []
+    load_methods = []
+    load_durations = []
+    query_durations = []
+    rebuild_durations = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.csr")
+
+        for number_of_nodes in [10000, 100000, 500000]:
+            createRandomGraph(number_of_nodes).save(path)
+
+            for load_method, is_memory_mapped in [("mmap", True), ("copy", False)]:
+                load_duration, graph = measureDuration(lambda : Graph.load(path, mmap=is_memory_mapped))
+                # the first search only reads the loaded rows, then the nodes and edge objects are built when they are first used
+                query_duration, _ = measureDuration(lambda : graph.shortestPathBetweenTwoNodesUsingBidirectionalDijkstra(0, number_of_nodes - 1))
+                rebuild_duration, _ = measureDuration(graph.buildDeferredAdjacency)
+
+                node_counts.append(number_of_nodes)
+                edge_counts.append(graph.getCompressedSparseRow().getEdgeCount())
+                file_sizes.append(os.path.getsize(path) / 1000000)
+                load_methods.append(load_method)
+                load_durations.append(load_duration)
+                query_durations.append(query_duration)
+                rebuild_durations.append(rebuild_duration)
+                graph = None
+
+    dictionary = {
+        "Nodes": node_counts,
+        "Edges": edge_counts,
+        "File MB": file_sizes,
+        "Load": load_methods,
+        "Load Seconds": load_durations,
+        "First Query Seconds": query_durations,
+        "Adjacency Rebuild Seconds": rebuild_durations
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    pd.options.display.width = 200
+    pd.options.display.max_columns = None
+    print(dataframe)
@@ -0,0 +1,112 @@
+import random
+import tracemalloc
+from Graph import Graph, GraphNode, GraphEdgeWithWeight
+
+class DictionaryGraphNode(GraphNode):
+    '''
+    This class is a graph node which keeps a per instance dictionary, to compare against the slot based node
+    '''
+
+class DictionaryGraphEdgeWithWeight(GraphEdgeWithWeight):
+    '''
+    This class is a graph edge which keeps a per instance dictionary, to compare against the slot based edge
+    '''
+
+def measureAllocatedBytes(create_objects):
+    '''
+    This function measures how many bytes are still allocated after a function creates its objects
+
+    Parameters :
+        create_objects : function
+            The function which creates and returns the objects being measured
+
+    Returns :
+        allocated_bytes : int
+            The number of bytes allocated while the objects were created which are still in use
+    '''
+
+    tracemalloc.start()
+    start_bytes, _ = tracemalloc.get_traced_memory()
+    created_objects = create_objects()
+    end_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del created_objects
+    return end_bytes - start_bytes
+
+def measureBytesPerNode(node_class, number_of_nodes):
+    '''
+    This function measures the bytes used by each node, not counting the adjacency lists' contents
+
+    Parameters :
+        node_class : class
+            The node class being measured
+        number_of_nodes : int
+            The number of nodes to create
+
+    Returns :
+        bytes_per_node : float
+            The average number of bytes used by each node
+    '''
+
+    return measureAllocatedBytes(lambda : [node_class(i) for i in range(0, number_of_nodes)]) / number_of_nodes
+
+def measureBytesPerEdge(edge_class, number_of_edges):
+    '''
+    This function measures the bytes used by each weighted edge object
+
+    Parameters :
+        edge_class : class
+            The edge class being measured
+        number_of_edges : int
+            The number of edges to create
+
+    Returns :
+        bytes_per_edge : float
+            The average number of bytes used by each edge
+    '''
+
+    return measureAllocatedBytes(lambda : [edge_class(i, i + 1, i % 100, i) for i in range(0, number_of_edges)]) / number_of_edges
+
+def measureGraphBytesPerEdge(number_of_nodes, number_of_edges, seed=0):
+    '''
+    This function measures the bytes used by a whole graph for each edge, including the nodes, adjacency lists and edge lists
+
+    Parameters :
+        number_of_nodes : int
+            The number of nodes in the graph
+        number_of_edges : int
+            The number of edges in the graph
+        seed : int, optional
+            The seed for the random edges (default is 0)
+
+    Returns :
+        bytes_per_edge : float
+            The average number of bytes used by the graph for each edge
+    '''
+
+    randomizer = random.Random(seed)
+    edges = [(randomizer.randrange(number_of_nodes), randomizer.randrange(number_of_nodes), randomizer.randint(1, 100)) for _ in range(0, number_of_edges)]
+
+    return measureAllocatedBytes(lambda : Graph(number_of_nodes=number_of_nodes, edge_tuples=edges, is_directed=True, is_weighted=True)) / number_of_edges
+
+if __name__ == '__main__':
+    import pandas as pd
+
+    object_count = 200000
+
+    dictionary = {
+        "Object": ["Node", "Node", "Edge", "Edge"],
+        "Storage": ["Slots", "Dictionary", "Slots", "Dictionary"],
+        "Bytes Per Object": [
+            measureBytesPerNode(GraphNode, object_count),
+            measureBytesPerNode(DictionaryGraphNode, object_count),
+            measureBytesPerEdge(GraphEdgeWithWeight, object_count),
+            measureBytesPerEdge(DictionaryGraphEdgeWithWeight, object_count)
+        ]
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    print(dataframe)
+
+    print(f"\nA directed graph of 50000 nodes and {object_count} edges uses {measureGraphBytesPerEdge(50000, object_count):.1f} bytes per edge")
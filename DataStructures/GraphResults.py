@@ -0,0 +1,389 @@
+import numpy as np
+
+def getPredecessorType(number_of_nodes):
+    '''
+    This function chooses the integer type for a matrix of predecessors, using int32 when the node numbers fit, which is a quarter less memory
+    than int64 for the distance and predecessor matrices together
+
+    Parameters :
+        number_of_nodes : int
+            The number of nodes in the graph
+
+    Returns :
+        predecessor_type : type
+            np.int32 or np.int64
+    '''
+
+    return np.int32 if number_of_nodes < 2 ** 31 else np.int64
+
+def getNullableColumn(values, missing_value=-1):
+    '''
+    This function prepares an array for a dataframe column the way pandas treats a list with None entries,
+    keeping whole numbers as integers unless an entry is missing, in which case the column becomes float64 with NaN
+
+    Parameters :
+        values : ndarray
+            The values of the column
+        missing_value : int or float, optional
+            The value marking a missing entry (default is -1)
+
+    Returns :
+        column : ndarray
+            The column values
+    '''
+
+    is_missing = np.isinf(values) if missing_value == np.inf else values == missing_value
+    if not is_missing.any():
+        return values
+    column = values.astype(np.float64)
+    column[is_missing] = np.nan
+    return column
+
+def getListWithNone(values, missing_value=-1, is_integer=True):
+    '''
+    This function converts an array into a python list with None for missing entries
+
+    Parameters :
+        values : ndarray
+            The values being converted
+        missing_value : int or float, optional
+            The value marking a missing entry (default is -1)
+        is_integer : Boolean, optional
+            Whether the values should be python integers (default is True)
+
+    Returns :
+        values_list : [int or float]
+            The values with None for missing entries
+    '''
+
+    if is_integer:
+        return [None if value == missing_value else int(value) for value in values.tolist()]
+    return [None if value == missing_value else value for value in values.tolist()]
+
+class TraversalResult():
+    '''
+    This class holds the result of a graph traversal as numpy arrays, with -1 for the entries a node does not have
+    '''
+
+    def __init__(self, parents, discovered_times, finished_times):
+        '''
+        This method initializes the traversal result
+
+        Parameters :
+            parents : ndarray
+                The int64 parent of each node (-1 for the first node of each segment and the nodes not visited)
+            discovered_times : ndarray
+                The int64 counter value when each node was discovered (-1 if it was not visited)
+            finished_times : ndarray
+                The int64 counter value when each node was finished (-1 if it was not finished)
+        '''
+
+        self.parents = parents
+        self.discovered_times = discovered_times
+        self.finished_times = finished_times
+
+    def getParents(self):
+        '''
+        This method returns the parent of each node
+
+        Returns :
+            parents : [int]
+                The parent of each node (None for the first node of each segment and the nodes not visited)
+        '''
+
+        return getListWithNone(self.parents)
+
+    def toDataFrame(self):
+        '''
+        This method creates a table of the traversal information
+
+        Returns :
+            traversal_table : DataFrame
+                A dataframe with the node, parent, discovered time and finished time of every node
+        '''
+
+        import pandas as pd
+        return pd.DataFrame({
+            "Node": np.arange(len(self.parents), dtype=np.int64),
+            "Parent": getNullableColumn(self.parents),
+            "Discovered": getNullableColumn(self.discovered_times),
+            "Finished": getNullableColumn(self.finished_times)
+        })
+
+class AllPairsShortestPathsResult():
+    '''
+    This class holds the shortest distances between all pairs of nodes as a dense float64 matrix, along with a predecessor matrix from which
+    any path can be rebuilt, so no python object is created for each pair unless a dataframe is requested
+
+    Row i of each matrix holds the searches from start node i, where an unreachable node has an infinite distance and a predecessor of -1
+    '''
+
+    def __init__(self, distance_matrix, predecessor_matrix, is_integer_weighted=True):
+        '''
+        This method initializes the result
+
+        Parameters :
+            distance_matrix : ndarray
+                The float64 distance from each start node (row) to each end node (column)
+            predecessor_matrix : ndarray
+                The node before each end node on the path from each start node (-1 if there is none)
+            is_integer_weighted : Boolean, optional
+                Whether the distances are returned as integers by getDistance (default is True)
+        '''
+
+        self.distance_matrix = distance_matrix
+        self.predecessor_matrix = predecessor_matrix
+        self.is_integer_weighted = is_integer_weighted
+
+    @staticmethod
+    def createEmpty(number_of_nodes, is_integer_weighted=True):
+        '''
+        This method creates a result for a number of nodes with every distance infinite and no predecessors, ready to be filled row by row
+
+        The predecessors are stored with the type from getPredecessorType
+
+        Parameters :
+            number_of_nodes : int
+                The number of nodes in the graph
+            is_integer_weighted : Boolean, optional
+                Whether the distances are returned as integers by getDistance (default is True)
+
+        Returns :
+            result : AllPairsShortestPathsResult
+                The empty result
+        '''
+
+        return AllPairsShortestPathsResult(np.full((number_of_nodes, number_of_nodes), np.inf), np.full((number_of_nodes, number_of_nodes), -1, dtype=getPredecessorType(number_of_nodes)), is_integer_weighted=is_integer_weighted)
+
+    def setRow(self, start_node_index, distances_to_nodes, parents_for_nodes):
+        '''
+        This method stores the result of the search from one start node
+
+        Parameters :
+            start_node_index : int
+                The start node of the search
+            distances_to_nodes : [int]
+                The distance from the start node to every node (None if the node can not be reached)
+            parents_for_nodes : [int]
+                The parent of every node on the routes from the start node (None if there is no parent)
+        '''
+
+        self.distance_matrix[start_node_index] = [np.inf if distance == None else distance for distance in distances_to_nodes]
+        self.predecessor_matrix[start_node_index] = [-1 if parent == None else parent for parent in parents_for_nodes]
+
+    def getDistance(self, start_node_index, end_node_index):
+        '''
+        This method returns the shortest distance between two nodes
+
+        Parameters :
+            start_node_index : int
+                The start node of the route
+            end_node_index : int
+                The end node of the route
+
+        Returns :
+            distance : int
+                The distance of the shortest path (None if the end node can not be reached)
+        '''
+
+        distance = float(self.distance_matrix[start_node_index, end_node_index])
+        if distance == np.inf:
+            return None
+        return int(distance) if self.is_integer_weighted else distance
+
+    def getPath(self, start_node_index, end_node_index):
+        '''
+        This method rebuilds the shortest path between two nodes by following the predecessors back from the end node
+
+        Parameters :
+            start_node_index : int
+                The start node of the route
+            end_node_index : int
+                The end node of the route
+
+        Returns :
+            path : [int]
+                The path of nodes to reach the end node (None if the end node can not be reached)
+        '''
+
+        if self.distance_matrix[start_node_index, end_node_index] == np.inf:
+            return None
+
+        predecessors = self.predecessor_matrix[start_node_index]
+        path = [end_node_index]
+        node = end_node_index
+        while node != start_node_index:
+            node = int(predecessors[node])
+            path.append(node)
+        path.reverse()
+        return path
+
+    def distancesToDataFrame(self):
+        '''
+        This method creates a dataframe of the distances, sharing no memory with the matrix
+
+        Returns :
+            distances_dataframe : DataFrame
+                The float64 distances between all nodes, with a column for each start node, a row for each end node and NaN if it can not be reached
+        '''
+
+        import pandas as pd
+        distances = self.distance_matrix.T.copy()
+        distances[np.isinf(distances)] = np.nan
+        return pd.DataFrame(distances)
+
+    def pathsToDataFrame(self):
+        '''
+        This method creates a dataframe holding a python list for every path, which uses far more memory than the matrices on large graphs
+
+        Returns :
+            paths_dataframe : DataFrame
+                The paths between all nodes, with a column for each start node and a row for each end node
+        '''
+
+        import pandas as pd
+        number_of_nodes = len(self.distance_matrix)
+        paths_dictionary = {}
+        for start_index in range(0, number_of_nodes):
+            # every path from this start node shares the integers of one converted row rather than creating its own
+            predecessors = self.predecessor_matrix[start_index].tolist()
+            is_reachable = np.isfinite(self.distance_matrix[start_index]).tolist()
+            paths_list = []
+            for end_index in range(0, number_of_nodes):
+                if not is_reachable[end_index]:
+                    paths_list.append(None)
+                    continue
+                path = [end_index]
+                node = end_index
+                while node != start_index:
+                    node = predecessors[node]
+                    path.append(node)
+                path.reverse()
+                paths_list.append(path)
+            paths_dictionary[start_index] = paths_list
+        return pd.DataFrame.from_dict(paths_dictionary)
+
+    def toDataFrames(self, include_paths=True):
+        '''
+        This method creates the dataframes of distances and paths
+
+        Parameters :
+            include_paths : Boolean, optional
+                Whether the paths dataframe should be created (default is True)
+
+        Returns :
+            distances_dataframe : DataFrame
+                The distances between all nodes, with a column for each start node and a row for each end node
+            paths_dataframe : DataFrame
+                The paths between all nodes in the same layout as the distances (None if include_paths is False)
+        '''
+
+        if not include_paths:
+            return self.distancesToDataFrame(), None
+        return self.distancesToDataFrame(), self.pathsToDataFrame()
+
+class BellmanFordComparisonResult():
+    '''
+    This class holds the bellman ford distances and parents from one start node when the edges are treated as undirected and as directed
+
+    The distances are float64 with inf where a node can not be reached and the parents are int64 with -1 where there is none,
+    and a search which found a negative edge loop is stored as None
+    '''
+
+    def __init__(self, number_of_nodes, undirected_distances, undirected_parents, directed_distances, directed_parents, is_integer_weighted=True):
+        '''
+        This method initializes the result from the lists returned by the bellman ford methods
+
+        Parameters :
+            number_of_nodes : int
+                The number of nodes in the graph
+            undirected_distances : [int]
+                The distance to each node with undirected edges (None if there is a negative edge loop)
+            undirected_parents : [int]
+                The parent of each node with undirected edges (None if there is a negative edge loop)
+            directed_distances : [int]
+                The distance to each node with directed edges (None if there is a negative edge loop)
+            directed_parents : [int]
+                The parent of each node with directed edges (None if there is a negative edge loop)
+            is_integer_weighted : Boolean, optional
+                Whether the distances are whole numbers in the dataframe when every node can be reached (default is True)
+        '''
+
+        self.number_of_nodes = number_of_nodes
+        self.is_integer_weighted = is_integer_weighted
+        self.undirected_distances = self.getDistanceArray(undirected_distances)
+        self.undirected_parents = self.getParentArray(undirected_parents)
+        self.directed_distances = self.getDistanceArray(directed_distances)
+        self.directed_parents = self.getParentArray(directed_parents)
+
+    def getDistanceArray(self, distances_to_nodes):
+        '''
+        This method converts a list of distances into a float64 array
+
+        Parameters :
+            distances_to_nodes : [int]
+                The distance to each node (None if the node can not be reached)
+
+        Returns :
+            distances : ndarray
+                The distances with inf where a node can not be reached (None if the list is None)
+        '''
+
+        if distances_to_nodes == None:
+            return None
+        return np.array([np.inf if distance == None else distance for distance in distances_to_nodes], dtype=np.float64)
+
+    def getParentArray(self, parents_for_nodes):
+        '''
+        This method converts a list of parents into an int64 array
+
+        Parameters :
+            parents_for_nodes : [int]
+                The parent of each node (None if there is no parent)
+
+        Returns :
+            parents : ndarray
+                The parents with -1 where there is no parent (None if the list is None)
+        '''
+
+        if parents_for_nodes == None:
+            return None
+        return np.array([-1 if parent == None else parent for parent in parents_for_nodes], dtype=np.int64)
+
+    def getDistanceColumn(self, distances):
+        '''
+        This method prepares distances for a dataframe column, keeping integer weighted distances as integers unless a node can not be reached
+
+        Parameters :
+            distances : ndarray
+                The distances with inf where a node can not be reached (or None)
+
+        Returns :
+            column : ndarray
+                The column values (None if the distances are None)
+        '''
+
+        if distances is None:
+            return None
+        column = getNullableColumn(distances, missing_value=np.inf)
+        if column is distances and self.is_integer_weighted:
+            return distances.astype(np.int64)
+        return column
+
+    def toDataFrame(self):
+        '''
+        This method creates a table comparing the undirected and directed results for each destination node
+
+        Returns :
+            bellman_ford_dataframe : DataFrame
+                A dataframe with the distance and parent of each node with undirected and directed edges
+        '''
+
+        import pandas as pd
+        return pd.DataFrame({
+            "Destination Node": np.arange(self.number_of_nodes, dtype=np.int64),
+            "Undirected Distance": self.getDistanceColumn(self.undirected_distances),
+            "Undirected Parents": None if self.undirected_parents is None else getNullableColumn(self.undirected_parents),
+            "Directed Distance": self.getDistanceColumn(self.directed_distances),
+            "Directed Parents": None if self.directed_parents is None else getNullableColumn(self.directed_parents)
+        })
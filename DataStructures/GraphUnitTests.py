@@ -1,5 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import os
+import tempfile
 import unittest
-from Graph import Graph
+from Graph import Graph, GraphNode, GraphEdgeWithWeight
 
 class GraphUnitTests(unittest.TestCase):
     '''
@@ -19,6 +22,44 @@ class GraphUnitTests(unittest.TestCase):
 
         self.number_of_nodes = 10
 
+    def createGraph(self, is_directed, is_weighted=True, is_breadth_first=True):
+        '''
+        This method creates a graph of the ten nodes and thirteen edges set up for the unit tests
+
+        Parameters :
+            is_directed : Boolean
+                Whether the edges only run from their start node to their end node
+            is_weighted : Boolean, optional
+                Whether the weighted edge list is used rather than the unweighted one (default is True)
+            is_breadth_first : Boolean, optional
+                Whether the graph is traversed breadth first (default is True)
+
+        Returns :
+            graph : Graph
+                The graph of the edge list
+        '''
+
+        edge_tuples = self.weighted_edge_list if is_weighted else self.edge_list
+        return Graph(number_of_nodes=self.number_of_nodes, edge_tuples=edge_tuples, is_breadth_first=is_breadth_first, is_directed=is_directed, is_weighted=is_weighted, is_debug=False)
+
+    def assertSearchesMatch(self, search, expected_search, number_of_nodes=None):
+        '''
+        This method checks that a search from every node gives the same result as the search it is compared to
+
+        Parameters :
+            search : function
+                The search being checked, taking a start node
+            expected_search : function
+                The search giving the expected result, taking a start node
+            number_of_nodes : int, optional
+                The number of start nodes (default is None, which uses the number of nodes set up for the unit tests)
+        '''
+
+        if number_of_nodes == None:
+            number_of_nodes = self.number_of_nodes
+        for start_index in range(0, number_of_nodes):
+            self.assertEqual(search(start_index), expected_search(start_index), f"Search from node {start_index}")
+
     def test_undirected_first_node_travel_breadth(self):
         '''
         This method tests undirected breadth first travel from the first node
@@ -39,7 +80,6 @@ class GraphUnitTests(unittest.TestCase):
         self.assertListEqual(unvisited_nodes,[7,8,9])
         self.assertEqual(graph.getNodeDiscoveredTime(6),3)
 
-
     def test_directed_first_node_travel_breadth(self):
         '''
         This method tests directed breadth first travel from the first node
@@ -60,7 +100,6 @@ class GraphUnitTests(unittest.TestCase):
         self.assertListEqual(unvisited_nodes,[2,7,8,9])
         self.assertEqual(graph.getNodeDiscoveredTime(6),2)
 
-
     def test_undirected_first_node_travel_depth(self):
         '''
         This method tests directed breadth first travel from the first node
@@ -247,7 +286,6 @@ class GraphUnitTests(unittest.TestCase):
         distances, paths = graph.findAllPathsDijkstra()
         print(paths)
 
-
     def test_unweighted_undirected_Dijkstra(self):
         '''
         This method tests Dijkstra using an unweighted, undirected graph
@@ -278,5 +316,601 @@ class GraphUnitTests(unittest.TestCase):
         distances, paths = graph.findAllPathsDijkstra()
         print(paths)
 
+    def test_weighted_undirected_single_source_Dijkstra(self):
+        '''
+        This method tests single source Dijkstra against bellman ford using a weighted, undirected graph
+        '''
+
+        graph = self.createGraph(False)
+
+        distances, parents = graph.shortestPathsFromNodeUsingDijkstra(0)
+        bellman_distances, _ = graph.shortestPathFromNodeUsingBellmanFord(0)
+
+        self.assertListEqual(distances, bellman_distances)
+        self.assertListEqual(distances, [0, 2, 3, 6, 7, 5, 3, None, None, None])
+        self.assertListEqual(graph.getPathFromParents(parents, 0, 4), [0, 1, 2, 4])
+        self.assertListEqual(graph.getPathFromParents(parents, 0, 0), [0])
+        self.assertEqual(graph.getPathFromParents(parents, 0, 8), None)
+
+    def test_weighted_directed_all_paths_Dijkstra(self):
+        '''
+        This method tests that all paths Dijkstra matches the point to point searches using a weighted, directed graph
+        '''
+
+        graph = self.createGraph(True)
+
+        distances, paths = graph.findAllPathsDijkstra()
+
+        for start_index in range(0, self.number_of_nodes):
+            for end_index in range(0, self.number_of_nodes):
+                graph.resetAllNodesTrackersForDijkstra()
+                path, distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)
+                self.assertEqual(paths[start_index][end_index], path)
+                if distance == None:
+                    self.assertTrue(distances[start_index].isna()[end_index])
+                else:
+                    self.assertEqual(distances[start_index][end_index], distance)
+
+        distances_only, no_paths = graph.findAllPathsDijkstra(include_paths=False)
+        self.assertTrue(distances_only.equals(distances))
+        self.assertEqual(no_paths, None)
+
+    def test_long_path_traversal(self):
+        '''
+        This method tests breadth first and depth first traversal of a path which is deeper than the recursion limit
+        '''
+
+        path_length = 20000
+        path_edges = [(i, i+1) for i in range(0, path_length - 1)]
+
+        for is_breadth_first in [True, False]:
+            graph = Graph(number_of_nodes=path_length, edge_tuples=path_edges, is_breadth_first=is_breadth_first, is_directed=False, is_debug=False)
+            graph.traverseGraph()
+
+            self.assertEqual(len(graph.getUnvisitedNodes()), 0)
+            self.assertEqual(graph.getIndependantSegmentCount(), 1)
+            self.assertEqual(graph.getNodeParent(path_length - 1), path_length - 2)
+            self.assertEqual(graph.getNodeDiscoveredTime(path_length - 1), path_length - 1)
+
+    def test_weighted_queue_bellman(self):
+        '''
+        This method tests queue based bellman against bellman using weighted, directed and undirected graphs
+        '''
+
+        for is_directed in [False, True]:
+            graph = self.createGraph(is_directed)
+
+            self.assertSearchesMatch(lambda start_index : graph.shortestPathFromNodeUsingQueueBellmanFord(start_index)[0], lambda start_index : graph.shortestPathFromNodeUsingBellmanFord(start_index)[0])
+
+    def test_queue_bellman_negative_edge(self):
+        '''
+        This method tests queue based bellman using a directed graph with a negative edge and an undirected graph with a negative loop
+        '''
+
+        negative_edges = [(0,1,4),(0,2,1),(1,3,-3),(2,1,2)]
+        graph = Graph(number_of_nodes=4, edge_tuples=negative_edges, is_breadth_first=True, is_directed=True, is_weighted=True, is_debug=False)
+
+        distances, parents = graph.shortestPathFromNodeUsingQueueBellmanFord(0)
+        self.assertListEqual(distances, [0, 3, 1, 0])
+        self.assertListEqual(parents, [None, 2, 0, 1])
+
+        negative_edge_loop_edges = [(0,1,1),(1,2,-1),(0,2,1)]
+        graph = Graph(number_of_nodes=3, edge_tuples=negative_edge_loop_edges, is_breadth_first=True, is_directed=False, is_weighted=True, is_debug=False)
+
+        distances, parents = graph.shortestPathFromNodeUsingQueueBellmanFord(0)
+        self.assertEqual(distances, None)
+        self.assertEqual(parents, None)
+
+    def test_weighted_vectorized_bellman(self):
+        '''
+        This method tests vectorized bellman using weighted, directed and undirected graphs
+        '''
+
+        graph = self.createGraph(True)
+
+        distances, parents = graph.shortestPathFromNodeUsingVectorizedBellmanFord(0)
+        self.assertListEqual(parents, [None, 0, None, 6, 3, 4, 1, None, None, None])
+        self.assertListEqual(distances, [0, 2, None, 6, 12, 15, 3, None, None, None])
+
+        # node 5 can be reached with a distance of 5 through either node 2 or node 6
+        distances, parents = graph.shortestPathFromNodeUsingVectorizedBellmanFord(0, is_directed=False)
+        self.assertListEqual(distances, [0, 2, 3, 6, 7, 5, 3, None, None, None])
+        self.assertIn(parents[5], [2, 6])
+
+        vectorized_dataframe = graph.getBellmanFordDirectedComparisonDataFrame(0, is_vectorized=True)
+        dataframe = graph.getBellmanFordDirectedComparisonDataFrame(0)
+        for column in ["Undirected Distance", "Directed Distance", "Directed Parents"]:
+            self.assertTrue(vectorized_dataframe[column].equals(dataframe[column]))
+
+    def test_vectorized_bellman_negative_edge(self):
+        '''
+        This method tests vectorized bellman using a weighted, undirected graph with a negative loop
+        '''
+
+        negative_edge_loop_edges = [(0,1,1),(1,2,-1),(0,2,1)]
+        graph = Graph(number_of_nodes=3, edge_tuples=negative_edge_loop_edges, is_breadth_first=True, is_directed=False, is_weighted=True, is_debug=False)
+
+        distances, parents = graph.shortestPathFromNodeUsingVectorizedBellmanFord(0)
+        self.assertEqual(distances, None)
+        self.assertEqual(parents, None)
+
+        distances, parents = graph.shortestPathFromNodeUsingVectorizedBellmanFord(0, is_directed=True)
+        self.assertListEqual(distances, [0, 1, 0])
+        self.assertListEqual(parents, [None, 0, 1])
+
+    def test_weighted_directed_all_paths_Johnson(self):
+        '''
+        This method tests johnson's algorithm against Dijkstra and bellman using weighted, directed graphs
+        '''
+
+        graph = self.createGraph(True)
+
+        johnson_distances, johnson_paths = graph.findAllPathsJohnson()
+        dijkstra_distances, dijkstra_paths = graph.findAllPathsDijkstra()
+        self.assertTrue(johnson_distances.equals(dijkstra_distances))
+        self.assertTrue(johnson_paths.equals(dijkstra_paths))
+
+        negative_edges = [(0,1,4),(0,2,1),(1,3,-3),(2,1,2),(3,2,2)]
+        graph = Graph(number_of_nodes=4, edge_tuples=negative_edges, is_breadth_first=True, is_directed=True, is_weighted=True, is_debug=False)
+
+        johnson_distances, johnson_paths = graph.findAllPathsJohnson()
+        for start_index in range(0, 4):
+            bellman_distances, _ = graph.shortestPathFromNodeUsingBellmanFord(start_index)
+            for end_index in range(0, 4):
+                if bellman_distances[end_index] == None:
+                    self.assertTrue(johnson_distances[start_index].isna()[end_index])
+                else:
+                    self.assertEqual(johnson_distances[start_index][end_index], bellman_distances[end_index])
+        self.assertListEqual(johnson_paths[0][3], [0, 2, 1, 3])
+
+    def test_all_paths_Johnson_negative_edge(self):
+        '''
+        This method tests johnson's algorithm using a weighted, undirected graph with a negative loop
+        '''
+
+        negative_edge_loop_edges = [(0,1,1),(1,2,-1),(0,2,1)]
+        graph = Graph(number_of_nodes=3, edge_tuples=negative_edge_loop_edges, is_breadth_first=True, is_directed=False, is_weighted=True, is_debug=False)
+
+        distances, paths = graph.findAllPathsJohnson()
+        self.assertEqual(distances, None)
+        self.assertEqual(paths, None)
+        self.assertEqual(graph.findAllShortestPathsUsingJohnson(), None)
+
+    def test_weighted_all_paths_Dijkstra_workers(self):
+        '''
+        This method tests that all paths Dijkstra with worker processes matches the search in this process
+        '''
+
+        for is_directed in [False, True]:
+            graph = self.createGraph(is_directed)
+
+            distances, paths = graph.findAllPathsDijkstra()
+            worker_distances, worker_paths = graph.findAllPathsDijkstra(n_workers=2)
+
+            self.assertTrue(worker_distances.equals(distances.astype("float64")))
+            for start_index in range(0, self.number_of_nodes):
+                for end_index in range(0, self.number_of_nodes):
+                    worker_path = worker_paths[start_index][end_index]
+                    if paths[start_index][end_index] == None:
+                        self.assertEqual(worker_path, None)
+                    else:
+                        self.assertEqual(worker_path[0], start_index)
+                        self.assertEqual(worker_path[-1], end_index)
+
+    def test_connected_components(self):
+        '''
+        This method tests that the connected components are kept up to date as edges are added, without a traversal
+        '''
+
+        graph = self.createGraph(False, is_weighted=False)
+
+        self.assertEqual(graph.getComponentCount(), 2)
+        self.assertTrue(graph.sameComponent(0, 5))
+        self.assertFalse(graph.sameComponent(0, 7))
+        self.assertEqual(graph.componentOf(9), graph.componentOf(7))
+
+        graph.traverseGraph()
+        self.assertEqual(graph.getComponentCount(), graph.getIndependantSegmentCount())
+
+        graph.addWeightedEdge(6, 9, 1)
+        self.assertEqual(graph.getComponentCount(), 1)
+        self.assertTrue(graph.sameComponent(0, 7))
+
+        directed_graph = self.createGraph(True, is_weighted=False)
+        self.assertEqual(directed_graph.getComponentCount(), 2)
+
+    def test_minimum_spanning_tree(self):
+        '''
+        This method tests kruskal's and prim's algorithms using a weighted, undirected graph with two segments
+        '''
+
+        graph = self.createGraph(False)
+
+        kruskal_edges, kruskal_weight = graph.minimumSpanningTreeUsingKruskal()
+        prim_edges, prim_weight = graph.minimumSpanningTreeUsingPrim()
+
+        self.assertEqual(kruskal_weight, 15)
+        self.assertEqual(prim_weight, 15)
+        self.assertEqual(len(kruskal_edges), 8)
+        self.assertEqual(len(prim_edges), 8)
+        self.assertEqual(sum(weight for _, _, weight in prim_edges), prim_weight)
+
+        tree = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=prim_edges, is_directed=False, is_weighted=True, is_debug=False)
+        self.assertEqual(tree.getComponentCount(), 2)
+
+    def test_kruskal_keeps_edge_order(self):
+        '''
+        This method tests that kruskal's algorithm leaves the graph's weighted edges in the order they were added
+        '''
+
+        graph = self.createGraph(False)
+        edges_before = [edge.getStartEndWeight() for edge in graph.weighted_edges]
+
+        graph.minimumSpanningTreeUsingKruskal()
+
+        self.assertListEqual([edge.getStartEndWeight() for edge in graph.weighted_edges], edges_before)
+        self.assertListEqual(edges_before, self.weighted_edge_list)
+        self.assertListEqual([edge.edge_id for edge in graph.weighted_edges], list(range(0, len(self.weighted_edge_list))))
+
+    def test_strongly_connected_components(self):
+        '''
+        This method tests tarjan's algorithm using an unweighted, directed graph
+        '''
+
+        graph = self.createGraph(True, is_weighted=False)
+
+        components = graph.getStronglyConnectedComponents()
+
+        self.assertListEqual(sorted(sorted(component) for component in components), [[0],[1],[2],[3,4,5,6],[7],[8],[9]])
+        component_positions = {}
+        for position in range(0, len(components)):
+            for node_number in components[position]:
+                component_positions[node_number] = position
+        for start, end in self.edge_list:
+            self.assertGreaterEqual(component_positions[start], component_positions[end])
+
+    def test_topological_sort(self):
+        '''
+        This method tests kahn's algorithm using directed graphs with and without a cycle
+        '''
+
+        graph = self.createGraph(True, is_weighted=False)
+        self.assertEqual(graph.topologicalSortUsingKahn(), None)
+        self.assertTrue(graph.hasCycle())
+
+        acyclic_edge_list = [(0,1),(2,1),(2,3),(3,4),(4,5),(5,6),(1,6),(2,4),(2,5),(7,8),(9,8),(9,7)]
+        graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=acyclic_edge_list, is_directed=True, is_debug=False)
+        sorted_nodes = graph.topologicalSortUsingKahn()
+        self.assertFalse(graph.hasCycle())
+
+        self.assertListEqual(sorted(sorted_nodes), list(range(0, self.number_of_nodes)))
+        for start, end in acyclic_edge_list:
+            self.assertLess(sorted_nodes.index(start), sorted_nodes.index(end))
+
+    def test_long_path_components_and_order(self):
+        '''
+        This method tests tarjan's and kahn's algorithms on directed paths which are deeper than the recursion limit
+        '''
+
+        path_length = 20000
+        path_edges = [(i, i+1) for i in range(0, path_length - 1)]
+
+        graph = Graph(number_of_nodes=path_length, edge_tuples=path_edges, is_directed=True, is_debug=False)
+        self.assertEqual(len(graph.getStronglyConnectedComponents()), path_length)
+        self.assertListEqual(graph.topologicalSortUsingKahn(), list(range(0, path_length)))
+
+        graph.addWeightedEdge(path_length - 1, 0, 1)
+        self.assertEqual(len(graph.getStronglyConnectedComponents()), 1)
+        self.assertTrue(graph.hasCycle())
+
+    def test_slot_based_nodes_and_edges(self):
+        '''
+        This method tests that nodes and edges keep their accessors and do not accept attributes outside of their slots
+        '''
+
+        node = GraphNode(3, distance=5)
+        self.assertEqual(node.getPriority(), 5)
+        node.resetTrackersForDijkstra()
+        self.assertEqual(node.distance, None)
+        self.assertFalse(hasattr(node, "__dict__"))
+        with self.assertRaises(AttributeError):
+            node.unknown_attribute = 1
+
+        edge = GraphEdgeWithWeight(start_node=1, end_node=2, weight=7, edge_id=0)
+        self.assertEqual(edge.getStartEndWeight(), (1, 2, 7))
+        self.assertFalse(hasattr(edge, "__dict__"))
+        with self.assertRaises(AttributeError):
+            edge.unknown_attribute = 1
+
+    def test_query_epochs(self):
+        '''
+        This method tests that a search keeps the results of an earlier traversal, that trackers left by an earlier search are ignored and that getNode does not change the node
+        '''
+
+        graph = self.createGraph(False)
+
+        graph.traverseGraph()
+        traversal_result = graph.getTraversalResult()
+        discovered_times = [graph.getNodeDiscoveredTime(node_number) for node_number in range(0, self.number_of_nodes)]
+        finished_times = [graph.getNodeFinishedTime(node_number) for node_number in range(0, self.number_of_nodes)]
+        parents = [graph.getNodeParent(node_number) for node_number in range(0, self.number_of_nodes)]
+        self.assertEqual(len(graph.getUnvisitedNodes()), 0)
+
+        graph.minimumSpanningTreeUsingPrim()
+        path, distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(7, 0)
+        self.assertEqual(path, None)
+        self.assertEqual(distance, None)
+
+        self.assertListEqual([graph.getNodeDiscoveredTime(node_number) for node_number in range(0, self.number_of_nodes)], discovered_times)
+        self.assertListEqual([graph.getNodeFinishedTime(node_number) for node_number in range(0, self.number_of_nodes)], finished_times)
+        self.assertListEqual([graph.getNodeParent(node_number) for node_number in range(0, self.number_of_nodes)], parents)
+        self.assertListEqual(graph.getTraversalResult().getParents(), traversal_result.getParents())
+        self.assertEqual(len(graph.getUnvisitedNodes()), 0)
+
+        # the search from node 7 did not reach node 3, so reading it leaves the trackers of the spanning tree search as they are
+        node = graph.getNode(3)
+        distance = node.distance
+        self.assertNotEqual(node.search_epoch, graph.search_epoch)
+        self.assertNotEqual(distance, None)
+        self.assertIs(graph.getNode(3), node)
+        self.assertNotEqual(node.search_epoch, graph.search_epoch)
+        self.assertEqual(node.distance, distance)
+
+        path, distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 4)
+        self.assertListEqual(path, [0, 1, 2, 4])
+        self.assertEqual(distance, 7)
+        self.assertEqual(graph.shortestPathsFromNodeUsingDijkstra(7)[0], [None, None, None, None, None, None, None, 0, 3, 1])
+
+        graph.resetTraversalInformation()
+        self.assertEqual(graph.getNodeDiscoveredTime(3), None)
+        self.assertEqual(len(graph.getUnvisitedNodes()), self.number_of_nodes)
+
+    def test_cached_Dijkstra(self):
+        '''
+        This method tests that cached dijkstra queries match uncached ones and that adding an edge clears the cache
+        '''
+
+        graph = self.createGraph(True)
+        uncached_results = [[graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index) for end_index in range(0, self.number_of_nodes)] for start_index in range(0, self.number_of_nodes)]
+
+        cache = graph.enableShortestPathCache(maximum_entries=4)
+        for start_index in range(0, self.number_of_nodes):
+            for end_index in range(0, self.number_of_nodes):
+                path, distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)
+                self.assertEqual(distance, uncached_results[start_index][end_index][1])
+                self.assertEqual(path, uncached_results[start_index][end_index][0])
+
+        self.assertEqual(cache.miss_count, self.number_of_nodes)
+        self.assertEqual(cache.hit_count, self.number_of_nodes * (self.number_of_nodes - 1))
+        self.assertEqual(cache.eviction_count, self.number_of_nodes - 4)
+
+        self.assertEqual(graph.shortestPathBetweenTwoNodesUsingDijkstra(9, 0), (None, None))
+        graph.addWeightedEdge(9, 0, 1)
+        self.assertEqual(cache.getEntryCount(), 0)
+        self.assertEqual(graph.shortestPathBetweenTwoNodesUsingDijkstra(9, 0), ([9, 0], 1))
+
+    def test_save_and_load(self):
+        '''
+        This method tests that a graph loaded from a file has the same edges and shortest paths as the saved graph
+        '''
+
+        graph = self.createGraph(True)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.csr")
+            graph.save(path)
+            loaded_graph = Graph.load(path)
+
+            self.assertTrue(loaded_graph.is_directed)
+            self.assertIsNotNone(loaded_graph.getCompressedSparseRow().memory_map)
+            self.assertEqual(loaded_graph.breadthFirstSearchUsingBitsets(0), graph.breadthFirstSearchUsingBitsets(0))
+            self.assertEqual(loaded_graph.nodes, None)
+            self.assertEqual(loaded_graph.weighted_edges, None)
+
+            self.assertListEqual(loaded_graph.getNode(2).connected_nodes, graph.getNode(2).connected_nodes)
+            self.assertListEqual(loaded_graph.weighted_edges_vis_list, graph.weighted_edges_vis_list)
+            self.assertEqual(loaded_graph.deferred_adjacency_path, None)
+            loaded_graph.buildDeferredAdjacency()
+            self.assertEqual(len(loaded_graph.weighted_edges), len(graph.weighted_edges))
+            self.assertIsNotNone(loaded_graph.compressed_sparse_row.memory_map)
+            self.assertSearchesMatch(loaded_graph.shortestPathsFromNodeUsingDijkstra, graph.shortestPathsFromNodeUsingDijkstra)
+            self.assertSearchesMatch(loaded_graph.shortestPathFromNodeUsingQueueBellmanFord, graph.shortestPathFromNodeUsingQueueBellmanFord)
+
+            loaded_graph = None
+
+            # the adjacency is built with the saved direction even when it is first used while the direction is changed
+            for is_memory_mapped in [True, False]:
+                loaded_graph = Graph.load(path, mmap=is_memory_mapped)
+                self.assertTrue(loaded_graph.getBellmanFordDirectedComparison(0).toDataFrame().equals(graph.getBellmanFordDirectedComparison(0).toDataFrame()))
+                self.assertListEqual(loaded_graph.getNode(2).connected_nodes, graph.getNode(2).connected_nodes)
+                loaded_graph = None
+
+    def test_save_and_load_unweighted(self):
+        '''
+        This method tests that an unweighted graph is still unweighted once loaded, so edges without weights can be added to it
+        '''
+
+        graph = self.createGraph(False, is_weighted=False)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.csr")
+            graph.save(path)
+
+            for is_memory_mapped in [True, False]:
+                loaded_graph = Graph.load(path, mmap=is_memory_mapped)
+                self.assertFalse(loaded_graph.is_weighted)
+
+                loaded_graph.addEdges([(2,6)])
+                graph_with_edge = self.createGraph(False, is_weighted=False)
+                graph_with_edge.addEdges([(2,6)])
+                self.assertListEqual(loaded_graph.weighted_edges_vis_list, graph_with_edge.weighted_edges_vis_list)
+                self.assertSearchesMatch(loaded_graph.shortestPathFromNodeUsingBellmanFord, graph_with_edge.shortestPathFromNodeUsingBellmanFord)
+                loaded_graph = None
+
+    def test_batched_Dijkstra(self):
+        '''
+        This method tests that a batch of queries with repeated start and end nodes matches single dijkstra queries in the order given,
+        searching in this thread, in a thread pool and in a process pool
+        '''
+
+        repeated_edge_graph = self.createGraph(True)
+        repeated_edge_graph.addEdges([(0,1,5),(2,4,1),(6,3,9),(2,4,3)])
+        pairs = [(2,6),(0,4),(2,6),(9,0),(2,3),(0,0),(7,8),(2,1),(0,6),(2,4),(1,3)]
+
+        with ThreadPoolExecutor(max_workers=2) as thread_pool, ProcessPoolExecutor(max_workers=2) as process_pool:
+            for graph in [self.createGraph(True), repeated_edge_graph]:
+                expected_distances = [graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)[1] for start_index, end_index in pairs]
+                for executor in [None, thread_pool, process_pool]:
+                    results = graph.shortestPathsBatch(pairs, executor=executor, sources_per_task=2)
+                    self.assertEqual(len(results), len(pairs))
+                    for (start_index, end_index), (path, distance), expected_distance in zip(pairs, results, expected_distances):
+                        self.assertEqual(distance, expected_distance)
+                        if distance == None:
+                            self.assertEqual(path, None)
+                        else:
+                            self.assertEqual(path[0], start_index)
+                            self.assertEqual(path[-1], end_index)
+
+        self.assertEqual(repeated_edge_graph.shortestPathsBatch([(2,4)])[0], ([2,4], 1))
+        graph = self.createGraph(True)
+
+        self.assertEqual(graph.shortestPathsBatch([(0,6)])[0], ([0,1,6], 3))
+
+    def test_bitset_breadth_first_search(self):
+        '''
+        This method tests that the direction optimizing breadth first search matches the traversal table of a breadth first visit from each node
+        '''
+
+        for is_directed in [False, True]:
+            graph = self.createGraph(is_directed, is_weighted=False)
+            for start_index in range(0, self.number_of_nodes):
+                graph.resetTraversalInformation()
+                graph.node_visit(start_index)
+                traversal_table = graph.getTraversalTable()
+
+                for alpha, beta in [(2, 24), (float("inf"), float("inf"))]:
+                    parents, levels = graph.breadthFirstSearchUsingBitsets(start_index, alpha=alpha, beta=beta)
+                    for node_number in range(0, self.number_of_nodes):
+                        expected_parent = traversal_table["Parent"][node_number]
+                        self.assertEqual(parents[node_number], None if expected_parent != expected_parent else expected_parent)
+                        if graph.getNodeDiscoveredTime(node_number) == None:
+                            self.assertEqual(levels[node_number], None)
+                        elif node_number == start_index:
+                            self.assertEqual(levels[node_number], 0)
+                        else:
+                            self.assertEqual(levels[node_number], levels[parents[node_number]] + 1)
+
+        graph = self.createGraph(True, is_weighted=False)
+        self.assertListEqual(graph.breadthFirstSearchUsingBitsets(0)[1], [0, 1, None, 3, 4, 5, 2, None, None, None])
+
+    def test_k_shortest_paths_Yen(self):
+        '''
+        This method tests yen's algorithm against every loopless path found by a depth first search, using weighted directed and undirected graphs
+        '''
+
+        for is_directed in [True, False]:
+            graph = self.createGraph(is_directed)
+            weights = {}
+            for start, end, weight in self.weighted_edge_list:
+                weights[(start, end)] = weight
+                if not is_directed:
+                    weights[(end, start)] = weight
+
+            for start_index, end_index in [(0,4),(2,6),(0,8),(9,8)]:
+                loopless_distances = []
+                stack = [[start_index]]
+                while stack:
+                    path = stack.pop()
+                    if path[-1] == end_index:
+                        loopless_distances.append(sum(weights[(path[i], path[i + 1])] for i in range(0, len(path) - 1)))
+                        continue
+                    for neighbor in graph.getNode(path[-1]).connected_nodes:
+                        if neighbor not in path:
+                            stack.append(path + [neighbor])
+                loopless_distances.sort()
+
+                paths = graph.kShortestPathsUsingYen(start_index, end_index, 5)
+                self.assertListEqual([distance for _, distance in paths], loopless_distances[0:5])
+                self.assertEqual(len(set(tuple(path) for path, _ in paths)), len(paths))
+                for path, distance in paths:
+                    self.assertEqual(len(set(path)), len(path))
+                    self.assertEqual(sum(weights[(path[i], path[i + 1])] for i in range(0, len(path) - 1)), distance)
+
+        self.assertEqual(graph.kShortestPathsUsingYen(0, 0, 3), [([0], 0)])
+        self.assertEqual(graph.kShortestPathsUsingYen(0, 1, 3)[0], graph.shortestPathBetweenTwoNodesUsingDijkstra(0, 1))
+
+    def test_all_paths_result_matrices(self):
+        '''
+        This method tests that the all paths results hold the distances and predecessors in matrices which match the point to point searches
+        '''
+
+        graph = self.createGraph(True)
+
+        for all_paths_result in [graph.findAllShortestPathsUsingDijkstra(), graph.findAllShortestPathsUsingJohnson(), graph.findAllShortestPathsUsingDijkstra(n_workers=2)]:
+            self.assertEqual(all_paths_result.distance_matrix.shape, (self.number_of_nodes, self.number_of_nodes))
+            self.assertEqual(str(all_paths_result.distance_matrix.dtype), "float64")
+            self.assertEqual(str(all_paths_result.predecessor_matrix.dtype), "int32")
+
+            for start_index in range(0, self.number_of_nodes):
+                for end_index in range(0, self.number_of_nodes):
+                    graph.resetAllNodesTrackersForDijkstra()
+                    expected_path, distance = graph.shortestPathBetweenTwoNodesUsingDijkstra(start_index, end_index)
+                    self.assertEqual(all_paths_result.getDistance(start_index, end_index), distance)
+
+                    path = all_paths_result.getPath(start_index, end_index)
+                    if distance == None:
+                        self.assertEqual(path, None)
+                    else:
+                        self.assertEqual(path[0], start_index)
+                        self.assertEqual(path[-1], end_index)
+                        self.assertEqual(len(path), len(expected_path))
+
+        distances, paths = graph.findAllShortestPathsUsingDijkstra().toDataFrames()
+        self.assertTrue(distances.equals(graph.findAllPathsDijkstra()[0]))
+        self.assertTrue(paths.equals(graph.findAllPathsDijkstra()[1]))
+
+    def test_traversal_result(self):
+        '''
+        This method tests that the traversal result arrays match the traversal table
+        '''
+
+        graph = self.createGraph(True, is_weighted=False, is_breadth_first=False)
+        graph.node_visit(2)
+
+        traversal_result = graph.getTraversalResult()
+        traversal_table = graph.getTraversalTable()
+        self.assertTrue(traversal_result.toDataFrame().equals(traversal_table))
+        self.assertListEqual(traversal_result.getParents(), [None if node.parent == None else node.parent for node in [graph.getNode(i) for i in range(0, self.number_of_nodes)]])
+        self.assertEqual(traversal_result.discovered_times[0], -1)
+        self.assertTrue(traversal_table["Discovered"].isna()[0])
+
+        comparison = graph.getBellmanFordDirectedComparison(2)
+        infinity = float("inf")
+        self.assertListEqual(comparison.directed_distances.tolist(), [infinity, 1, 0, 1, 1, 1, 2, infinity, infinity, infinity])
+        self.assertEqual(comparison.directed_parents[0], -1)
+
+    def test_bellman_ford_comparison_result(self):
+        '''
+        This method tests the bellman ford comparison dataframe when both searches find a negative edge loop and when float weights are whole numbers
+        '''
+
+        graph = Graph(number_of_nodes=3, edge_tuples=[(0,1,1),(1,2,-1),(2,0,-1)], is_directed=True, is_weighted=True)
+        comparison = graph.getBellmanFordDirectedComparison(0)
+        self.assertEqual(comparison.undirected_distances, None)
+        self.assertEqual(comparison.directed_distances, None)
+
+        dataframe = comparison.toDataFrame()
+        self.assertListEqual(dataframe["Destination Node"].tolist(), [0, 1, 2])
+        self.assertListEqual(dataframe["Directed Distance"].tolist(), [None, None, None])
+
+        graph = Graph(number_of_nodes=3, edge_tuples=[(0,1,1.0),(1,2,1.0)], is_directed=True, is_weighted=True)
+        dataframe = graph.getBellmanFordDirectedComparison(0).toDataFrame()
+        self.assertEqual(str(dataframe["Directed Distance"].dtype), "float64")
+        self.assertListEqual(dataframe["Directed Distance"].tolist(), [0.0, 1.0, 2.0])
+
+        graph = Graph(number_of_nodes=3, edge_tuples=[(0,1,1),(1,2,1)], is_directed=True, is_weighted=True)
+        dataframe = graph.getBellmanFordDirectedComparison(0).toDataFrame()
+        self.assertEqual(str(dataframe["Directed Distance"].dtype), "int64")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,77 @@
+import os
+import subprocess
+import sys
+import unittest
+
+class ImportTimeUnitTests(unittest.TestCase):
+    '''
+    This class contains unit tests which guard how long the core data structures take to import in a new interpreter
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up the heavy modules which should only be imported once a table or plot is requested, and the longest a core module may take to import
+
+        Importing pandas alone takes over a second, while the core modules import in a few milliseconds, so the budget leaves room for a slow machine
+        '''
+
+        self.heavy_modules = ["pandas", "numpy", "matplotlib", "seaborn", "networkx"]
+        self.core_modules = ["Graph", "CompressedSparseRowGraph", "MinHeapForObjects", "MinHeap", "BTreeNode", "BinarySearchTree", "HashTable", "DynamicArray"]
+        self.import_budget_seconds = 0.25
+
+    def measureColdImport(self, module_name):
+        '''
+        This method imports a module in a new interpreter and reports the import duration and which heavy modules were loaded
+
+        Parameters :
+            module_name : str
+                The name of the module to import
+
+        Returns :
+            import_duration : float
+                The number of seconds taken to import the module
+            loaded_heavy_modules : [str]
+                The heavy modules which were imported along with the module
+        '''
+
+        script = (
+            "import sys, time\n"
+            "start = time.perf_counter()\n"
+            f"import {module_name}\n"
+            "print(time.perf_counter() - start)\n"
+            f"print(','.join(name for name in {self.heavy_modules!r} if name in sys.modules))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout.split("\n")
+
+        return float(output[0]), [name for name in output[1].split(",") if name != ""]
+
+    def test_core_modules_import_within_budget(self):
+        '''
+        This method tests that each core module imports within the budget in a new interpreter, without importing pandas, numpy or the plotting libraries
+        '''
+
+        for module_name in self.core_modules:
+            import_duration, loaded_heavy_modules = self.measureColdImport(module_name)
+            print(f"{module_name} imported in {import_duration * 1000:.1f} ms")
+            self.assertListEqual(loaded_heavy_modules, [], module_name)
+            self.assertLess(import_duration, self.import_budget_seconds, module_name)
+
+    def test_table_output_imports_pandas(self):
+        '''
+        This method tests that pandas is still imported once a traversal table is requested
+        '''
+
+        script = (
+            "import sys\n"
+            "from Graph import Graph\n"
+            "graph = Graph(3, edge_tuples=[(0,1),(1,2)])\n"
+            "graph.node_visit(0)\n"
+            "assert 'pandas' not in sys.modules\n"
+            "print(graph.getTraversalTable().shape)\n"
+        )
+        output = subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True).stdout
+
+        self.assertEqual(output.strip(), "(3, 4)")
+
+if __name__ == '__main__':
+    unittest.main()
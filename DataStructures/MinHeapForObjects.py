@@ -311,6 +311,162 @@ class MinHeapForObjects:
 
         print(f"The heap containing {self.getHeapSize()} elements has a depth of {self.getHeapDepth()} and a root of {self.getHeapRoot().getDescription()}")
     
+class IndexedMinHeapForObjects(MinHeapForObjects):
+    '''
+    This class shall function as a minheap data structure which also keeps a map of each item to its position in the heap
+
+    The position map is updated with every swap so an item can be found in O(1) rather than by scanning the array
+    This makes updating an item's priority and removing an arbitrary item O(log(n))
+    '''
+
+    def __init__(self, array=None):
+        '''
+        This method initializes the indexed minheap data structure based on a given starting array
+
+        Parameters :
+            array : [Object], optional
+                The array that the minheap shall be created around (default is the empty array [])
+        '''
+        if array == None:
+            array = []
+
+        self.positions = {}
+        for index in range(0, len(array)):
+            self.positions[array[index]] = index
+
+        super().__init__(array)
+
+    def swap(self, index_a, index_b):
+        '''
+        This method swaps two items in the list and updates their positions in the position map
+
+        Parameters :
+            index_a : int 
+                The index of one of the items to be swapped
+            index_b : int
+                The index of the other item to be swapped
+        '''
+
+        super().swap(index_a, index_b)
+        self.positions[self.array[index_a]] = index_a
+        self.positions[self.array[index_b]] = index_b
+
+    def addItem(self, item_to_add):
+        '''
+        This method adds an item to the end of the min heap, records its position and then calls bubble up to position the item appropriately
+
+        Paramters :
+            item_to_add : Object
+                The item to be added to the min heap and then positioned appropriately
+        '''
+
+        self.positions[item_to_add] = len(self.array)
+        super().addItem(item_to_add)
+
+    def addItemToFront(self, item_to_add):
+        '''
+        This method adds an item to the min heap
+
+        Inserting at the front would shift the position of every item, so the item is added to the end and bubbled up instead
+
+        Parameters :
+            item_to_add : Object
+                The item to be added to the min heap
+        '''
+
+        self.addItem(item_to_add)
+
+    def getParentIndex(self, index):
+        '''
+        This method gets the index value that would be the parent item for a given index if it exists
+
+        Parameters :
+            index : int
+                The index of the item for which one is finding the parent index
+
+        Returns : 
+            parent_index : int
+                The index the parent have if it exists
+        '''
+
+        return (index - 1) // 2
+
+    def deleteItem(self, index):
+        '''
+        This method removes an item from the array by swapping it with the last item and then deleting the last item
+
+        The item which was moved into the index is then bubbled down or bubbled up as needed
+
+        Parameters :
+            index : int
+                The index of the item to be removed
+
+        Returns :
+            item_deleted : Object
+                The item which was removed from the heap (None if the heap is empty)
+        '''
+
+        if len(self.array) == 0:
+            return None
+
+        last_index = len(self.array) - 1
+        if index != last_index:
+            self.swap(index, last_index)
+
+        item_deleted = self.array.pop(last_index)
+        del self.positions[item_deleted]
+        item_deleted.is_in_queue = False
+
+        if index < len(self.array):
+            self.bubbleDown(index)
+            self.bubbleUp(index)
+
+        return item_deleted
+
+    def removeItem(self, item):
+        '''
+        This method removes a given item from anywhere in the heap
+
+        Parameters :
+            item : Object
+                The item to be removed from the heap
+
+        Returns :
+            item_deleted : Object
+                The item which was removed from the heap
+        '''
+
+        return self.deleteItem(self.positions[item])
+
+    def containsItem(self, item):
+        '''
+        This method returns whether an item is currently in the heap
+
+        Parameters :
+            item : Object
+                The item being checked for
+
+        Returns :
+            is_in_heap : Boolean
+                Whether the item is currently in the heap
+        '''
+
+        return item in self.positions
+
+    def updateItemPriority(self, item):
+        '''
+        This method updates the position of an item in the min heap if it's priority has changed
+
+        Parameters :
+            item : Object
+                The item that may need to be reordered
+        '''
+
+        starting_position = self.positions[item]
+
+        self.bubbleUp(starting_index=starting_position)
+        self.bubbleDown(starting_index=self.positions[item])
+
 if __name__ == '__main__':
 
     starting_array = []
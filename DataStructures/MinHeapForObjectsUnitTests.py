@@ -0,0 +1,112 @@
+import unittest
+import random
+import MinHeapForObjects
+from Graph import GraphNode
+
+class IndexedMinHeapForObjectsUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for the indexed min heap for objects data structue
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up an indexed min heap to be used as the starting point for each unit test
+
+        Starting size : 15
+        Starting priorities : 0-14 in a shuffled order
+        '''
+
+        priorities = list(range(0, 15))
+        random.Random(7).shuffle(priorities)
+
+        self.nodes = []
+        for i in range(0, 15):
+            self.nodes.append(GraphNode(number=i, distance=priorities[i]))
+
+        self.minheap = MinHeapForObjects.IndexedMinHeapForObjects(self.nodes.copy())
+
+    def assertPositionsMatchArray(self):
+        '''
+        This method checks that the position map agrees with the heap's array and that the heap order holds
+        '''
+
+        self.assertEqual(len(self.minheap.positions), self.minheap.getHeapSize())
+        for index in range(0, self.minheap.getHeapSize()):
+            item = self.minheap[index]
+            self.assertEqual(self.minheap.positions[item], index)
+            if index > 0:
+                parent = self.minheap[self.minheap.getParentIndex(index)]
+                self.assertLessEqual(parent.getPriority(), item.getPriority())
+
+    def test_heapify(self):
+        '''
+        This method tests that the starting array is turned into a heap with a matching position map
+        '''
+
+        self.assertPositionsMatchArray()
+        self.assertEqual(self.minheap.getHeapRoot().getPriority(), 0)
+
+    def test_add_item(self):
+        '''
+        This method tests the addItem method for the indexed min heap
+        '''
+
+        new_node = GraphNode(number=15, distance=-1)
+        self.minheap.addItem(new_node)
+
+        self.assertPositionsMatchArray()
+        self.assertIs(self.minheap.getHeapRoot(), new_node)
+        self.assertTrue(new_node.is_in_queue)
+
+    def test_decrease_priority(self):
+        '''
+        This method tests that decreasing an item's priority moves it up the heap
+        '''
+
+        node = self.minheap[self.minheap.getHeapSize() - 1]
+        node.distance = -5
+        self.minheap.updateItemPriority(node)
+
+        self.assertPositionsMatchArray()
+        self.assertIs(self.minheap.getHeapRoot(), node)
+
+    def test_increase_priority(self):
+        '''
+        This method tests that increasing an item's priority moves it down the heap
+        '''
+
+        node = self.minheap.getHeapRoot()
+        node.distance = 100
+        self.minheap.updateItemPriority(node)
+
+        self.assertPositionsMatchArray()
+        self.assertEqual(self.minheap.getHeapRoot().getPriority(), 1)
+
+    def test_remove_item(self):
+        '''
+        This method tests removing arbitrary items from the indexed min heap
+        '''
+
+        for node in self.nodes[0:5]:
+            removed = self.minheap.removeItem(node)
+            self.assertIs(removed, node)
+            self.assertFalse(self.minheap.containsItem(node))
+            self.assertPositionsMatchArray()
+
+        self.assertEqual(self.minheap.getHeapSize(), 10)
+
+    def test_delete_root_in_order(self):
+        '''
+        This method tests that deleting the root repeatedly returns the items in priority order
+        '''
+
+        priorities = []
+        while not self.minheap.isEmpty():
+            priorities.append(self.minheap.deleteItem(0).getPriority())
+            self.assertPositionsMatchArray()
+
+        self.assertListEqual(priorities, list(range(0, 15)))
+        self.assertEqual(self.minheap.deleteItem(0), None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import random
+import time
+from Graph import Graph
+
+def createRandomWeightedGraph(number_of_nodes, number_of_edges, seed=0):
+    '''
+    This function creates a connected, undirected graph with random edge weights
+
+    A random path through every node keeps the graph connected, and the rest of the edges join random pairs of nodes
+
+    Parameters :
+        number_of_nodes : int
+            The number of nodes in the graph
+        number_of_edges : int
+            The number of edges in the graph (at least number_of_nodes - 1)
+        seed : int, optional
+            The seed for the random edges and weights (default is 0)
+
+    Returns :
+        graph : Graph
+            The random weighted graph
+    '''
+
+    randomizer = random.Random(seed)
+
+    node_order = list(range(0, number_of_nodes))
+    randomizer.shuffle(node_order)
+    edges = []
+    for i in range(1, number_of_nodes):
+        edges.append((node_order[i - 1], node_order[i], randomizer.randint(1, 1000)))
+    while len(edges) < number_of_edges:
+        edges.append((randomizer.randrange(number_of_nodes), randomizer.randrange(number_of_nodes), randomizer.randint(1, 1000)))
+
+    return Graph(number_of_nodes=number_of_nodes, edge_tuples=edges, is_directed=False, is_weighted=True)
+
+def measureMinimumSpanningTreeDuration(graph, is_kruskal):
+    '''
+    This function measures how long kruskal's or prim's algorithm takes to find a minimum spanning tree
+
+    Parameters :
+        graph : Graph
+            The graph being measured
+        is_kruskal : Boolean
+            Whether kruskal's algorithm is measured rather than prim's
+
+    Returns :
+        duration : float
+            The number of seconds taken
+        total_weight : int
+            The total weight of the tree found
+    '''
+
+    start = time.perf_counter()
+    if is_kruskal:
+        _, total_weight = graph.minimumSpanningTreeUsingKruskal()
+    else:
+        _, total_weight = graph.minimumSpanningTreeUsingPrim()
+    end = time.perf_counter()
+
+    return end - start, total_weight
+
+if __name__ == '__main__':
+    import pandas as pd
+    import seaborn as sns
+    from matplotlib import pyplot as plt
+
+    node_counts = []
+    densities = []
+    algorithms = []
+    durations = []
+
+    for i in range(6, 12):
+        number_of_nodes = 2**i
+        for density, number_of_edges in [("Sparse", number_of_nodes * 4), ("Dense", number_of_nodes * (number_of_nodes - 1) // 4)]:
+            graph = createRandomWeightedGraph(number_of_nodes, number_of_edges)
+            graph.getCompressedSparseRow()
+            for algorithm, is_kruskal in [("Kruskal", True), ("Prim", False)]:
+                duration, _ = measureMinimumSpanningTreeDuration(graph, is_kruskal)
+                node_counts.append(number_of_nodes)
+                densities.append(density)
+                algorithms.append(algorithm)
+                durations.append(duration)
+
+    dictionary = {
+        "Node Count": node_counts,
+        "Density": densities,
+        "Algorithm": algorithms,
+        "Duration In Seconds": durations
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    print(dataframe)
+
+    bright_palette = sns.hls_palette(h=.5)
+    sns.set_theme(style="whitegrid", palette=bright_palette)
+    plot_axes = sns.lineplot(data=dataframe, x="Node Count", y="Duration In Seconds", hue="Algorithm", style="Density", marker="o")
+    plot_axes.set(xscale="log", yscale="log")
+    plt.gcf().canvas.manager.set_window_title('Minimum Spanning Tree Duration By Graph Size')
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,146 @@
+from array import array
+import multiprocessing
+import numpy as np
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+from GraphResults import getPredecessorType
+
+# the compressed sparse row graph shared with each worker process when the pool starts
+worker_compressed_graph = None
+
+def initializeWorker(compressed_graph, memory_map_path=None):
+    '''
+    This function stores the compressed sparse row graph in a worker process
+
+    When the pool forks its workers, the graph is inherited through copy on write memory rather than being pickled
+    When the workers are not forked, a graph in python arrays is pickled, while a memory mapped graph is loaded again from its file
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph the worker shall search (None if it is loaded from the memory map path)
+        memory_map_path : str, optional
+            The path of the file the worker memory maps the graph from (default is None)
+    '''
+
+    global worker_compressed_graph
+    if memory_map_path != None:
+        compressed_graph = CompressedSparseRowGraph.load(memory_map_path)
+    worker_compressed_graph = compressed_graph
+
+def findShortestPathsForSourceBlock(source_block):
+    '''
+    This function runs single source dijkstra's algorithm for a block of start nodes in a worker process
+
+    The results are written straight into arrays for the whole block, which start out as inf and -1 so only the reached nodes are written
+
+    Parameters :
+        source_block : (int, int)
+            The first start node in the block and the start node after the last one in the block
+
+    Returns :
+        block_start : int
+            The first start node in the block
+        distances_bytes : bytes
+            The distances from each start node to every node as float64 values, with inf where a node can not be reached
+        parents_bytes : bytes
+            The parents for the route from each start node to every node with the type from getPredecessorType, with -1 where there is no parent
+    '''
+
+    block_start, block_end = source_block
+    number_of_nodes = worker_compressed_graph.number_of_nodes
+    distances = array('d', [np.inf]) * ((block_end - block_start) * number_of_nodes)
+    parents = array(np.dtype(getPredecessorType(number_of_nodes)).char, [-1]) * ((block_end - block_start) * number_of_nodes)
+
+    for start_index in range(block_start, block_end):
+        distances_list, parents_list = worker_compressed_graph.shortestPathsFromNodeUsingDijkstra(start_index)
+        row_start = (start_index - block_start) * number_of_nodes
+        for node_index, distance in enumerate(distances_list):
+            if distance != None:
+                distances[row_start + node_index] = distance
+                if parents_list[node_index] != None:
+                    parents[row_start + node_index] = parents_list[node_index]
+
+    return block_start, distances.tobytes(), parents.tobytes()
+
+def getPoolContext(start_method=None):
+    '''
+    This function returns the multiprocessing context for the worker pool, using fork where the platform supports it
+
+    Parameters :
+        start_method : str, optional
+            The start method to use instead, such as "spawn" (default is None, which uses fork where it is supported)
+
+    Returns :
+        context : multiprocessing context
+            The context used to create the worker pool
+    '''
+
+    if start_method != None:
+        return multiprocessing.get_context(start_method)
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+def getWorkerArguments(compressed_graph, context):
+    '''
+    This function chooses how the worker processes receive the graph
+
+    Forked workers inherit the graph as it is. Other workers receive a pickled copy, except for a memory mapped graph, whose memoryviews
+    can not be pickled, so they memory map the same file
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being searched
+        context : multiprocessing context
+            The context used to create the worker pool
+
+    Returns :
+        worker_arguments : tuple
+            The arguments for initializeWorker
+    '''
+
+    if context.get_start_method() == "fork" or compressed_graph.memory_map == None:
+        return (compressed_graph,)
+    if compressed_graph.memory_map_path == None:
+        raise ValueError("A memory mapped graph can only be searched by workers which are not forked if the path of its file is known")
+    return (None, compressed_graph.memory_map_path)
+
+def findAllShortestPathsInParallel(compressed_graph, n_workers, blocks_per_worker=4, start_method=None):
+    '''
+    This function finds the shortest distance between every pair of nodes by spreading blocks of start nodes over a pool of worker processes
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being searched
+        n_workers : int
+            The number of worker processes
+        blocks_per_worker : int, optional
+            How many blocks of start nodes to create for each worker, to balance the work (default is 4)
+        start_method : str, optional
+            The multiprocessing start method for the workers (default is None, which uses fork where it is supported)
+
+    Returns :
+        distance_matrix : ndarray
+            A float64 matrix where row i holds the distances from node i to every node (inf if it can not be reached)
+        parent_matrix : ndarray
+            A matrix with the type from getPredecessorType where row i holds the parent of every node on the routes from node i
+            (-1 if there is no parent)
+    '''
+
+    number_of_nodes = compressed_graph.number_of_nodes
+    distance_matrix = np.empty((number_of_nodes, number_of_nodes), dtype=np.float64)
+    predecessor_type = getPredecessorType(number_of_nodes)
+    parent_matrix = np.empty((number_of_nodes, number_of_nodes), dtype=predecessor_type)
+
+    block_count = max(1, min(number_of_nodes, n_workers * blocks_per_worker))
+    block_size = -(-number_of_nodes // block_count)
+    source_blocks = [(block_start, min(block_start + block_size, number_of_nodes)) for block_start in range(0, number_of_nodes, block_size)]
+
+    context = getPoolContext(start_method)
+    with context.Pool(processes=n_workers, initializer=initializeWorker, initargs=getWorkerArguments(compressed_graph, context)) as pool:
+        for block_start, distances_bytes, parents_bytes in pool.imap_unordered(findShortestPathsForSourceBlock, source_blocks):
+            block_distances = np.frombuffer(distances_bytes, dtype=np.float64).reshape(-1, number_of_nodes)
+            block_parents = np.frombuffer(parents_bytes, dtype=predecessor_type).reshape(-1, number_of_nodes)
+            distance_matrix[block_start:block_start + len(block_distances)] = block_distances
+            parent_matrix[block_start:block_start + len(block_parents)] = block_parents
+
+    return distance_matrix, parent_matrix
@@ -0,0 +1,71 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+import numpy as np
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+from ParallelShortestPaths import findAllShortestPathsInParallel, getPoolContext, getWorkerArguments
+
+class ParallelShortestPathsUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for finding all shortest paths with a pool of worker processes
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up the edge list to be used with the following unit tests
+
+        Number of nodes : 10
+        Number of edges : 13
+        '''
+
+        self.weighted_edge_list = [(0,1,2),(2,1,1),(2,3,4),(3,4,6),(4,5,3),(5,6,2),(1,6,1),(6,3,3),(2,4,4),(2,5,2),(7,8,5),(9,8,2),(9,7,1)]
+        self.number_of_nodes = 10
+
+    def assertMatchesSingleProcess(self, compressed_graph, distance_matrix):
+        '''
+        This method checks every row of a distance matrix against single source dijkstra's algorithm in this process
+
+        Parameters :
+            compressed_graph : CompressedSparseRowGraph
+                The graph which was searched
+            distance_matrix : ndarray
+                The distances found by the worker processes
+        '''
+
+        for start_index in range(0, self.number_of_nodes):
+            distances_list, _ = compressed_graph.shortestPathsFromNodeUsingDijkstra(start_index)
+            self.assertListEqual(distance_matrix[start_index].tolist(), [np.inf if distance == None else distance for distance in distances_list])
+
+    def test_workers_which_are_not_forked(self):
+        '''
+        This method tests that spawned workers receive a graph in python arrays by pickling and map a memory mapped graph's file themselves
+        '''
+
+        compressed_graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=True, is_weighted=True)
+        spawn_context = getPoolContext("spawn")
+        self.assertEqual(getWorkerArguments(compressed_graph, spawn_context), (compressed_graph,))
+        distance_matrix, _ = findAllShortestPathsInParallel(compressed_graph, 2, start_method="spawn")
+        self.assertMatchesSingleProcess(compressed_graph, distance_matrix)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.csr")
+            compressed_graph.save(path)
+            loaded_graph = CompressedSparseRowGraph.load(path)
+
+            self.assertEqual(getWorkerArguments(loaded_graph, spawn_context), (None, path))
+            distance_matrix, _ = findAllShortestPathsInParallel(loaded_graph, 2, start_method="spawn")
+            self.assertMatchesSingleProcess(compressed_graph, distance_matrix)
+
+            if "fork" in multiprocessing.get_all_start_methods():
+                self.assertEqual(getWorkerArguments(loaded_graph, getPoolContext("fork")), (loaded_graph,))
+                distance_matrix, _ = findAllShortestPathsInParallel(loaded_graph, 2, start_method="fork")
+                self.assertMatchesSingleProcess(compressed_graph, distance_matrix)
+
+            loaded_graph.memory_map_path = None
+            with self.assertRaises(ValueError):
+                getWorkerArguments(loaded_graph, spawn_context)
+            loaded_graph = None
+
+if __name__ == '__main__':
+    unittest.main()
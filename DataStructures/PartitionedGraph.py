@@ -0,0 +1,784 @@
+import traceback
+import weakref
+import numpy as np
+from ParallelShortestPaths import getPoolContext
+
+def partitionByNodeRange(number_of_nodes, shard_count):
+    '''
+    This function assigns each node to a shard by splitting the node numbers into equal contiguous ranges
+
+    Parameters :
+        number_of_nodes : int
+            The number of nodes in the graph
+        shard_count : int
+            The number of shards
+
+    Returns :
+        owners : ndarray
+            The shard owning each node
+    '''
+
+    return np.arange(number_of_nodes, dtype=np.int64) * shard_count // max(1, number_of_nodes)
+
+def partitionByLabelPropagation(compressed_graph, shard_count, iteration_count=10, seed=0):
+    '''
+    This function assigns each node to a shard by clustering the graph with label propagation, so densely connected nodes share a shard
+
+    Each node starts with its own label, and in each iteration a random half of the nodes take the label most common among their neighbors,
+    with ties broken at random. The nodes are then ordered by label and cut into equal contiguous ranges, which keeps the shards balanced
+    even when one cluster grows larger than a shard
+
+    Parameters :
+        compressed_graph : CompressedSparseRowGraph
+            The graph being partitioned, whose edges are treated as undirected
+        shard_count : int
+            The number of shards
+        iteration_count : int, optional
+            The number of label propagation iterations (default is 10)
+        seed : int, optional
+            The seed for the random updates and tie breaks (default is 0)
+
+    Returns :
+        owners : ndarray
+            The shard owning each node
+    '''
+
+    number_of_nodes = compressed_graph.number_of_nodes
+    edge_starts, edge_ends, _ = compressed_graph.getEdgeArrays()
+    is_loop = edge_starts == edge_ends
+    neighbor_starts = np.concatenate((edge_starts[~is_loop], edge_ends[~is_loop]))
+    neighbor_ends = np.concatenate((edge_ends[~is_loop], edge_starts[~is_loop]))
+
+    randomizer = np.random.default_rng(seed)
+    labels = np.arange(number_of_nodes, dtype=np.int64)
+
+    for _ in range(0, iteration_count):
+        if len(neighbor_starts) == 0:
+            break
+
+        # count each (node, neighbor label) pair, and keep the most common label for each node with a random tie break
+        pair_keys = neighbor_starts * number_of_nodes + labels[neighbor_ends]
+        unique_pairs, pair_counts = np.unique(pair_keys, return_counts=True)
+        pair_nodes = unique_pairs // number_of_nodes
+        pair_labels = unique_pairs % number_of_nodes
+        pair_order = np.lexsort((randomizer.random(len(unique_pairs)), -pair_counts, pair_nodes))
+        is_first = np.ones(len(pair_order), dtype=bool)
+        is_first[1:] = pair_nodes[pair_order[1:]] != pair_nodes[pair_order[:-1]]
+        best_nodes = pair_nodes[pair_order[is_first]]
+        best_labels = pair_labels[pair_order[is_first]]
+
+        is_updated = randomizer.random(len(best_nodes)) < 0.5
+        labels[best_nodes[is_updated]] = best_labels[is_updated]
+
+    node_order = np.lexsort((np.arange(number_of_nodes), labels))
+    owners = np.empty(number_of_nodes, dtype=np.int64)
+    owners[node_order] = np.arange(number_of_nodes, dtype=np.int64) * shard_count // max(1, number_of_nodes)
+    return owners
+
+class GraphShard():
+    '''
+    This class serves as one shard of a partitioned graph, holding the nodes it owns and the edges leaving them
+
+    The targets are kept as global node numbers along with the shard owning each one, so messages for other shards can be split off without
+    any global arrays, and each edge keeps its position in the whole graph's compressed sparse row targets
+    '''
+
+    def __init__(self, shard_index, nodes, offsets, targets, target_weights, target_positions, target_owners):
+        '''
+        This method initializes the shard
+
+        Parameters :
+            shard_index : int
+                The index of the shard
+            nodes : ndarray
+                The global numbers of the nodes the shard owns, in ascending order
+            offsets : ndarray
+                Where each owned node's edges start, with one extra entry at the end
+            targets : ndarray
+                The global end node of each edge
+            target_weights : ndarray
+                The weight of each edge as float64 values
+            target_positions : ndarray
+                The position of each edge in the whole graph's targets
+            target_owners : ndarray
+                The shard owning each edge's end node
+        '''
+
+        self.shard_index = shard_index
+        self.nodes = nodes
+        self.offsets = offsets
+        self.targets = targets
+        self.target_weights = target_weights
+        self.target_positions = target_positions
+        self.target_owners = target_owners
+
+        self.resetSearch()
+
+    def resetSearch(self):
+        '''
+        This method clears the search information of the owned nodes
+        '''
+
+        node_count = len(self.nodes)
+        self.is_visited = np.zeros(node_count, dtype=bool)
+        self.parents = np.full(node_count, -1, dtype=np.int64)
+        self.levels = np.full(node_count, -1, dtype=np.int64)
+        self.distances = np.full(node_count, np.inf)
+        self.is_active = np.zeros(node_count, dtype=bool)
+        self.pending_messages = None
+
+    def getLocalIndices(self, global_nodes):
+        '''
+        This method converts the global numbers of owned nodes into their positions in the shard
+
+        Parameters :
+            global_nodes : ndarray
+                The global numbers of nodes owned by the shard
+
+        Returns :
+            local_indices : ndarray
+                The position of each node in the shard
+        '''
+
+        return np.searchsorted(self.nodes, global_nodes)
+
+    def gatherEdges(self, local_indices):
+        '''
+        This method gathers the positions in the shard of every edge leaving several owned nodes, in row order
+
+        Parameters :
+            local_indices : ndarray
+                The positions of the nodes in the shard
+
+        Returns :
+            positions : ndarray
+                The position of each edge in the shard's targets
+            row_lengths : ndarray
+                The number of edges leaving each node
+        '''
+
+        row_starts = self.offsets[local_indices]
+        row_lengths = self.offsets[local_indices + 1] - row_starts
+        edge_count = int(row_lengths.sum())
+        positions = np.arange(edge_count, dtype=np.int64) + np.repeat(row_starts - (np.cumsum(row_lengths) - row_lengths), row_lengths)
+        return positions, row_lengths
+
+    def splitMessages(self, message_owners, message_arrays, shard_count):
+        '''
+        This method keeps the messages for the shard's own nodes and splits the rest by the shard owning their nodes
+
+        Parameters :
+            message_owners : ndarray
+                The shard owning the node of each message
+            message_arrays : (ndarray)
+                The arrays of message values
+            shard_count : int
+                The number of shards
+
+        Returns :
+            outgoing_messages : [(ndarray) or None]
+                The messages for each other shard (None for the shard itself and shards with no messages)
+        '''
+
+        is_own = message_owners == self.shard_index
+        self.pending_messages = tuple(values[is_own] for values in message_arrays)
+
+        outgoing_messages = [None] * shard_count
+        remote_owners = message_owners[~is_own]
+        if len(remote_owners) > 0:
+            remote_arrays = tuple(values[~is_own] for values in message_arrays)
+            owner_order = np.argsort(remote_owners, kind="stable")
+            sorted_owners = remote_owners[owner_order]
+            for shard_index in np.unique(sorted_owners).tolist():
+                start, end = np.searchsorted(sorted_owners, [shard_index, shard_index + 1])
+                outgoing_messages[shard_index] = tuple(values[owner_order[start:end]] for values in remote_arrays)
+        return outgoing_messages
+
+    def combineMessages(self, incoming_messages):
+        '''
+        This method joins the messages the shard kept for itself with the messages routed from other shards
+
+        Parameters :
+            incoming_messages : [(ndarray)]
+                The messages from the other shards
+
+        Returns :
+            message_arrays : (ndarray)
+                The arrays of message values, with the kept messages first
+        '''
+
+        all_messages = [self.pending_messages] + [messages for messages in incoming_messages if messages != None]
+        self.pending_messages = None
+        return tuple(np.concatenate([messages[i] for messages in all_messages]) for i in range(0, len(all_messages[0])))
+
+    def startBreadthFirstSearch(self, start_node_index):
+        '''
+        This method marks the start node of a breadth first search, if the shard owns it
+
+        Parameters :
+            start_node_index : int
+                The global number of the start node
+        '''
+
+        self.resetSearch()
+        local_index = self.getLocalIndices(start_node_index)
+        if local_index < len(self.nodes) and self.nodes[local_index] == start_node_index:
+            self.is_visited[local_index] = True
+            self.levels[local_index] = 0
+
+    def expandFrontier(self, frontier_nodes, frontier_ranks, key_base, shard_count):
+        '''
+        This method creates a discovery message along every edge leaving the shard's part of the frontier
+
+        Each message holds its end node, its key (the parent's rank in the whole frontier, then the edge's position) and its parent,
+        and messages to owned nodes which are already visited are dropped
+
+        Parameters :
+            frontier_nodes : ndarray
+                The global numbers of the owned frontier nodes
+            frontier_ranks : ndarray
+                The position of each node in the whole frontier, in discovery order
+            key_base : int
+                One more than the number of edges in the whole graph
+            shard_count : int
+                The number of shards
+
+        Returns :
+            outgoing_messages : [(ndarray, ndarray, ndarray) or None]
+                The end nodes, keys and parents of the messages for each other shard
+        '''
+
+        positions, row_lengths = self.gatherEdges(self.getLocalIndices(frontier_nodes))
+        ends = self.targets[positions]
+        owners = self.target_owners[positions]
+        keys = np.repeat(frontier_ranks, row_lengths) * key_base + self.target_positions[positions]
+        parents = np.repeat(frontier_nodes, row_lengths)
+
+        is_own = owners == self.shard_index
+        is_kept = ~is_own
+        is_kept[is_own] = ~self.is_visited[self.getLocalIndices(ends[is_own])]
+        return self.splitMessages(owners[is_kept], (ends[is_kept], keys[is_kept], parents[is_kept]), shard_count)
+
+    def settleDiscoveries(self, incoming_messages, level):
+        '''
+        This method visits each unvisited owned node which received a discovery message, taking the parent of its smallest key
+
+        Parameters :
+            incoming_messages : [(ndarray, ndarray, ndarray)]
+                The discovery messages from the other shards
+            level : int
+                The level of the nodes being discovered
+
+        Returns :
+            new_nodes : ndarray
+                The global numbers of the newly visited nodes
+            new_keys : ndarray
+                The key each new node was discovered by
+        '''
+
+        ends, keys, parents = self.combineMessages(incoming_messages)
+        local_indices = self.getLocalIndices(ends)
+        is_unvisited = ~self.is_visited[local_indices]
+        local_indices = local_indices[is_unvisited]
+        keys = keys[is_unvisited]
+        parents = parents[is_unvisited]
+
+        key_order = np.argsort(keys, kind="stable")
+        _, first_indices = np.unique(local_indices[key_order], return_index=True)
+        chosen = key_order[first_indices]
+        new_indices = local_indices[chosen]
+
+        self.is_visited[new_indices] = True
+        self.levels[new_indices] = level
+        self.parents[new_indices] = parents[chosen]
+        return self.nodes[new_indices], keys[chosen]
+
+    def startShortestPaths(self, start_node_index):
+        '''
+        This method sets the distance of the start node of a shortest path search to 0, if the shard owns it
+
+        Parameters :
+            start_node_index : int
+                The global number of the start node
+        '''
+
+        self.resetSearch()
+        local_index = self.getLocalIndices(start_node_index)
+        if local_index < len(self.nodes) and self.nodes[local_index] == start_node_index:
+            self.distances[local_index] = 0
+            self.is_active[local_index] = True
+
+    def relaxActiveNodes(self, shard_count):
+        '''
+        This method creates a distance message along every edge leaving the owned nodes whose distances changed in the last round
+
+        Messages to owned nodes which would not shorten their distance are dropped
+
+        Parameters :
+            shard_count : int
+                The number of shards
+
+        Returns :
+            outgoing_messages : [(ndarray, ndarray, ndarray) or None]
+                The end nodes, offered distances and parents of the messages for each other shard
+        '''
+
+        active_indices = np.flatnonzero(self.is_active)
+        self.is_active[:] = False
+
+        positions, row_lengths = self.gatherEdges(active_indices)
+        ends = self.targets[positions]
+        owners = self.target_owners[positions]
+        offered_distances = np.repeat(self.distances[active_indices], row_lengths) + self.target_weights[positions]
+        parents = np.repeat(self.nodes[active_indices], row_lengths)
+
+        is_own = owners == self.shard_index
+        is_kept = ~is_own
+        is_kept[is_own] = offered_distances[is_own] < self.distances[self.getLocalIndices(ends[is_own])]
+        return self.splitMessages(owners[is_kept], (ends[is_kept], offered_distances[is_kept], parents[is_kept]), shard_count)
+
+    def applyDistances(self, incoming_messages):
+        '''
+        This method shortens the distance of each owned node to the smallest distance it was offered, marking the shortened nodes as active
+
+        Parameters :
+            incoming_messages : [(ndarray, ndarray, ndarray)]
+                The distance messages from the other shards
+
+        Returns :
+            improved_count : int
+                The number of nodes whose distance was shortened
+        '''
+
+        ends, offered_distances, parents = self.combineMessages(incoming_messages)
+        local_indices = self.getLocalIndices(ends)
+        is_shorter = offered_distances < self.distances[local_indices]
+        local_indices = local_indices[is_shorter]
+        offered_distances = offered_distances[is_shorter]
+        parents = parents[is_shorter]
+        if len(local_indices) == 0:
+            return 0
+
+        np.minimum.at(self.distances, local_indices, offered_distances)
+        is_best = offered_distances == self.distances[local_indices]
+        self.parents[local_indices[is_best]] = parents[is_best]
+
+        improved_indices = np.unique(local_indices)
+        self.is_active[improved_indices] = True
+        return len(improved_indices)
+
+    def getSearchValues(self, attribute_names):
+        '''
+        This method returns arrays of search information for the owned nodes
+
+        Parameters :
+            attribute_names : [str]
+                The names of the arrays, such as "parents", "levels" or "distances"
+
+        Returns :
+            nodes : ndarray
+                The global numbers of the owned nodes
+            values : [ndarray]
+                Each requested array, in the same order as the nodes
+        '''
+
+        return self.nodes, [getattr(self, attribute_name) for attribute_name in attribute_names]
+
+def runShardWorker(connection, shard):
+    '''
+    This function serves a shard in a worker process, running each command received through its pipe and sending back the result
+
+    Parameters :
+        connection : Connection
+            The worker's end of the pipe to the coordinating process
+        shard : GraphShard
+            The shard the worker holds
+    '''
+
+    while True:
+        try:
+            command, arguments = connection.recv()
+        except EOFError:
+            break
+        if command == "stop":
+            break
+        try:
+            connection.send(("result", getattr(shard, command)(*arguments)))
+        except Exception:
+            connection.send(("error", traceback.format_exc()))
+    connection.close()
+
+class PartitionedGraph():
+    '''
+    This class serves as a graph split into shards, with one worker process per shard which holds only its own nodes and their edges
+
+    A coordinating process runs breadth first searches and shortest path searches in rounds. In each round every worker handles its part of the
+    frontier, messages along boundary edges are routed through the coordinator to the shard owning their end node, and messages between nodes
+    in the same shard stay in their worker
+
+    The workers are started by the first search and run until stopWorkers or close is called, or until the with statement using the
+    partitioned graph ends. They are also stopped if a search fails, and the next search starts them again
+
+    Each shard is built while its worker starts and is only kept by that worker, and once the workers are running the coordinator only
+    holds the owner of each node and a weak reference to the compressed sparse row graph. The workers can be started again while something
+    else, such as the Graph it came from, still holds the compressed sparse row graph
+    '''
+
+    def __init__(self, compressed_graph, shard_count, partition_method="node range", seed=0):
+        '''
+        This method initializes the partitioned graph by assigning each node to a shard and building the shards
+
+        Parameters :
+            compressed_graph : CompressedSparseRowGraph
+                The graph being partitioned
+            shard_count : int
+                The number of shards and worker processes
+            partition_method : str, optional
+                "node range" for equal contiguous ranges of node numbers or "label propagation" for clusters (default is "node range")
+            seed : int, optional
+                The seed for label propagation (default is 0)
+        '''
+
+        self.number_of_nodes = compressed_graph.number_of_nodes
+        self.shard_count = shard_count
+        self.key_base = len(compressed_graph.targets) + 1
+
+        if partition_method == "node range":
+            self.owners = partitionByNodeRange(self.number_of_nodes, shard_count)
+        elif partition_method == "label propagation":
+            self.owners = partitionByLabelPropagation(compressed_graph, shard_count, seed=seed)
+        else:
+            raise ValueError(f"Unknown partition method {partition_method}")
+
+        self.is_integer_weighted = compressed_graph.weight_typecode == 'q'
+        row_lengths = np.diff(np.frombuffer(compressed_graph.offsets, dtype=np.int64))
+        targets = np.frombuffer(compressed_graph.targets, dtype=np.int64)
+        target_start_owners = np.repeat(self.owners, row_lengths)
+        is_boundary_target = target_start_owners != self.owners[targets]
+        self.boundary_starts = np.repeat(np.arange(self.number_of_nodes, dtype=np.int64), row_lengths)[is_boundary_target]
+        self.boundary_ends = targets[is_boundary_target]
+        self.node_counts = np.bincount(self.owners, minlength=shard_count).tolist()
+        self.edge_counts = np.bincount(target_start_owners, minlength=shard_count).tolist()
+
+        # the graph is held until the workers first start, and afterwards only weakly so the coordinator does not keep it alive
+        self.compressed_graph = compressed_graph
+        self.compressed_graph_reference = weakref.ref(compressed_graph)
+
+        self.connections = None
+        self.processes = None
+        self.round_count = 0
+
+    def getBoundaryEdges(self):
+        '''
+        This method returns the edges whose start node and end node are owned by different shards
+
+        Returns :
+            boundary_starts : ndarray
+                The start node of each boundary edge
+            boundary_ends : ndarray
+                The end node of each boundary edge
+        '''
+
+        return self.boundary_starts, self.boundary_ends
+
+    def getBoundaryEdgeCount(self):
+        '''
+        This method returns the number of edges, in both directions for an undirected graph, which cross between shards
+
+        Returns :
+            boundary_edge_count : int
+                The number of boundary edges
+        '''
+
+        return len(self.boundary_starts)
+
+    def getShardSizes(self):
+        '''
+        This method returns the number of nodes and edges held by each shard
+
+        Returns :
+            node_counts : [int]
+                The number of nodes each shard owns
+            edge_counts : [int]
+                The number of edges leaving each shard's nodes
+        '''
+
+        return self.node_counts, self.edge_counts
+
+    def createShard(self, compressed_graph, shard_index, row_lengths, target_owners):
+        '''
+        This method builds one shard from the compressed sparse row graph
+
+        Parameters :
+            compressed_graph : CompressedSparseRowGraph
+                The graph being partitioned
+            shard_index : int
+                The shard being built
+            row_lengths : ndarray
+                The number of edges leaving each node
+            target_owners : ndarray
+                The shard owning the end node of each edge
+
+        Returns :
+            shard : GraphShard
+                The nodes the shard owns and the edges leaving them
+        '''
+
+        nodes = np.flatnonzero(self.owners == shard_index)
+        positions = np.flatnonzero(np.repeat(self.owners == shard_index, row_lengths))
+        shard_offsets = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(row_lengths[nodes], out=shard_offsets[1:])
+        targets = np.frombuffer(compressed_graph.targets, dtype=np.int64)[positions]
+        target_weights = np.frombuffer(compressed_graph.target_weights, dtype=np.int64 if self.is_integer_weighted else np.float64)[positions].astype(np.float64)
+        return GraphShard(shard_index, nodes, shard_offsets, targets, target_weights, positions, target_owners[positions])
+
+    def startWorkers(self):
+        '''
+        This method starts one worker process per shard, each connected to the coordinator by a pipe
+
+        Each shard is built just before its worker starts and is only kept by the worker, and once every worker is running the coordinator
+        stops holding the compressed sparse row graph. Starting the workers again after they stop rebuilds the shards, which raises
+        a RuntimeError if nothing else holds the graph any more
+        '''
+
+        if self.processes != None:
+            return
+
+        compressed_graph = self.compressed_graph_reference()
+        if compressed_graph == None:
+            raise RuntimeError("The compressed sparse row graph is no longer held, so the shard workers can not be started again")
+        row_lengths = np.diff(np.frombuffer(compressed_graph.offsets, dtype=np.int64))
+        target_owners = self.owners[np.frombuffer(compressed_graph.targets, dtype=np.int64)]
+
+        context = getPoolContext()
+        self.connections = []
+        self.processes = []
+        for shard_index in range(0, self.shard_count):
+            coordinator_connection, worker_connection = context.Pipe()
+            process = context.Process(target=runShardWorker, args=(worker_connection, self.createShard(compressed_graph, shard_index, row_lengths, target_owners)), daemon=True)
+            process.start()
+            worker_connection.close()
+            self.connections.append(coordinator_connection)
+            self.processes.append(process)
+        self.compressed_graph = None
+
+    def stopWorkers(self, timeout=5):
+        '''
+        This method stops the worker processes, terminating any worker which has not stopped within the timeout
+
+        Parameters :
+            timeout : float, optional
+                The number of seconds to wait for each worker to stop (default is 5)
+        '''
+
+        if self.processes == None:
+            return
+
+        for connection in self.connections:
+            try:
+                connection.send(("stop", ()))
+            except OSError:
+                pass
+            connection.close()
+        for process in self.processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self.connections = None
+        self.processes = None
+
+    def close(self):
+        '''
+        This method stops the worker processes once the partitioned graph is no longer needed
+        '''
+
+        self.stopWorkers()
+
+    def __enter__(self):
+        '''
+        This method starts the worker processes at the start of a with statement
+
+        Returns :
+            partitioned_graph : PartitionedGraph
+                The partitioned graph with its workers running
+        '''
+
+        self.startWorkers()
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        '''
+        This method stops the worker processes at the end of a with statement, even if it ended with an exception
+        '''
+
+        self.close()
+
+    def sendToAll(self, command, argument_lists):
+        '''
+        This method sends a command to every worker and waits for all of their results, so the workers run the command at the same time
+
+        Every result is received even when a worker fails, so no worker is left blocked sending its result, and then the workers are stopped
+
+        Parameters :
+            command : str
+                The name of the GraphShard method to run
+            argument_lists : [tuple]
+                The arguments for each worker
+
+        Returns :
+            results : [object]
+                The result from each worker
+        '''
+
+        errors = []
+        results = []
+        try:
+            for connection, arguments in zip(self.connections, argument_lists):
+                connection.send((command, arguments))
+            for shard_index, connection in enumerate(self.connections):
+                status, result = connection.recv()
+                if status == "error":
+                    errors.append(f"Shard {shard_index}:\n{result}")
+                results.append(result)
+        except (OSError, EOFError) as error:
+            self.stopWorkers()
+            raise RuntimeError(f"Lost the connection to a shard worker running {command}") from error
+
+        if len(errors) > 0:
+            self.stopWorkers()
+            raise RuntimeError(f"A shard worker failed running {command}\n" + "\n".join(errors))
+        return results
+
+    def routeMessages(self, outgoing_messages):
+        '''
+        This method regroups the messages each worker sent for other shards by the shard receiving them
+
+        Parameters :
+            outgoing_messages : [[(ndarray) or None]]
+                The messages from each worker for each shard
+
+        Returns :
+            incoming_messages : [[(ndarray)]]
+                The messages received by each shard
+        '''
+
+        return [[worker_messages[shard_index] for worker_messages in outgoing_messages if worker_messages[shard_index] != None] for shard_index in range(0, self.shard_count)]
+
+    def gatherNodeValues(self, attribute_names):
+        '''
+        This method collects arrays of search information from every shard into arrays for the whole graph
+
+        Parameters :
+            attribute_names : [str]
+                The names of the GraphShard arrays being collected
+
+        Returns :
+            node_values : [ndarray]
+                Each array for every node in the graph
+        '''
+
+        shard_values = self.sendToAll("getSearchValues", [(attribute_names,)] * self.shard_count)
+        node_values = []
+        for i in range(0, len(attribute_names)):
+            values = np.empty(self.number_of_nodes, dtype=shard_values[0][1][i].dtype)
+            for nodes, shard_arrays in shard_values:
+                values[nodes] = shard_arrays[i]
+            node_values.append(values)
+        return node_values
+
+    def breadthFirstSearch(self, start_node_index):
+        '''
+        This method performs a breadth first search across the shards, one level per round
+
+        The coordinator keeps the whole frontier in discovery order, and every discovery message carries the key of the edge it came along,
+        so each node takes the same parent as a queue based breadth first search of the whole graph
+
+        Parameters :
+            start_node_index : int
+                The node the search starts at
+
+        Returns :
+            parents_for_nodes : [int]
+                The parent of each node in the search (None for the start node and the nodes which can not be reached)
+            levels_for_nodes : [int]
+                The number of edges from the start node to each node (None if the node can not be reached)
+        '''
+
+        self.startWorkers()
+        try:
+            self.sendToAll("startBreadthFirstSearch", [(start_node_index,)] * self.shard_count)
+
+            frontier = np.array([start_node_index], dtype=np.int64)
+            level = 0
+            self.round_count = 0
+            while len(frontier) > 0:
+                frontier_owners = self.owners[frontier]
+                frontier_ranks = np.arange(len(frontier), dtype=np.int64)
+                outgoing_messages = self.sendToAll("expandFrontier", [(frontier[frontier_owners == i], frontier_ranks[frontier_owners == i], self.key_base, self.shard_count) for i in range(0, self.shard_count)])
+
+                level += 1
+                discoveries = self.sendToAll("settleDiscoveries", [(messages, level) for messages in self.routeMessages(outgoing_messages)])
+                new_nodes = np.concatenate([nodes for nodes, _ in discoveries])
+                new_keys = np.concatenate([keys for _, keys in discoveries])
+                frontier = new_nodes[np.argsort(new_keys, kind="stable")]
+                self.round_count += 1
+
+            parents, levels = self.gatherNodeValues(["parents", "levels"])
+        except BaseException:
+            self.stopWorkers()
+            raise
+
+        parents_for_nodes = [None if parent == -1 else parent for parent in parents.tolist()]
+        levels_for_nodes = [None if level == -1 else level for level in levels.tolist()]
+        return parents_for_nodes, levels_for_nodes
+
+    def shortestPathsFromNode(self, start_node_index):
+        '''
+        This method calculates the shortest distance from a starting node to every other node across the shards using bellman ford rounds
+
+        In each round every shard relaxes the edges of its nodes whose distances changed in the last round, so the rounds end once no distance
+        changes, and negative edges are allowed
+        If a distance is still changing after as many rounds as there are nodes, there is a negative edge loop and the method returns none
+        instead of both lists
+
+        Parameters :
+            start_node_index : int
+                The index of the node that each node's distance is being calculated from
+
+        Returns :
+            distances_to_nodes : [int] (or None if there is a negative edge loop)
+                The list of the distance from the starting node to every other node (None if the node can not be reached)
+            parents_for_nodes : [int] (or None if there is a negative edge loop)
+                The list of the parent node for the route from the starting node to every other node
+        '''
+
+        self.startWorkers()
+        try:
+            self.sendToAll("startShortestPaths", [(start_node_index,)] * self.shard_count)
+
+            self.round_count = 0
+            while True:
+                outgoing_messages = self.sendToAll("relaxActiveNodes", [(self.shard_count,)] * self.shard_count)
+                improved_counts = self.sendToAll("applyDistances", [(messages,) for messages in self.routeMessages(outgoing_messages)])
+                self.round_count += 1
+                if sum(improved_counts) == 0:
+                    break
+                if self.round_count >= self.number_of_nodes:
+                    return None, None
+
+            distances, parents = self.gatherNodeValues(["distances", "parents"])
+        except BaseException:
+            self.stopWorkers()
+            raise
+
+        distances_to_nodes = []
+        for distance in distances.tolist():
+            if distance == np.inf:
+                distances_to_nodes.append(None)
+            elif self.is_integer_weighted:
+                distances_to_nodes.append(int(distance))
+            else:
+                distances_to_nodes.append(distance)
+        parents_for_nodes = [None if parent == -1 else parent for parent in parents.tolist()]
+        return distances_to_nodes, parents_for_nodes
@@ -0,0 +1,113 @@
+import random
+import time
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+from PartitionedGraph import PartitionedGraph
+
+def createShuffledGridGraph(width, seed=0):
+    '''
+    This function creates an undirected square grid graph with random edge weights and randomly shuffled node numbers,
+    so neighboring nodes do not have nearby numbers
+
+    Parameters :
+        width : int
+            The number of nodes along each side of the grid
+        seed : int, optional
+            The seed for the random weights and numbering (default is 0)
+
+    Returns :
+        compressed_graph : CompressedSparseRowGraph
+            The grid graph
+    '''
+
+    randomizer = random.Random(seed)
+    node_numbers = list(range(0, width * width))
+    randomizer.shuffle(node_numbers)
+
+    edges = []
+    for node in range(0, width * width):
+        if node % width + 1 < width:
+            edges.append((node_numbers[node], node_numbers[node + 1], randomizer.randint(1, 10)))
+        if node // width + 1 < width:
+            edges.append((node_numbers[node], node_numbers[node + width], randomizer.randint(1, 10)))
+
+    return CompressedSparseRowGraph(width * width, edge_tuples=edges, is_directed=False, is_weighted=True)
+
+def measureDuration(search):
+    '''
+    This function measures how long a search takes
+
+    Parameters :
+        search : function
+            The function running the search and returning its result
+
+    Returns :
+        duration : float
+            The number of seconds taken by the search
+        result : object
+            The result of the search
+    '''
+
+    start = time.perf_counter()
+    result = search()
+    return time.perf_counter() - start, result
+
+if __name__ == '__main__':
+    import os
+    import pandas as pd
+
+    print(f"{os.cpu_count()} processors available")
+
+    compressed_graph = createShuffledGridGraph(500)
+    start_node_index = 0
+
+    breadth_first_duration, (expected_parents, _) = measureDuration(lambda : compressed_graph.breadthFirstSearchUsingBitsets(start_node_index))
+    dijkstra_duration, (expected_distances, _) = measureDuration(lambda : compressed_graph.shortestPathsFromNodeUsingDijkstra(start_node_index))
+    print(f"Single process : bitset breadth first search {breadth_first_duration:.2f} seconds, dijkstra {dijkstra_duration:.2f} seconds")
+
+    partition_methods = []
+    process_counts = []
+    boundary_edge_counts = []
+    breadth_first_durations = []
+    breadth_first_rounds = []
+    shortest_path_durations = []
+    shortest_path_rounds = []
+
+    for partition_method in ["node range", "label propagation"]:
+        for process_count in [1, 2, 4, 8, 16]:
+            partitioned_graph = PartitionedGraph(compressed_graph, process_count, partition_method=partition_method)
+            partitioned_graph.startWorkers()
+            try:
+                breadth_first_duration, (parents, _) = measureDuration(lambda : partitioned_graph.breadthFirstSearch(start_node_index))
+                breadth_first_round_count = partitioned_graph.round_count
+                shortest_path_duration, (distances, _) = measureDuration(lambda : partitioned_graph.shortestPathsFromNode(start_node_index))
+            finally:
+                partitioned_graph.stopWorkers()
+
+            if parents != expected_parents or distances != expected_distances:
+                print("The partitioned searches do not match the single process searches")
+
+            partition_methods.append(partition_method)
+            process_counts.append(process_count)
+            boundary_edge_counts.append(partitioned_graph.getBoundaryEdgeCount())
+            breadth_first_durations.append(breadth_first_duration)
+            breadth_first_rounds.append(breadth_first_round_count)
+            shortest_path_durations.append(shortest_path_duration)
+            shortest_path_rounds.append(partitioned_graph.round_count)
+
+    dictionary = {
+        "Partition": partition_methods,
+        "Processes": process_counts,
+        "Boundary Edges": boundary_edge_counts,
+        "Breadth First Seconds": breadth_first_durations,
+        "Breadth First Rounds": breadth_first_rounds,
+        "Shortest Path Seconds": shortest_path_durations,
+        "Shortest Path Rounds": shortest_path_rounds
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    for column in ["Breadth First Seconds", "Shortest Path Seconds"]:
+        single_process_durations = dataframe.groupby("Partition")[column].transform("first")
+        dataframe[column.replace("Seconds", "Speedup")] = single_process_durations / dataframe[column]
+    pd.options.display.width = 200
+    pd.options.display.max_columns = None
+    print(dataframe)
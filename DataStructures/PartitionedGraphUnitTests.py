@@ -0,0 +1,181 @@
+import gc
+import unittest
+import numpy as np
+from CompressedSparseRowGraph import CompressedSparseRowGraph
+from Graph import Graph
+from PartitionedGraph import PartitionedGraph, partitionByNodeRange, partitionByLabelPropagation
+
+class PartitionedGraphUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for the partitioned graph and its worker processes
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up the edge list to be used with the following unit tests
+
+        Number of nodes : 10
+        Number of edges : 13
+        '''
+
+        self.weighted_edge_list = [(0,1,2),(2,1,1),(2,3,4),(3,4,6),(4,5,3),(5,6,2),(1,6,1),(6,3,3),(2,4,4),(2,5,2),(7,8,5),(9,8,2),(9,7,1)]
+
+        self.number_of_nodes = 10
+
+    def test_partitions(self):
+        '''
+        This method tests that both partition methods give balanced shards, that label propagation keeps the two segments apart,
+        and that the boundary edges are the edges between shards
+        '''
+
+        self.assertListEqual(partitionByNodeRange(10, 3).tolist(), [0, 0, 0, 0, 1, 1, 1, 2, 2, 2])
+
+        graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=False, is_weighted=True)
+        owners = partitionByLabelPropagation(graph.getCompressedSparseRow(), 2)
+        self.assertListEqual(np.bincount(owners).tolist(), [5, 5])
+        self.assertEqual(len(set(owners[[7, 8, 9]].tolist())), 1)
+
+        partitioned_graph = graph.getPartitionedGraph(3)
+        node_counts, edge_counts = partitioned_graph.getShardSizes()
+        self.assertListEqual(node_counts, [4, 3, 3])
+        self.assertEqual(sum(edge_counts), 26)
+
+        boundary_starts, boundary_ends = partitioned_graph.getBoundaryEdges()
+        self.assertEqual(partitioned_graph.getBoundaryEdgeCount(), 10)
+        for start, end in zip(boundary_starts.tolist(), boundary_ends.tolist()):
+            self.assertNotEqual(partitioned_graph.owners[start], partitioned_graph.owners[end])
+
+    def test_searches_match_single_process(self):
+        '''
+        This method tests that breadth first and shortest path searches across shards match the single process engines
+        '''
+
+        for is_directed in [True, False]:
+            graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_breadth_first=True, is_directed=is_directed, is_weighted=True)
+            compressed_graph = graph.getCompressedSparseRow()
+
+            for shard_count, partition_method in [(1, "node range"), (3, "node range"), (2, "label propagation")]:
+                partitioned_graph = graph.getPartitionedGraph(shard_count, partition_method=partition_method)
+                try:
+                    for start_index in [0, 2, 9]:
+                        compressed_graph.resetTraversalInformation()
+                        compressed_graph.node_visit(start_index)
+                        parents, levels = partitioned_graph.breadthFirstSearch(start_index)
+                        self.assertListEqual(parents, compressed_graph.parents)
+                        self.assertListEqual(levels, compressed_graph.breadthFirstSearchUsingBitsets(start_index)[1])
+
+                        distances, _ = partitioned_graph.shortestPathsFromNode(start_index)
+                        self.assertListEqual(distances, compressed_graph.shortestPathsFromNodeUsingDijkstra(start_index)[0])
+                finally:
+                    partitioned_graph.stopWorkers()
+
+    def test_negative_edges(self):
+        '''
+        This method tests shortest paths across shards with a negative edge and with a negative edge loop
+        '''
+
+        graph = Graph(number_of_nodes=4, edge_tuples=[(0,1,4),(0,2,1),(1,3,-3),(2,1,2),(3,2,2)], is_directed=True, is_weighted=True)
+        partitioned_graph = graph.getPartitionedGraph(2)
+        try:
+            self.assertEqual(partitioned_graph.shortestPathsFromNode(0), graph.shortestPathFromNodeUsingBellmanFord(0))
+        finally:
+            partitioned_graph.stopWorkers()
+
+        graph = Graph(number_of_nodes=3, edge_tuples=[(0,1,1),(1,2,-1),(0,2,1)], is_directed=False, is_weighted=True)
+        partitioned_graph = graph.getPartitionedGraph(2)
+        try:
+            self.assertEqual(partitioned_graph.shortestPathsFromNode(0), (None, None))
+        finally:
+            partitioned_graph.stopWorkers()
+
+        with self.assertRaises(ValueError):
+            PartitionedGraph(graph.getCompressedSparseRow(), 2, partition_method="random")
+
+    def test_label_propagation_searches(self):
+        '''
+        This method tests that searches across shards built by label propagation match the single process engines for several seeds and shard counts
+        '''
+
+        for is_directed in [True, False]:
+            graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_breadth_first=True, is_directed=is_directed, is_weighted=True)
+            compressed_graph = graph.getCompressedSparseRow()
+
+            for shard_count, seed in [(2, 1), (3, 0), (4, 2)]:
+                with graph.getPartitionedGraph(shard_count, partition_method="label propagation", seed=seed) as partitioned_graph:
+                    self.assertListEqual(sorted(np.unique(partitioned_graph.owners).tolist()), list(range(0, shard_count)))
+                    for start_index in range(0, self.number_of_nodes):
+                        compressed_graph.resetTraversalInformation()
+                        compressed_graph.node_visit(start_index)
+                        parents, levels = partitioned_graph.breadthFirstSearch(start_index)
+                        self.assertListEqual(parents, compressed_graph.parents)
+                        self.assertListEqual(levels, compressed_graph.breadthFirstSearchUsingBitsets(start_index)[1])
+
+                        distances, _ = partitioned_graph.shortestPathsFromNode(start_index)
+                        self.assertListEqual(distances, compressed_graph.shortestPathsFromNodeUsingDijkstra(start_index)[0])
+
+    def test_workers_stop(self):
+        '''
+        This method tests that the workers stop at the end of a with statement, when a worker fails and when the coordinator fails,
+        and that the next search starts them again
+        '''
+
+        graph = Graph(number_of_nodes=self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=False, is_weighted=True)
+        expected_distances = graph.getCompressedSparseRow().shortestPathsFromNodeUsingDijkstra(0)[0]
+
+        with graph.getPartitionedGraph(3) as partitioned_graph:
+            processes = partitioned_graph.processes
+            self.assertTrue(all(process.is_alive() for process in processes))
+        self.assertEqual(partitioned_graph.processes, None)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+        # only the second shard fails, so the other workers have results waiting to be received
+        partitioned_graph.startWorkers()
+        processes = partitioned_graph.processes
+        with self.assertRaises(RuntimeError):
+            partitioned_graph.sendToAll("getSearchValues", [(["distances"],), (["unknown_values"],), (["distances"],)])
+        self.assertEqual(partitioned_graph.processes, None)
+        self.assertFalse(any(process.is_alive() for process in processes))
+        self.assertListEqual(partitioned_graph.shortestPathsFromNode(0)[0], expected_distances)
+
+        processes = partitioned_graph.processes
+        with self.assertRaises(IndexError):
+            partitioned_graph.breadthFirstSearch(self.number_of_nodes)
+        self.assertEqual(partitioned_graph.processes, None)
+        self.assertFalse(any(process.is_alive() for process in processes))
+
+        with self.assertRaises(ValueError):
+            with partitioned_graph:
+                self.assertListEqual(partitioned_graph.shortestPathsFromNode(0)[0], expected_distances)
+                raise ValueError("The with statement ended with an exception")
+        self.assertEqual(partitioned_graph.processes, None)
+        partitioned_graph.close()
+
+    def test_coordinator_releases_graph(self):
+        '''
+        This method tests that the coordinator keeps neither the shards nor the compressed sparse row graph once the workers start,
+        that the workers start again while the graph is held elsewhere, and that they can not start again once it is gone
+        '''
+
+        compressed_graph = CompressedSparseRowGraph(self.number_of_nodes, edge_tuples=self.weighted_edge_list, is_directed=False, is_weighted=True)
+        expected_distances = compressed_graph.shortestPathsFromNodeUsingDijkstra(0)[0]
+        partitioned_graph = PartitionedGraph(compressed_graph, 3)
+        self.assertIs(partitioned_graph.compressed_graph, compressed_graph)
+
+        with partitioned_graph:
+            self.assertEqual(partitioned_graph.compressed_graph, None)
+            self.assertFalse(hasattr(partitioned_graph, "shards"))
+            self.assertListEqual(partitioned_graph.shortestPathsFromNode(0)[0], expected_distances)
+        self.assertListEqual(partitioned_graph.getShardSizes()[0], [4, 3, 3])
+        self.assertEqual(sum(partitioned_graph.getShardSizes()[1]), 26)
+
+        self.assertListEqual(partitioned_graph.shortestPathsFromNode(0)[0], expected_distances)
+        partitioned_graph.close()
+
+        compressed_graph = None
+        gc.collect()
+        with self.assertRaises(RuntimeError):
+            partitioned_graph.shortestPathsFromNode(0)
+        self.assertEqual(partitioned_graph.processes, None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import time
+import MinHeapForObjects
+from Graph import GraphNode
+
+def measureDecreaseKeyThroughput(heap_class, heap_size, update_count=2000, seed=0):
+    '''
+    This function measures how many decrease key operations per second a heap class can perform
+
+    Parameters :
+        heap_class : class
+            The min heap class being measured (MinHeapForObjects or IndexedMinHeapForObjects)
+        heap_size : int
+            The number of items in the heap while the updates are performed
+        update_count : int, optional
+            The number of decrease key operations to perform (default is 2000)
+        seed : int, optional
+            The seed for the random priorities and updates (default is 0)
+
+    Returns :
+        updates_per_second : float
+            The number of decrease key operations completed per second
+    '''
+
+    randomizer = random.Random(seed)
+
+    nodes = []
+    for i in range(0, heap_size):
+        nodes.append(GraphNode(number=i, distance=randomizer.randint(heap_size, heap_size * 10)))
+    heap = heap_class(nodes.copy())
+
+    updated_nodes = []
+    for _ in range(0, update_count):
+        updated_nodes.append(nodes[randomizer.randrange(heap_size)])
+
+    start = time.perf_counter()
+    for node in updated_nodes:
+        node.distance -= 1
+        heap.updateItemPriority(node)
+    end = time.perf_counter()
+
+    return update_count / (end - start)
+
+if __name__ == '__main__':
+    import pandas as pd
+    import seaborn as sns
+    from matplotlib import pyplot as plt
+
+    heap_sizes = []
+    heap_types = []
+    updates_per_second = []
+
+    for i in range(6, 17):
+        heap_size = 2**i
+        for heap_type, heap_class in [("List Scan", MinHeapForObjects.MinHeapForObjects), ("Indexed", MinHeapForObjects.IndexedMinHeapForObjects)]:
+            heap_sizes.append(heap_size)
+            heap_types.append(heap_type)
+            updates_per_second.append(measureDecreaseKeyThroughput(heap_class, heap_size))
+
+    dictionary = {
+        "Heap Size": heap_sizes,
+        "Heap Type": heap_types,
+        "Decrease Key Operations Per Second": updates_per_second
+    }
+
+    dataframe = pd.DataFrame.from_dict(dictionary)
+    print(dataframe)
+
+    bright_palette = sns.hls_palette(h=.5)
+    sns.set_theme(style="whitegrid", palette=bright_palette)
+    plot_axes = sns.lineplot(data=dataframe, x="Heap Size", y="Decrease Key Operations Per Second", hue="Heap Type", marker="o")
+    plot_axes.set(xscale="log", yscale="log")
+    plt.gcf().canvas.manager.set_window_title('Decrease Key Throughput By Heap Size')
+    plt.tight_layout()
+    plt.show()
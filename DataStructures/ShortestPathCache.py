@@ -0,0 +1,156 @@
+from collections import OrderedDict
+import sys
+
+class ShortestPathCache():
+    '''
+    This class serves as a least recently used cache of single source shortest path results, keyed by the start node
+
+    The cache can be bounded by a number of entries, an estimated number of bytes, or both
+    '''
+
+    def __init__(self, maximum_entries=128, maximum_bytes=None):
+        '''
+        This method initializes the empty cache
+
+        Parameters :
+            maximum_entries : int, optional
+                The most start nodes whose results are kept (default is 128, None for no limit)
+            maximum_bytes : int, optional
+                The most bytes the distance and parent lists may use, as estimated by getResultSize (default is None for no limit)
+        '''
+
+        self.maximum_entries = maximum_entries
+        self.maximum_bytes = maximum_bytes
+        self.results = OrderedDict()
+        self.result_sizes = {}
+        self.cached_bytes = 0
+
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self.invalidation_count = 0
+
+    def getResultSize(self, distances_to_nodes, parents_for_nodes):
+        '''
+        This method estimates how many bytes a result uses from the size of its two lists
+
+        The integers themselves are not counted, as small integers and node numbers are mostly shared objects
+
+        Parameters :
+            distances_to_nodes : [int]
+                The distance from the start node to every node
+            parents_for_nodes : [int]
+                The parent of every node on the routes from the start node
+
+        Returns :
+            result_size : int
+                The estimated number of bytes used by the result
+        '''
+
+        return sys.getsizeof(distances_to_nodes) + sys.getsizeof(parents_for_nodes)
+
+    def getResult(self, start_node_index):
+        '''
+        This method looks up the result for a start node, marking it as the most recently used
+
+        Parameters :
+            start_node_index : int
+                The start node of the search
+
+        Returns :
+            distances_to_nodes : [int] (or None if the result is not cached)
+                The distance from the start node to every node
+            parents_for_nodes : [int] (or None if the result is not cached)
+                The parent of every node on the routes from the start node
+        '''
+
+        result = self.results.get(start_node_index)
+        if result == None:
+            self.miss_count += 1
+            return None, None
+
+        self.hit_count += 1
+        self.results.move_to_end(start_node_index)
+        return result
+
+    def storeResult(self, start_node_index, distances_to_nodes, parents_for_nodes):
+        '''
+        This method stores the result for a start node, evicting the least recently used results until it fits within the bounds
+
+        A result larger than the byte bound by itself is not stored
+
+        Parameters :
+            start_node_index : int
+                The start node of the search
+            distances_to_nodes : [int]
+                The distance from the start node to every node
+            parents_for_nodes : [int]
+                The parent of every node on the routes from the start node
+        '''
+
+        result_size = self.getResultSize(distances_to_nodes, parents_for_nodes)
+        if self.maximum_entries == 0 or (self.maximum_bytes != None and result_size > self.maximum_bytes):
+            return
+
+        if start_node_index in self.results:
+            self.removeResult(start_node_index)
+
+        while self.results and ((self.maximum_entries != None and len(self.results) >= self.maximum_entries) or (self.maximum_bytes != None and self.cached_bytes + result_size > self.maximum_bytes)):
+            self.removeResult(next(iter(self.results)))
+            self.eviction_count += 1
+
+        self.results[start_node_index] = (distances_to_nodes, parents_for_nodes)
+        self.result_sizes[start_node_index] = result_size
+        self.cached_bytes += result_size
+
+    def removeResult(self, start_node_index):
+        '''
+        This method removes the result for a start node from the cache
+
+        Parameters :
+            start_node_index : int
+                The start node of the search
+        '''
+
+        del self.results[start_node_index]
+        self.cached_bytes -= self.result_sizes.pop(start_node_index)
+
+    def clear(self):
+        '''
+        This method removes every result, as they are out of date once the graph's edges change
+        '''
+
+        if self.results:
+            self.invalidation_count += 1
+        self.results.clear()
+        self.result_sizes.clear()
+        self.cached_bytes = 0
+
+    def getEntryCount(self):
+        '''
+        This method returns how many start nodes have cached results
+
+        Returns :
+            entry_count : int
+                The number of cached results
+        '''
+
+        return len(self.results)
+
+    def getStatistics(self):
+        '''
+        This method returns the cache's counters
+
+        Returns :
+            statistics : {str:int}
+                The hits, misses, evictions, invalidations, entries and estimated bytes of the cache
+        '''
+
+        return {
+            "Hits": self.hit_count,
+            "Misses": self.miss_count,
+            "Evictions": self.eviction_count,
+            "Invalidations": self.invalidation_count,
+            "Entries": len(self.results),
+            "Bytes": self.cached_bytes
+        }
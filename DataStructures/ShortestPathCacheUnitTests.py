@@ -0,0 +1,76 @@
+import unittest
+from ShortestPathCache import ShortestPathCache
+
+class ShortestPathCacheUnitTests(unittest.TestCase):
+    '''
+    This class contains basic unit tests for the shortest path cache
+    '''
+
+    def setUp(self):
+        '''
+        This method sets up a cache bounded to three entries and the result lists to store in it
+        '''
+
+        self.cache = ShortestPathCache(maximum_entries=3)
+        self.distances = [0, 1, 2, None]
+        self.parents = [None, 0, 1, None]
+
+    def test_hits_and_misses(self):
+        '''
+        This method tests that stored results are returned and that lookups are counted
+        '''
+
+        self.assertEqual(self.cache.getResult(0), (None, None))
+        self.cache.storeResult(0, self.distances, self.parents)
+        self.assertEqual(self.cache.getResult(0), (self.distances, self.parents))
+
+        self.assertEqual(self.cache.hit_count, 1)
+        self.assertEqual(self.cache.miss_count, 1)
+
+    def test_least_recently_used_eviction(self):
+        '''
+        This method tests that the least recently used result is evicted once the entry bound is reached
+        '''
+
+        for start_node_index in range(0, 3):
+            self.cache.storeResult(start_node_index, self.distances, self.parents)
+        self.cache.getResult(0)
+        self.cache.storeResult(3, self.distances, self.parents)
+
+        self.assertEqual(self.cache.getEntryCount(), 3)
+        self.assertEqual(self.cache.eviction_count, 1)
+        self.assertEqual(self.cache.getResult(1), (None, None))
+        self.assertEqual(self.cache.getResult(0), (self.distances, self.parents))
+
+    def test_byte_bound(self):
+        '''
+        This method tests that results are evicted to stay within the byte bound, and that a result too large for it is not stored
+        '''
+
+        result_size = self.cache.getResultSize(self.distances, self.parents)
+        cache = ShortestPathCache(maximum_entries=None, maximum_bytes=result_size * 2)
+
+        for start_node_index in range(0, 5):
+            cache.storeResult(start_node_index, self.distances, self.parents)
+            self.assertLessEqual(cache.cached_bytes, result_size * 2)
+        self.assertEqual(cache.getEntryCount(), 2)
+        self.assertEqual(cache.eviction_count, 3)
+
+        cache.storeResult(5, list(range(0, 1000)), list(range(0, 1000)))
+        self.assertEqual(cache.getResult(5), (None, None))
+        self.assertEqual(cache.getEntryCount(), 2)
+
+    def test_clear(self):
+        '''
+        This method tests that clearing the cache removes every result and counts the invalidation
+        '''
+
+        self.cache.storeResult(0, self.distances, self.parents)
+        self.cache.clear()
+
+        self.assertEqual(self.cache.getEntryCount(), 0)
+        self.assertEqual(self.cache.cached_bytes, 0)
+        self.assertEqual(self.cache.getStatistics()["Invalidations"], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,4 @@
 from pulp import *
-import seaborn as sns
-import networkx as nx
-from matplotlib import pyplot as plt
 
 def verifyColorAssignments( number_of_nodes, edge_list, number_of_colors, color_assignments ):
     '''
@@ -105,6 +102,10 @@ class ColoringNodes():
         This method creates a graphical visualization of the colored nodes using matplotlib and networkx
         '''
 
+        import networkx as nx
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         options = {"edgecolors": "tab:gray", "node_size": 800, "alpha": 1, "font_color":"whitesmoke", "font_size":16}
         bright_palette = sns.hls_palette(h=.5)
         graph_visualization = nx.DiGraph()
@@ -2,7 +2,6 @@ import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
 from qiskit_aer import Aer
 from qiskit.visualization import plot_histogram
-from matplotlib import pyplot as plt
 
 def applyReflectionAboutUniformState(quantum_circuit, inputs): 
     '''
@@ -106,6 +105,8 @@ def outputSearchResultsFor3BitNumber(number_to_search):
             A number with three bits (0-7)
     '''
 
+    from matplotlib import pyplot as plt
+
     inputs = QuantumRegister(3, 'b')
     output = QuantumRegister(1, 'r')
     classical_bits = ClassicalRegister(3, 'z')
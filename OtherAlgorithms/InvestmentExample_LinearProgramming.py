@@ -1,5 +1,4 @@
 import pulp as lp
-import pandas as pd
 
 class StockOption():
     '''
@@ -144,6 +143,8 @@ class InvestmentMaximization():
         This method returns a dataframe with all of the data on the stock options and current recommendations
         '''
 
+        import pandas as pd
+
         stock_names = []
         stock_prices = []
         stock_expected_returns = []
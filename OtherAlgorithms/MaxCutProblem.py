@@ -1,6 +1,3 @@
-import networkx as nx
-from matplotlib import pyplot as plt 
-import seaborn as sns
 from random import randint
 
 class MaxCutProblem():
@@ -73,6 +70,10 @@ class MaxCutProblem():
         This method creates the graphical representation of the cut set
         '''
 
+        import networkx as nx
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         options = {"edgecolors": "tab:gray", "node_size": 800, "alpha": 1, "font_color":"whitesmoke", "font_size":16}
         bright_palette = sns.hls_palette(h=.5)
         edge_list_cut = [(i,j) for (i,j) in self.edge_list if self.set_list[i] != self.set_list[j] ]
@@ -1,6 +1,3 @@
-import pandas as pd
-import seaborn as sns
-from matplotlib import pyplot as plt
 from random import randint
 import time
 
@@ -115,6 +112,9 @@ def factorialByPrimeFactors(number):
     return factorial
 
 def compareFactorialDurations():
+    import pandas as pd
+    import seaborn as sns
+    from matplotlib import pyplot as plt
     
 
     durations = []
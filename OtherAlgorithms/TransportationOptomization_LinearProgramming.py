@@ -1,8 +1,4 @@
 import pulp as lp
-import seaborn as sns
-import networkx as nx
-from matplotlib import pyplot as plt
-import pandas as pd
 
 def calculateDistance(source_coordinate, destination_coordinate):
     '''
@@ -127,6 +123,10 @@ class TransportationRequirements():
         This method creates a graphical visualization of the weights moved between locations using matplotlib and networkx
         '''
 
+        import networkx as nx
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         options = {"edgecolors": "tab:gray", "node_size": 800, "alpha": 1, "font_color":"whitesmoke", "font_size":16}
         bright_palette = sns.hls_palette(h=.5)
         graph_visualization = nx.DiGraph()
@@ -149,6 +149,8 @@ class TransportationRequirements():
         This function outputs the calculated data to the console
         '''
 
+        import pandas as pd
+
         optomized_transport_source = []
         optomized_transport_destination = []
         for i in range(0,self.number_of_sources):
@@ -1,7 +1,4 @@
 from pulp import *
-import seaborn as sns
-import networkx as nx
-from matplotlib import pyplot as plt
 
 class TravelingSalesPerson():
     '''
@@ -164,6 +161,10 @@ class TravelingSalesPerson():
         This method creates a graphical visualization of the TSP with varying number of salespeople constraints
         '''
 
+        import networkx as nx
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         options = {"edgecolors": "tab:gray", "node_size": 800, "alpha": 1, "font_color":"whitesmoke", "font_size":16}
         bright_palette = sns.hls_palette(h=.5)
         graph_visualization = nx.Graph()
@@ -2,9 +2,6 @@ import unittest
 from UsingPolynomialMultiplication_FFT import *
 import time
 from random import randint
-import pandas as pd
-import seaborn as sns
-from matplotlib import pyplot as plt
 from HelperClasses.GenerateArrays import generate_random_array
 
 class UsingPolynomialMultiplication_FFT_UnitTests(unittest.TestCase):
@@ -106,6 +103,10 @@ class UsingPolynomialMultiplication_FFT_UnitTests(unittest.TestCase):
         self.assertGreater(duration_check,duration_check_fft)
 
     def test_increasing_size_arrays_durations(self):
+        import pandas as pd
+        import seaborn as sns
+        from matplotlib import pyplot as plt
+
         starting_size = 50
         increase_quantity = 50
         attempts_per_count = 10
@@ -1,8 +1,5 @@
 import HelperClasses.GenerateArrays as genArrays
 from statistics import mean
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 
 # Important Note :
 # Binary Search REQUIRES a SORTED list
@@ -275,6 +272,10 @@ def test_binary_search_consistent_arrays(binarySearchFunction, search_dictionary
     return counter_results
 
 if __name__ == '__main__':
+    import pandas as pd
+    import seaborn as sns
+    import matplotlib.pyplot as plt
+
     # Searches for a known existing item in multiple arrays
     array_length = 10000
     number_to_search = 1000
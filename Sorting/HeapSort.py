@@ -1,9 +1,6 @@
 from DataStructures.MinHeap import MinHeap
 import HelperClasses.GenerateArrays as genArrays
 import time
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 
 
 def HeapSort(array):
@@ -30,6 +27,9 @@ def HeapSort(array):
     return sorted_array, minheap.swap_count
 
 if __name__ == '__main__':
+    import pandas as pd
+    import seaborn as sns
+    import matplotlib.pyplot as plt
 
     number_to_sort = 20
     starting_size = 2
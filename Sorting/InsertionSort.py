@@ -1,8 +1,5 @@
 from statistics import mean
 import HelperClasses.GenerateArrays as genArrays
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 
 def insertionSort(array):
     '''
@@ -150,6 +147,10 @@ def test_insertion_sort(array_length = 20, number_to_sort = 10):
     return iteration_counts
 
 if __name__ == '__main__':
+    import pandas as pd
+    import seaborn as sns
+    import matplotlib.pyplot as plt
+
     array_length = 20
     number_to_sort = 1000
     iteration_counts = test_insertion_sort(array_length, number_to_sort)
@@ -1,8 +1,5 @@
 # helper function to swap the elements at two positions in the list
 from HelperClasses import GenerateArrays
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 
 class MergeSort():
     def __init__(self, array):
@@ -206,6 +203,10 @@ class MergeSort():
             self.recursive_merge_sort_helper(array, 0, len(array)-1, local_depth)
 
 if __name__ == '__main__':
+    import pandas as pd
+    import seaborn as sns
+    import matplotlib.pyplot as plt
+
     initial_array_length = 2
     array_length_multiplier = 2
     number_to_sort = 20
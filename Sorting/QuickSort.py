@@ -1,7 +1,4 @@
 import time
-import pandas as pd
-import seaborn as sns
-from matplotlib import pyplot as plt
 from HelperClasses import GenerateArrays
 
 class QuickSort():
@@ -108,6 +105,10 @@ class QuickSort():
 
 
 if __name__ == '__main__':
+    import pandas as pd
+    import seaborn as sns
+    from matplotlib import pyplot as plt
+
     initial_array_length = 2
     array_length_multiplier = 2
     number_to_sort = 25